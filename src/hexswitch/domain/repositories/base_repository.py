@@ -1,7 +1,7 @@
 """Base repository port and implementation for hexagonal architecture."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -96,6 +96,28 @@ class BaseRepository(BaseRepositoryPort[T], Generic[T]):
         self._storage[entity_id] = entity
         return entity
 
+    def save_many(self, entities: Iterable[T]) -> List[T]:
+        """Save multiple entities to repository in one batch.
+
+        All entities are validated before storage is touched, so a missing
+        'id' leaves the repository unchanged.
+
+        Args:
+            entities: Entities to save.
+
+        Returns:
+            List of saved entities.
+        """
+        batch: Dict[str, T] = {}
+        for entity in entities:
+            entity_id = getattr(entity, 'id', None)
+            if entity_id is None:
+                raise ValueError("Entity must have an 'id' attribute")
+            batch[entity_id] = entity
+
+        self._storage.update(batch)
+        return list(batch.values())
+
     def find_by_id(self, entity_id: str) -> Optional[T]:
         """Find entity by ID.
 
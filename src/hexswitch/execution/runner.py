@@ -102,27 +102,39 @@ class AsyncAdapterRunner(AdapterRunner):
 
 
 class BlockingAdapterRunner(AdapterRunner):
-    """Runner for blocking adapters using thread pool executor."""
+    """Runner for blocking adapters using a thread pool executor."""
 
     def __init__(self, executor: ThreadPoolExecutor | None = None):
         """Initialize blocking runner.
 
         Args:
-            executor: Thread pool executor to use (default: creates new one)
+            executor: Thread pool executor to use (default: the event loop's
+                shared default executor via asyncio.to_thread)
         """
-        self.executor = executor or ThreadPoolExecutor(max_workers=10)
+        self.executor = executor
         self._futures: list[Any] = []
 
+    def _run_blocking(self, func: Callable[[], Any]) -> asyncio.Future:
+        """Schedule a blocking call off the event loop.
+
+        Args:
+            func: Blocking callable to run
+
+        Returns:
+            Future resolving to the callable's result
+        """
+        if self.executor is None:
+            return asyncio.ensure_future(asyncio.to_thread(func))
+        return asyncio.get_running_loop().run_in_executor(self.executor, func)
+
     async def start(self, adapter: Any) -> None:
         """Start blocking adapter in thread pool.
 
         Args:
             adapter: Adapter instance with blocking start method
         """
-        loop = asyncio.get_event_loop()
-        # Run adapter.start() in executor (non-blocking for event loop)
         # Note: adapter.start() may start threads/servers that run in background
-        future = loop.run_in_executor(self.executor, adapter.start)
+        future = self._run_blocking(adapter.start)
         self._futures.append(future)
         # Wait for start to complete (adapter.start() should return quickly
         # after starting background threads/servers)
@@ -139,15 +151,16 @@ class BlockingAdapterRunner(AdapterRunner):
             await asyncio.gather(*self._futures, return_exceptions=True)
 
         # Stop adapter
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(self.executor, adapter.stop)
+        await self._run_blocking(adapter.stop)
 
     def shutdown(self, wait: bool = True) -> None:
         """Shutdown executor.
 
+        The loop's default executor is owned by the event loop, so this is a
+        no-op unless a custom executor was passed in.
+
         Args:
             wait: Whether to wait for pending tasks
         """
-        self.executor.shutdown(wait=wait)
-
-
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait)
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
 from hexswitch.pipeline.pipeline import PipelineContext
 from hexswitch.shared.envelope import Envelope
 
 logger = logging.getLogger(__name__)
 
+_Next = Callable[[PipelineContext], Awaitable[PipelineContext]]
+
 
 class BackpressureMiddleware:
     """Middleware that enforces backpressure limits."""
@@ -22,23 +24,54 @@ class BackpressureMiddleware:
             policy: Backpressure policy configuration
         """
         self.policy = policy or {}
-        self.enabled = self.policy.get("enabled", False)
         self.max_concurrent = self.policy.get("max_concurrent", 10)
         self.queue_size = self.policy.get("queue_size", 100)
-        self.rejection_strategy = self.policy.get("rejection_strategy", "fail_fast")
+        self._enabled: bool = self.policy.get("enabled", False)
+        self._rejection_strategy: str = self.policy.get("rejection_strategy", "fail_fast")
 
         # Semaphore for concurrent requests
         self._semaphore: asyncio.Semaphore | None = None
         # Queue for queuing strategy
         self._queue: asyncio.Queue | None = None
-
-        if self.enabled:
+        self._impl: Callable[[PipelineContext, _Next], Awaitable[PipelineContext]]
+        self._configure()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether backpressure is enforced."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        self._configure()
+
+    @property
+    def rejection_strategy(self) -> str:
+        """Strategy applied when the concurrency limit is reached."""
+        return self._rejection_strategy
+
+    @rejection_strategy.setter
+    def rejection_strategy(self, value: str) -> None:
+        self._rejection_strategy = value
+        self._configure()
+
+    def _configure(self) -> None:
+        """Create the limiting primitives and bind the strategy runner.
+
+        Called on construction and whenever ``enabled`` or
+        ``rejection_strategy`` changes, so each request is a single call.
+        """
+        self._semaphore = None
+        self._queue = None
+        if self._enabled:
             self._semaphore = asyncio.Semaphore(self.max_concurrent)
-            if self.rejection_strategy == "queue":
+            if self._rejection_strategy == "queue":
                 self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._impl = self._select_impl()
 
     async def __call__(
-        self, ctx: PipelineContext, next: Callable[[PipelineContext], "Any"]
+        self, ctx: PipelineContext, next: _Next
     ) -> PipelineContext:
         """Execute middleware with backpressure control.
 
@@ -49,59 +82,94 @@ class BackpressureMiddleware:
         Returns:
             Updated context
         """
-        if not self.enabled or not self._semaphore:
-            return await next(ctx)
+        return await self._impl(ctx, next)
 
-        # Check if we can accept the request
-        if self.rejection_strategy == "fail_fast":
-            # Try to acquire semaphore immediately
-            if not self._semaphore.locked() or self._semaphore._value > 0:
-                async with self._semaphore:
-                    return await next(ctx)
-            else:
-                # Reject immediately
-                logger.warning(
-                    f"Backpressure limit reached, rejecting request for {ctx.port_name or 'unknown'}"
-                )
-                ctx.envelope = Envelope.error(503, "Service temporarily unavailable (backpressure)")
-                ctx.metadata["backpressure_rejected"] = True
-                return ctx
-
-        elif self.rejection_strategy == "queue":
-            # Queue the request
-            if self._queue and self._queue.full():
-                logger.warning(
-                    f"Backpressure queue full, rejecting request for {ctx.port_name or 'unknown'}"
-                )
-                ctx.envelope = Envelope.error(503, "Service temporarily unavailable (queue full)")
-                ctx.metadata["backpressure_rejected"] = True
-                return ctx
-
-            # Add to queue and process
-            await self._queue.put(ctx)
-            async with self._semaphore:
-                try:
-                    queued_ctx = await self._queue.get()
-                    return await next(queued_ctx)
-                finally:
-                    self._queue.task_done()
-
-        elif self.rejection_strategy == "drop":
-            # Drop silently if limit reached
-            if self._semaphore._value == 0:
-                logger.debug(
-                    f"Backpressure limit reached, dropping request for {ctx.port_name or 'unknown'}"
-                )
-                ctx.envelope = Envelope.error(503, "Service temporarily unavailable")
-                ctx.metadata["backpressure_dropped"] = True
-                return ctx
-
-            async with self._semaphore:
-                return await next(ctx)
+    def _select_impl(self) -> Callable[[PipelineContext, _Next], Awaitable[PipelineContext]]:
+        """Pick the strategy runner for this configuration.
+
+        Returns:
+            Coroutine function handling a single request.
+        """
+        if not self._enabled:
+            return self._run_passthrough
+        strategies = {
+            "fail_fast": self._run_fail_fast,
+            "queue": self._run_queue,
+            "drop": self._run_drop,
+        }
+        return strategies.get(self._rejection_strategy, self._run_unknown)
+
+    async def _run_passthrough(
+        self, ctx: PipelineContext, next: _Next
+    ) -> PipelineContext:
+        """Execute the next middleware without backpressure control."""
+        return await next(ctx)
 
-        else:
-            # Unknown strategy, just execute
-            logger.warning(f"Unknown backpressure strategy: {self.rejection_strategy}")
+    async def _run_fail_fast(
+        self, ctx: PipelineContext, next: _Next
+    ) -> PipelineContext:
+        """Reject the request immediately if the concurrency limit is reached."""
+        semaphore = self._semaphore
+        if semaphore is None:
             return await next(ctx)
+        # Try to acquire semaphore immediately
+        if not semaphore.locked() or semaphore._value > 0:
+            async with semaphore:
+                return await next(ctx)
 
+        # Reject immediately
+        logger.warning(
+            f"Backpressure limit reached, rejecting request for {ctx.port_name or 'unknown'}"
+        )
+        ctx.envelope = Envelope.error(503, "Service temporarily unavailable (backpressure)")
+        ctx.metadata["backpressure_rejected"] = True
+        return ctx
 
+    async def _run_queue(
+        self, ctx: PipelineContext, next: _Next
+    ) -> PipelineContext:
+        """Queue the request, rejecting it only when the queue is full."""
+        semaphore, queue = self._semaphore, self._queue
+        if semaphore is None or queue is None:
+            return await next(ctx)
+        if queue.full():
+            logger.warning(
+                f"Backpressure queue full, rejecting request for {ctx.port_name or 'unknown'}"
+            )
+            ctx.envelope = Envelope.error(503, "Service temporarily unavailable (queue full)")
+            ctx.metadata["backpressure_rejected"] = True
+            return ctx
+
+        # Add to queue and process
+        await queue.put(ctx)
+        async with semaphore:
+            try:
+                queued_ctx = await queue.get()
+                return await next(queued_ctx)
+            finally:
+                queue.task_done()
+
+    async def _run_drop(
+        self, ctx: PipelineContext, next: _Next
+    ) -> PipelineContext:
+        """Drop the request silently if the concurrency limit is reached."""
+        semaphore = self._semaphore
+        if semaphore is None:
+            return await next(ctx)
+        if semaphore._value == 0:
+            logger.debug(
+                f"Backpressure limit reached, dropping request for {ctx.port_name or 'unknown'}"
+            )
+            ctx.envelope = Envelope.error(503, "Service temporarily unavailable")
+            ctx.metadata["backpressure_dropped"] = True
+            return ctx
+
+        async with semaphore:
+            return await next(ctx)
+
+    async def _run_unknown(
+        self, ctx: PipelineContext, next: _Next
+    ) -> PipelineContext:
+        """Execute the next middleware for an unknown strategy."""
+        logger.warning(f"Unknown backpressure strategy: {self._rejection_strategy}")
+        return await next(ctx)
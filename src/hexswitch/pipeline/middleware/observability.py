@@ -6,18 +6,30 @@ import logging
 from typing import Any, Callable
 
 from hexswitch.pipeline.pipeline import PipelineContext
-from hexswitch.shared.observability import get_global_metrics_collector, get_global_tracer, start_span
+from hexswitch.shared.observability import MetricsCollector, Tracer, get_global_metrics_collector, get_global_tracer
 
 logger = logging.getLogger(__name__)
 
 
 class ObservabilityMiddleware:
-    """Middleware that adds observability (spans, metrics, logs)."""
+    """Middleware that adds observability (spans, metrics, logs).
 
-    def __init__(self):
-        """Initialize observability middleware."""
-        self._tracer = get_global_tracer()
-        self._metrics = get_global_metrics_collector()
+    Spans returned by a custom tracer need ``trace_id``, ``span_id`` and
+    ``finish()``. If they also provide ``attach()`` returning a token and
+    ``detach(token)``, like :class:`~hexswitch.shared.observability.Span`, the
+    span is made current while the rest of the chain runs.
+    """
+
+    def __init__(self, tracer: Tracer | None = None, metrics: MetricsCollector | None = None):
+        """Initialize observability middleware.
+
+        Args:
+            tracer: Tracer used to start spans. Defaults to the global tracer.
+            metrics: Collector used to record stage metrics. Defaults to the
+                global metrics collector.
+        """
+        self._tracer = tracer if tracer is not None else get_global_tracer()
+        self._metrics = metrics if metrics is not None else get_global_metrics_collector()
 
     async def __call__(
         self, ctx: PipelineContext, next: Callable[[PipelineContext], "Any"]
@@ -52,7 +64,7 @@ class ObservabilityMiddleware:
                 pass
 
         # Start span (trace_id is handled automatically by the tracer)
-        span = start_span(
+        span = self._tracer.start_span(
             span_name,
             parent=parent_span,
             tags={"port": ctx.port_name or "unknown", "stage": ctx.stage},
@@ -68,6 +80,9 @@ class ObservabilityMiddleware:
         # Record start metrics
         self._record_start_metrics(ctx)
 
+        # Make the span current while the rest of the chain runs, if it supports that
+        attach = getattr(span, "attach", None)
+        token = attach() if attach is not None else None
         try:
             # Call next middleware
             ctx = await next(ctx)
@@ -90,7 +105,9 @@ class ObservabilityMiddleware:
             raise
 
         finally:
-            # Finish span
+            # Restore the previous current span, then finish this one
+            if token is not None:
+                span.detach(token)
             span.finish()
 
     def _record_start_metrics(self, ctx: PipelineContext) -> None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from typing import Any, Callable
 
 from hexswitch.pipeline.pipeline import PipelineContext
@@ -30,6 +31,26 @@ class RetryMiddleware:
             "retryable_errors", ["500", "502", "503", "504", "timeout"]
         )
 
+        # Precompute matchers so each retry decision is a set lookup plus one regex scan
+        self._retryable_statuses = frozenset(self.retryable_errors)
+        self._retryable_pattern = (
+            re.compile("|".join(re.escape(error.lower()) for error in self.retryable_errors))
+            if self.retryable_errors
+            else None
+        )
+
+    def _matches_retryable(self, message: str) -> bool:
+        """Check if a message contains any retryable error token.
+
+        Args:
+            message: Error message or exception text
+
+        Returns:
+            True if any token occurs in the message (case-insensitive)
+        """
+        pattern = self._retryable_pattern
+        return pattern is not None and pattern.search(message.lower()) is not None
+
     def _is_retryable(self, ctx: PipelineContext) -> bool:
         """Check if error is retryable.
 
@@ -42,19 +63,10 @@ class RetryMiddleware:
         if not ctx.envelope.error_message:
             return False
 
-        status_code = ctx.envelope.status_code
-        error_message = ctx.envelope.error_message.lower()
-
-        # Check status code
-        if str(status_code) in self.retryable_errors:
+        # Check status code, then error message
+        if str(ctx.envelope.status_code) in self._retryable_statuses:
             return True
-
-        # Check error message
-        for retryable in self.retryable_errors:
-            if retryable.lower() in error_message:
-                return True
-
-        return False
+        return self._matches_retryable(ctx.envelope.error_message)
 
     async def __call__(
         self, ctx: PipelineContext, next: Callable[[PipelineContext], "Any"]
@@ -117,12 +129,7 @@ class RetryMiddleware:
                     raise
 
                 # Check if exception is retryable
-                error_str = str(e).lower()
-                is_retryable = any(
-                    retryable.lower() in error_str for retryable in self.retryable_errors
-                )
-
-                if not is_retryable:
+                if not self._matches_retryable(str(e)):
                     logger.debug(f"Exception not retryable: {e}")
                     raise
 
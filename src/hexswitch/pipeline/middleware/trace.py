@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any, Callable
 
 from hexswitch.pipeline.pipeline import PipelineContext
 
 logger = logging.getLogger(__name__)
 
+# W3C traceparent: version-trace_id-span_id-flags, all lowercase hex
+_match_traceparent = re.compile(r"([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})").fullmatch
+
 
 def parse_traceparent(traceparent: str) -> tuple[str, str, str | None]:
     """Parse W3C traceparent header.
@@ -23,19 +27,19 @@ def parse_traceparent(traceparent: str) -> tuple[str, str, str | None]:
 
     Returns:
         Tuple of (trace_id, span_id, parent_span_id)
+
+    Raises:
+        ValueError: If the header is not four dash-separated hex fields of
+            the lengths above.
     """
-    parts = traceparent.split("-")
-    if len(parts) != 4:
+    match = _match_traceparent(traceparent)
+    if match is None:
         raise ValueError(f"Invalid traceparent format: {traceparent}")
 
-    version = parts[0]
+    version, trace_id, span_id, _flags = match.groups()
     if version != "00":
         logger.warning(f"Unsupported traceparent version: {version}")
 
-    trace_id = parts[1]
-    span_id = parts[2]
-    parts[3]
-
     # For now, parent_span_id is None (could be extracted from flags or other headers)
     parent_span_id = None
 
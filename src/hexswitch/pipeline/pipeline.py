@@ -6,14 +6,14 @@ import asyncio
 from dataclasses import dataclass, field
 import inspect
 import logging
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable, Iterable
 
 from hexswitch.shared.envelope import Envelope
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineContext:
     """Context passed through pipeline stages."""
 
@@ -33,9 +33,27 @@ class Pipeline:
             runtime: Runtime instance (for accessing registries, handlers, etc.)
         """
         self.runtime = runtime
-        self.middleware_stack: list[Callable] = []
+        self._middleware_stack: list[Callable] = []
+        self._chain: Callable[[PipelineContext], Awaitable[PipelineContext]] = self._run_stages
         self._concurrency_gates: dict[str, asyncio.Semaphore] = {}
         self._port_policies: dict[str, dict[str, Any]] = {}
+        # Port-specific middleware runs inside the shared stack; chains are composed once per port
+        self._port_middleware: dict[str, tuple[Callable, ...]] = {}
+        self._port_chains: dict[str, Callable[[PipelineContext], Awaitable[PipelineContext]]] = {}
+
+    @property
+    def middleware_stack(self) -> tuple[Callable, ...]:
+        """Middleware in execution order; the first entry is the outermost.
+
+        Change the stack through ``add_middleware`` or by assigning a new
+        sequence, so the composed chains are rebuilt.
+        """
+        return tuple(self._middleware_stack)
+
+    @middleware_stack.setter
+    def middleware_stack(self, stack: Iterable[Callable]) -> None:
+        self._middleware_stack = list(stack)
+        self._recompose()
 
     def add_middleware(self, middleware: Callable) -> None:
         """Add middleware to the stack.
@@ -43,7 +61,63 @@ class Pipeline:
         Args:
             middleware: Middleware callable (async function that takes ctx and next)
         """
-        self.middleware_stack.append(middleware)
+        self._middleware_stack.append(middleware)
+        self._recompose()
+
+    def set_port_middleware(self, port_name: str, middleware: Iterable[Callable]) -> None:
+        """Set middleware that only runs for envelopes addressed to a port.
+
+        It runs inside the shared stack, in the given order. The port's chain
+        is composed here, not on every request.
+
+        Args:
+            port_name: Port name
+            middleware: Middleware callables, outermost first
+        """
+        self._port_middleware[port_name] = tuple(middleware)
+        self._port_chains[port_name] = self._compose((*self._middleware_stack, *self._port_middleware[port_name]))
+
+    def get_port_middleware(self, port_name: str) -> tuple[Callable, ...] | None:
+        """Get the port-specific middleware of a port.
+
+        Args:
+            port_name: Port name
+
+        Returns:
+            Middleware set for the port, or None if none was set
+        """
+        return self._port_middleware.get(port_name)
+
+    def _recompose(self) -> None:
+        """Rebuild the shared chain and every port chain after the stack changed."""
+        self._chain = self._compose(self._middleware_stack)
+        for port_name, middleware in self._port_middleware.items():
+            self._port_chains[port_name] = self._compose((*self._middleware_stack, *middleware))
+
+    def _compose(self, stack: Iterable[Callable]) -> Callable[[PipelineContext], Awaitable[PipelineContext]]:
+        """Compose middleware around the pipeline stages.
+
+        Chains are built when the middleware changes, not on every request.
+
+        Args:
+            stack: Middleware in execution order, outermost first
+
+        Returns:
+            Coroutine function running the whole middleware chain
+        """
+
+        def wrap(
+            middleware: Callable[..., Awaitable[PipelineContext]], next_handler: Callable
+        ) -> Callable[[PipelineContext], Awaitable[PipelineContext]]:
+            async def wrapper(ctx: PipelineContext) -> PipelineContext:
+                return await middleware(ctx, next_handler)
+
+            return wrapper
+
+        handler: Callable[[PipelineContext], Awaitable[PipelineContext]] = self._run_stages
+        for middleware in reversed(tuple(stack)):
+            handler = wrap(middleware, handler)
+        return handler
 
     def set_port_policy(self, port_name: str, policy: dict[str, Any]) -> None:
         """Set policy for a specific port.
@@ -53,6 +127,9 @@ class Pipeline:
             policy: Policy configuration dictionary
         """
         self._port_policies[port_name] = policy
+        # Middleware built from the previous policy no longer applies
+        self._port_middleware.pop(port_name, None)
+        self._port_chains.pop(port_name, None)
 
     def get_port_policy(self, port_name: str | None) -> dict[str, Any]:
         """Get policy for a specific port.
@@ -77,59 +154,57 @@ class Pipeline:
             Processed envelope
         """
         ctx = PipelineContext(envelope=envelope, stage="ingress")
+        chain = self._chain
+        if self._port_chains and envelope.metadata:
+            port_name = envelope.metadata.get("port_name")
+            if port_name:
+                chain = self._port_chains.get(port_name, chain)
 
-        # Create middleware chain
-        async def final_handler(ctx: PipelineContext) -> PipelineContext:
-            """Final handler that executes pipeline stages."""
-            # Stage 1: Normalize/Enrich
-            ctx = await self._normalize(ctx)
-
-            # Stage 2: Telemetry span start
-            ctx = await self._start_telemetry(ctx)
+        try:
+            # Execute middleware chain
+            ctx = await chain(ctx)
+            return ctx.envelope
 
-            # Stage 3: Validation
-            ctx = await self._validate(ctx)
+        except Exception as e:
+            logger.exception(f"Pipeline error in stage '{ctx.stage}': {e}")
+            ctx.metadata["exception"] = e
+            ctx = await self._map_errors(ctx)
+            return ctx.envelope
 
-            # Stage 4: Inbound routing
-            ctx = await self._route_inbound(ctx)
+    async def _run_stages(self, ctx: PipelineContext) -> PipelineContext:
+        """Run the pipeline stages; the innermost link of the middleware chain.
 
-            # Stage 5: Execute handler (with concurrency gates)
-            ctx = await self._execute_handler(ctx)
+        Args:
+            ctx: Pipeline context
 
-            # Stage 6: Error mapping
-            ctx = await self._map_errors(ctx)
+        Returns:
+            Updated context
+        """
+        # Stage 1: Normalize/Enrich
+        ctx = await self._normalize(ctx)
 
-            # Stage 7: Outbound routing (if needed)
-            ctx = await self._route_outbound(ctx)
+        # Stage 2: Telemetry span start
+        ctx = await self._start_telemetry(ctx)
 
-            # Stage 8: Finish telemetry
-            ctx = await self._finish_telemetry(ctx)
+        # Stage 3: Validation
+        ctx = await self._validate(ctx)
 
-            return ctx
+        # Stage 4: Inbound routing
+        ctx = await self._route_inbound(ctx)
 
-        # Build middleware chain (execute in reverse order)
-        handler = final_handler
-        for middleware in reversed(self.middleware_stack):
-            # Capture current handler in closure
-            next_handler = handler
+        # Stage 5: Execute handler (with concurrency gates)
+        ctx = await self._execute_handler(ctx)
 
-            def create_middleware_wrapper(mw, next_h):
-                async def wrapper(ctx: PipelineContext) -> PipelineContext:
-                    return await mw(ctx, next_h)
-                return wrapper
+        # Stage 6: Error mapping
+        ctx = await self._map_errors(ctx)
 
-            handler = create_middleware_wrapper(middleware, next_handler)
+        # Stage 7: Outbound routing (if needed)
+        ctx = await self._route_outbound(ctx)
 
-        try:
-            # Execute middleware chain
-            ctx = await handler(ctx)
-            return ctx.envelope
+        # Stage 8: Finish telemetry
+        ctx = await self._finish_telemetry(ctx)
 
-        except Exception as e:
-            logger.exception(f"Pipeline error in stage '{ctx.stage}': {e}")
-            ctx.metadata["exception"] = e
-            ctx = await self._map_errors(ctx)
-            return ctx.envelope
+        return ctx
 
     async def _normalize(self, ctx: PipelineContext) -> PipelineContext:
         """Normalize and enrich envelope.
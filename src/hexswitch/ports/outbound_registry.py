@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 import threading
 from typing import Callable
 
@@ -42,6 +43,8 @@ class OutboundPortRegistry:
     """Registry for managing outbound ports and their factories.
 
     Thread-safe registry that stores outbound ports with their factory functions.
+    Writers serialize on a lock; lookups read the dict without it, since single
+    dict operations are atomic.
     """
 
     def __init__(self):
@@ -56,6 +59,8 @@ class OutboundPortRegistry:
             port_name: Port name
             factory: Factory function that creates envelopes from args/kwargs
         """
+        # Interned keys let lookups with the same name match by identity
+        port_name = sys.intern(port_name)
         with self._lock:
             if port_name in self._ports:
                 logger.warning(f"Outbound port '{port_name}' already registered, overwriting")
@@ -71,8 +76,7 @@ class OutboundPortRegistry:
         Returns:
             OutboundPort instance or None if not found
         """
-        with self._lock:
-            return self._ports.get(port_name)
+        return self._ports.get(port_name)
 
     def list_ports(self) -> list[str]:
         """List all registered outbound port names.
@@ -80,8 +84,7 @@ class OutboundPortRegistry:
         Returns:
             List of port names
         """
-        with self._lock:
-            return list(self._ports.keys())
+        return list(self._ports)
 
     def remove_port(self, port_name: str) -> None:
         """Remove outbound port from registry.
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:
+    from hexswitch.ports.strategies import RoutingStrategy
 
 
-@dataclass
 class Port:
     """Port represents a named connection point between adapters and handlers.
 
@@ -14,15 +15,41 @@ class Port:
     This Port implementation supports n:m multiplexing (multiple adapters can
     write to the same port, multiple handlers can read from it).
     """
-    name: str
-    handlers: list[Callable] = field(default_factory=list)
-    routing_strategy: 'RoutingStrategy | None' = None  # type: ignore
 
-    def __post_init__(self):
-        """Initialize default routing strategy if not provided."""
-        if self.routing_strategy is None:
+    __slots__ = ("name", "routing_strategy", "_handlers")
+
+    def __init__(
+        self,
+        name: str,
+        handlers: Iterable[Callable] = (),
+        routing_strategy: RoutingStrategy | None = None,
+    ):
+        """Initialize port.
+
+        Args:
+            name: Port name.
+            handlers: Initial handler functions, in routing order.
+            routing_strategy: Strategy for routing envelopes (default: FirstStrategy).
+        """
+        self.name = name
+        self._handlers: tuple[Callable, ...] = tuple(handlers)
+        if routing_strategy is None:
             from hexswitch.ports.strategies import FirstStrategy
-            self.routing_strategy = FirstStrategy()
+            routing_strategy = FirstStrategy()
+        self.routing_strategy: RoutingStrategy = routing_strategy
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the port."""
+        return f"Port(name={self.name!r}, handlers={self._handlers!r}, routing_strategy={self.routing_strategy!r})"
+
+    @property
+    def handlers(self) -> tuple[Callable, ...]:
+        """Registered handlers, in routing order.
+
+        Read-only; change them through ``add_handler``, ``set_handlers`` or
+        ``clear_handlers``.
+        """
+        return self._handlers
 
     def route(self, envelope) -> list:
         """Route envelope to handlers using the configured strategy.
@@ -36,11 +63,12 @@ class Port:
         Raises:
             PortError: If no handlers are registered.
         """
-        if not self.handlers:
+        handlers = self._handlers
+        if not handlers:
             from hexswitch.ports.exceptions import NoHandlersError
             raise NoHandlersError(f"Port '{self.name}' has no handlers")
 
-        return self.routing_strategy.route(envelope, self.handlers)
+        return self.routing_strategy.route(envelope, handlers)
 
     def add_handler(self, handler: Callable) -> None:
         """Register a handler to this port.
@@ -48,4 +76,16 @@ class Port:
         Args:
             handler: Handler function (Envelope -> Envelope).
         """
-        self.handlers.append(handler)
+        self._handlers = (*self._handlers, handler)
+
+    def set_handlers(self, handlers: Iterable[Callable]) -> None:
+        """Replace all handlers of this port.
+
+        Args:
+            handlers: Handler functions (Envelope -> Envelope), in routing order.
+        """
+        self._handlers = tuple(handlers)
+
+    def clear_handlers(self) -> None:
+        """Remove all handlers from this port."""
+        self._handlers = ()
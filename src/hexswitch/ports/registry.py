@@ -177,10 +177,14 @@ def get_port_registry() -> PortRegistry:
         Global PortRegistry instance.
     """
     global _global_registry
-    with _registry_lock:
-        if _global_registry is None:
-            _global_registry = PortRegistry()
-        return _global_registry
+    # Fast path: once created, the registry is returned without taking the lock
+    registry = _global_registry
+    if registry is None:
+        with _registry_lock:
+            if _global_registry is None:
+                _global_registry = PortRegistry()
+            registry = _global_registry
+    return registry
 
 
 def reset_port_registry() -> None:
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 import logging
-from typing import Callable
+from typing import Callable, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +11,7 @@ class RoutingStrategy(ABC):
     """Abstract base for routing strategies."""
 
     @abstractmethod
-    def route(self, envelope, handlers: list[Callable]) -> list:
+    def route(self, envelope, handlers: Sequence[Callable]) -> list:
         """Route envelope to handlers.
 
         Args:
@@ -27,7 +27,7 @@ class RoutingStrategy(ABC):
 class FirstStrategy(RoutingStrategy):
     """Route to first handler only."""
 
-    def route(self, envelope, handlers: list[Callable]) -> list:
+    def route(self, envelope, handlers: Sequence[Callable]) -> list:
         """Call only the first handler.
 
         Args:
@@ -44,7 +44,7 @@ class FirstStrategy(RoutingStrategy):
 class BroadcastStrategy(RoutingStrategy):
     """Route to all handlers, collect all results including errors."""
 
-    def route(self, envelope, handlers: list[Callable]) -> list:
+    def route(self, envelope, handlers: Sequence[Callable]) -> list:
         """Call all handlers and collect results.
 
         Errors are caught and converted to error envelopes.
@@ -59,15 +59,14 @@ class BroadcastStrategy(RoutingStrategy):
         # Import here to avoid circular dependency
         from hexswitch.shared.envelope import Envelope
 
-        results = []
+        results: list = []
+        append = results.append
         for handler in handlers:
             try:
-                result = handler(envelope)
-                results.append(result)
+                append(handler(envelope))
             except Exception as e:
                 logger.error(f"Handler {handler.__name__} failed: {e}", exc_info=True)
-                error_envelope = Envelope.error(500, f"Handler error: {str(e)}")
-                results.append(error_envelope)
+                append(Envelope.error(500, f"Handler error: {str(e)}"))
         return results
 
 
@@ -77,7 +76,7 @@ class RoundRobinStrategy(RoutingStrategy):
     def __init__(self):
         self._index = 0
 
-    def route(self, envelope, handlers: list[Callable]) -> list:
+    def route(self, envelope, handlers: Sequence[Callable]) -> list:
         """Call next handler in round-robin order.
 
         Args:
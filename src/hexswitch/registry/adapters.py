@@ -1,5 +1,7 @@
 """Adapter registry for managing adapter instances and metadata."""
 
+from dataclasses import dataclass, field
+import sys
 import threading
 from typing import Any
 
@@ -40,16 +42,53 @@ ADAPTER_METADATA = {
 }
 
 
+_INBOUND_DIRECTIONS = ("both", "inbound")
+_OUTBOUND_DIRECTIONS = ("both", "outbound")
+
+
+@dataclass(frozen=True, slots=True)
+class _RegistrySnapshot:
+    """Immutable view of the registry contents published to readers."""
+
+    adapters: dict[str, InboundAdapter | OutboundAdapter] = field(default_factory=dict)
+    metadata: dict[str, dict[str, Any]] = field(default_factory=dict)
+    inbound: tuple[str, ...] = ()
+    outbound: tuple[str, ...] = ()
+
+
+def _build_snapshot(
+    adapters: dict[str, InboundAdapter | OutboundAdapter], metadata: dict[str, dict[str, Any]]
+) -> _RegistrySnapshot:
+    """Build a snapshot, indexing adapter names by direction.
+
+    Args:
+        adapters: New adapter mapping (owned by the snapshot from now on)
+        metadata: New metadata mapping (owned by the snapshot from now on)
+
+    Returns:
+        Snapshot ready to publish
+    """
+    return _RegistrySnapshot(
+        adapters=adapters,
+        metadata=metadata,
+        inbound=tuple(name for name, meta in metadata.items() if meta.get("direction") in _INBOUND_DIRECTIONS),
+        outbound=tuple(name for name, meta in metadata.items() if meta.get("direction") in _OUTBOUND_DIRECTIONS),
+    )
+
+
 class AdapterRegistry:
     """Registry for managing adapter instances and metadata.
 
     Thread-safe registry that stores adapter instances along with their metadata.
+    Adapters are registered at startup and looked up far more often, so writers
+    copy the contents under a lock and publish a new immutable snapshot, while
+    readers use the current snapshot without locking. Adapter names are indexed
+    by direction when a snapshot is built.
     """
 
     def __init__(self):
         """Initialize adapter registry."""
-        self._adapters: dict[str, InboundAdapter | OutboundAdapter] = {}
-        self._metadata: dict[str, dict[str, Any]] = {}
+        self._snapshot = _RegistrySnapshot()
         self._lock = threading.Lock()
 
     def register(
@@ -62,9 +101,13 @@ class AdapterRegistry:
             adapter: Adapter instance
             metadata: Adapter metadata (direction, protocol, capabilities, etc.)
         """
+        name = sys.intern(name)
         with self._lock:
-            self._adapters[name] = adapter
-            self._metadata[name] = metadata.copy()
+            snapshot = self._snapshot
+            self._snapshot = _build_snapshot(
+                {**snapshot.adapters, name: adapter},
+                {**snapshot.metadata, name: metadata.copy()},
+            )
 
     def get(self, name: str) -> InboundAdapter | OutboundAdapter | None:
         """Get adapter by name.
@@ -75,8 +118,7 @@ class AdapterRegistry:
         Returns:
             Adapter instance or None if not found
         """
-        with self._lock:
-            return self._adapters.get(name)
+        return self._snapshot.adapters.get(name)
 
     def get_metadata(self, name: str) -> dict[str, Any] | None:
         """Get adapter metadata by name.
@@ -87,8 +129,7 @@ class AdapterRegistry:
         Returns:
             Adapter metadata or None if not found
         """
-        with self._lock:
-            return self._metadata.get(name)
+        return self._snapshot.metadata.get(name)
 
     def list_inbound(self) -> list[str]:
         """List all inbound adapter names.
@@ -96,12 +137,7 @@ class AdapterRegistry:
         Returns:
             List of adapter names that support inbound direction
         """
-        with self._lock:
-            return [
-                name
-                for name, metadata in self._metadata.items()
-                if metadata.get("direction") in ("both", "inbound")
-            ]
+        return list(self._snapshot.inbound)
 
     def list_outbound(self) -> list[str]:
         """List all outbound adapter names.
@@ -109,12 +145,7 @@ class AdapterRegistry:
         Returns:
             List of adapter names that support outbound direction
         """
-        with self._lock:
-            return [
-                name
-                for name, metadata in self._metadata.items()
-                if metadata.get("direction") in ("both", "outbound")
-            ]
+        return list(self._snapshot.outbound)
 
     def list_all(self) -> list[str]:
         """List all registered adapter names.
@@ -122,8 +153,7 @@ class AdapterRegistry:
         Returns:
             List of all adapter names
         """
-        with self._lock:
-            return list(self._adapters.keys())
+        return list(self._snapshot.adapters)
 
     def remove(self, name: str) -> None:
         """Remove adapter from registry.
@@ -132,12 +162,16 @@ class AdapterRegistry:
             name: Adapter name
         """
         with self._lock:
-            self._adapters.pop(name, None)
-            self._metadata.pop(name, None)
+            snapshot = self._snapshot
+            if name not in snapshot.adapters:
+                return
+            adapters = dict(snapshot.adapters)
+            metadata = dict(snapshot.metadata)
+            del adapters[name]
+            metadata.pop(name, None)
+            self._snapshot = _build_snapshot(adapters, metadata)
 
     def clear(self) -> None:
         """Clear all adapters from registry."""
         with self._lock:
-            self._adapters.clear()
-            self._metadata.clear()
-
+            self._snapshot = _RegistrySnapshot()
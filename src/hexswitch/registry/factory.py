@@ -1,13 +1,53 @@
 """Adapter factory for creating adapters from import paths."""
 
+import functools
 import importlib
-from typing import Any
+from typing import Any, Callable
 
 from hexswitch.adapters.base import InboundAdapter, OutboundAdapter
 from hexswitch.adapters.exceptions import AdapterError
 from hexswitch.registry.adapters import ADAPTER_METADATA
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_adapter_class(impl_path: str) -> Callable[..., InboundAdapter | OutboundAdapter]:
+    """Import and validate the adapter class named by an import path.
+
+    Adapters are recreated on every start and reconfiguration, so resolved
+    classes are cached. Failures raise and are therefore not cached.
+
+    Args:
+        impl_path: Module path like "hexswitch.adapters.http:HttpAdapterServer"
+
+    Returns:
+        Adapter class
+
+    Raises:
+        AdapterError: If the path is malformed or does not name an adapter class
+        ImportError: If the module cannot be imported
+    """
+    module_path, class_name = impl_path.rsplit(":", 1)
+    if not module_path or not class_name:
+        raise AdapterError(
+            f"Invalid adapter path format: {impl_path}. Module path and class name must not be empty."
+        )
+
+    # Import module
+    module = importlib.import_module(module_path)
+
+    # Get adapter class
+    if not hasattr(module, class_name):
+        raise AdapterError(f"Module '{module_path}' does not have class '{class_name}'")
+
+    adapter_class = getattr(module, class_name)
+
+    # Verify it's an adapter class
+    if not issubclass(adapter_class, (InboundAdapter, OutboundAdapter)):
+        raise AdapterError(f"Class '{class_name}' is not an adapter (InboundAdapter or OutboundAdapter)")
+
+    return adapter_class
+
+
 class AdapterFactory:
     """Factory for creating adapter instances from import paths."""
 
@@ -95,30 +135,14 @@ class AdapterFactory:
             raise AdapterError(f"Invalid adapter path format: {impl_path}. Expected 'module.path:ClassName'")
 
         try:
-            module_path, class_name = impl_path.rsplit(":", 1)
-            if not module_path or not class_name:
-                raise AdapterError(
-                    f"Invalid adapter path format: {impl_path}. Module path and class name must not be empty."
-                )
-
-            # Import module
-            module = importlib.import_module(module_path)
-
-            # Get adapter class
-            if not hasattr(module, class_name):
-                raise AdapterError(f"Module '{module_path}' does not have class '{class_name}'")
-
-            adapter_class = getattr(module, class_name)
-
-            # Verify it's an adapter class
-            if not issubclass(adapter_class, (InboundAdapter, OutboundAdapter)):
-                raise AdapterError(f"Class '{class_name}' is not an adapter (InboundAdapter or OutboundAdapter)")
+            adapter_class = _resolve_adapter_class(impl_path)
 
             # Create adapter instance
             # Extract name from config or use default
             adapter_name = cfg.get("name", "")
             if not adapter_name:
                 # Try to infer name from class name
+                class_name = impl_path.rsplit(":", 1)[1]
                 adapter_name = class_name.lower().replace("adapter", "").replace("server", "").replace("client", "")
 
             return adapter_class(name=adapter_name, config=cfg)
@@ -1,7 +1,9 @@
 """Route registry for inbound and outbound route matching."""
 
 from dataclasses import dataclass
+import itertools
 import logging
+import sys
 import threading
 from typing import Any
 
@@ -10,7 +12,7 @@ from hexswitch.shared.envelope import Envelope
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundTarget:
     """Represents an outbound target (adapter + config)."""
 
@@ -32,13 +34,17 @@ class OutboundRouteRegistry:
     """Registry for outbound route matching and target selection.
 
     Thread-safe registry that stores outbound routes (port_name → targets).
+    Writers serialize on a lock; route lookups and target selection do not take
+    it, since single dict operations and ``next()`` on an ``itertools.count``
+    are atomic.
     """
 
     def __init__(self):
         """Initialize outbound route registry."""
         self._routes: dict[str, list[OutboundTarget]] = {}
         self._lock = threading.Lock()
-        self._round_robin_counters: dict[str, int] = {}  # For round-robin load balancing
+        # For round-robin load balancing
+        self._round_robin_counters: dict[str, itertools.count[int]] = {}
 
     def register_route(self, port_name: str, targets: list[OutboundTarget]) -> None:
         """Register outbound route.
@@ -47,9 +53,11 @@ class OutboundRouteRegistry:
             port_name: Port name
             targets: List of outbound targets
         """
+        # Store the interned name so equal lookup keys usually match by identity
+        port_name = sys.intern(port_name)
         with self._lock:
             self._routes[port_name] = targets.copy()
-            self._round_robin_counters[port_name] = 0
+            self._round_robin_counters[port_name] = itertools.count()
             logger.debug(f"Registered outbound route for port '{port_name}' with {len(targets)} targets")
 
     def match_route(self, port_name: str) -> list[OutboundTarget] | None:
@@ -61,8 +69,7 @@ class OutboundRouteRegistry:
         Returns:
             List of targets or None if route not found
         """
-        with self._lock:
-            return self._routes.get(port_name)
+        return self._routes.get(port_name)
 
     def select_target(self, port_name: str, envelope: Envelope) -> OutboundTarget:
         """Select target based on load balancing strategy.
@@ -87,19 +94,19 @@ class OutboundRouteRegistry:
         # Get load balancing strategy from first target (all should have same strategy)
         strategy = targets[0].load_balancing
 
-        with self._lock:
-            if strategy == "first":
-                return targets[0]
-            elif strategy == "round_robin":
-                counter = self._round_robin_counters.get(port_name, 0)
-                target = targets[counter % len(targets)]
-                self._round_robin_counters[port_name] = (counter + 1) % len(targets)
-                return target
-            elif strategy == "failover":
-                # For failover, always return first target (failover logic handled elsewhere)
+        if strategy == "first":
+            return targets[0]
+        elif strategy == "round_robin":
+            counter = self._round_robin_counters.get(port_name)
+            if counter is None:
+                # Route removed since it was matched
                 return targets[0]
-            else:
-                raise ValueError(f"Unknown load balancing strategy: {strategy}")
+            return targets[next(counter) % len(targets)]
+        elif strategy == "failover":
+            # For failover, always return first target (failover logic handled elsewhere)
+            return targets[0]
+        else:
+            raise ValueError(f"Unknown load balancing strategy: {strategy}")
 
     def list_routes(self) -> list[str]:
         """List all registered route port names.
@@ -2,7 +2,7 @@
 
 import asyncio
 import signal
-from typing import Any
+from typing import Any, Callable
 
 from hexswitch.adapters.base import InboundAdapter, OutboundAdapter
 from hexswitch.adapters.exceptions import AdapterError
@@ -45,6 +45,8 @@ class Runtime:
         self.config = config
         self.inbound_adapters: list[InboundAdapter] = []
         self.outbound_adapters: list[OutboundAdapter] = []
+        # Position of each name's first adapter in outbound_adapters; see _find_outbound()
+        self._outbound_positions: dict[str, int] = {}
         self._shutdown_requested = False
 
         # Initialize registries and factories
@@ -226,7 +228,7 @@ class Runtime:
                     )
                     # Start adapter using appropriate runner
                     await self._start_adapter(outbound_adapter)
-                    self.outbound_adapters.append(outbound_adapter)
+                    self.add_outbound_adapter(outbound_adapter)
                     duration = time.time() - start_time
                     self._adapter_start_duration.observe(duration)
                     self._adapter_start_counter.inc()
@@ -432,7 +434,7 @@ class Runtime:
                     port = port_registry.get_port(port_name)
                     if port:
                         # Remove all handlers from this port
-                        port.handlers.clear()
+                        port.clear_handlers()
                         # Remove the port itself
                         with port_registry._lock:
                             port_registry._ports.pop(port_name, None)
@@ -487,6 +489,42 @@ class Runtime:
             logger.warning(f"No route found for port '{port_name}'")
             return Envelope.error(404, f"No route found for port '{port_name}'")
 
+    def add_outbound_adapter(self, adapter: OutboundAdapter) -> None:
+        """Add a started outbound adapter and index it by name for delivery.
+
+        If several adapters share a name, the first one added receives deliveries.
+
+        Args:
+            adapter: Outbound adapter
+        """
+        self.outbound_adapters.append(adapter)
+        self._outbound_positions.setdefault(adapter.name, len(self.outbound_adapters) - 1)
+
+    def _find_outbound(self, name: str) -> OutboundAdapter | None:
+        """Find the first outbound adapter with a name.
+
+        ``outbound_adapters`` is public and may be changed without
+        ``add_outbound_adapter``, so the indexed position is only trusted if the
+        adapter found there still has the name; otherwise the index is rebuilt.
+
+        Args:
+            name: Adapter name
+
+        Returns:
+            Adapter with that name, or None if there is none
+        """
+        adapters = self.outbound_adapters
+        pos = self._outbound_positions.get(name)
+        if pos is not None and pos < len(adapters) and adapters[pos].name == name:
+            return adapters[pos]
+
+        positions: dict[str, int] = {}
+        for index, adapter in enumerate(adapters):
+            positions.setdefault(adapter.name, index)
+        self._outbound_positions = positions
+        pos = positions.get(name)
+        return adapters[pos] if pos is not None else None
+
     def deliver(self, envelope: Envelope, target_adapter_name: str) -> Envelope:
         """Deliver an envelope to a specific outbound adapter.
 
@@ -498,11 +536,7 @@ class Runtime:
             Response envelope
         """
         # Find adapter
-        adapter = None
-        for outbound_adapter in self.outbound_adapters:
-            if outbound_adapter.name == target_adapter_name:
-                adapter = outbound_adapter
-                break
+        adapter = self._find_outbound(target_adapter_name)
 
         if not adapter:
             logger.error(f"Outbound adapter '{target_adapter_name}' not found")
@@ -589,31 +623,31 @@ class Runtime:
         # Get port name from envelope metadata
         port_name = envelope.metadata.get("port_name")
 
-        # Add port-specific middleware if policies exist
-        port_policy = self.pipeline.get_port_policy(port_name)
-        if port_policy:
-            # Create temporary middleware stack with port-specific middleware
-            original_stack = self.pipeline.middleware_stack.copy()
+        # Build port-specific middleware once; the pipeline caches the composed chain
+        if port_name and self.pipeline.get_port_middleware(port_name) is None:
+            port_policy = self.pipeline.get_port_policy(port_name)
+            if port_policy:
+                self.pipeline.set_port_middleware(port_name, self._build_port_middleware(port_policy))
 
-            # Add port-specific middleware in order (will be reversed during execution)
-            if port_policy.get("backpressure"):
-                self.pipeline.add_middleware(
-                    BackpressureMiddleware(port_policy["backpressure"])
-                )
-            if port_policy.get("timeout"):
-                self.pipeline.add_middleware(TimeoutMiddleware(port_policy["timeout"]))
-            if port_policy.get("retry"):
-                self.pipeline.add_middleware(RetryMiddleware(port_policy["retry"]))
+        return await self.pipeline.process(envelope)
 
-            try:
-                result = await self.pipeline.process(envelope)
-            finally:
-                # Restore original middleware stack
-                self.pipeline.middleware_stack = original_stack
+    def _build_port_middleware(self, port_policy: dict[str, Any]) -> list[Callable]:
+        """Create the middleware enforcing a port's policies.
 
-            return result
+        Args:
+            port_policy: Policy configuration of the port
 
-        return await self.pipeline.process(envelope)
+        Returns:
+            Middleware in execution order, outermost first
+        """
+        middleware: list[Callable] = []
+        if port_policy.get("backpressure"):
+            middleware.append(BackpressureMiddleware(port_policy["backpressure"]))
+        if port_policy.get("timeout"):
+            middleware.append(TimeoutMiddleware(port_policy["timeout"]))
+        if port_policy.get("retry"):
+            middleware.append(RetryMiddleware(port_policy["retry"]))
+        return middleware
 
     def request_shutdown(self) -> None:
         """Request graceful shutdown of the runtime."""
@@ -7,7 +7,7 @@ import uuid
 from hexswitch.shared.observability.tracing import Span, get_current_span, start_span
 
 
-@dataclass
+@dataclass(slots=True)
 class Envelope:
     """Unified request/response structure for all protocols with integrated observability.
 
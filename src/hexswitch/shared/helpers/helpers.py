@@ -1,5 +1,6 @@
 """Helper functions for HexSwitch handlers."""
 
+import functools
 import json
 import logging
 import re
@@ -8,23 +9,18 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
-def parse_path_params(path: str, route_path: str) -> dict[str, str]:
-    """Parse path parameters from request path.
+@functools.lru_cache(maxsize=256)
+def _compile_route_path(route_path: str) -> tuple[re.Pattern[str], tuple[str, ...]]:
+    """Compile a route pattern into a regex and its parameter names.
+
+    Routes are matched on every request, so the compiled form is cached.
 
     Args:
-        path: Actual request path (e.g., "/orders/123").
         route_path: Route pattern with parameters (e.g., "/orders/:id").
 
     Returns:
-        Dictionary of path parameters.
-
-    Example:
-        >>> parse_path_params("/orders/123", "/orders/:id")
-        {"id": "123"}
+        Tuple of compiled regex and parameter names in order.
     """
-    params: dict[str, str] = {}
-
-    # Convert route pattern to regex
     pattern = route_path
     param_names: list[str] = []
 
@@ -36,8 +32,27 @@ def parse_path_params(path: str, route_path: str) -> dict[str, str]:
         # Replace :param with regex group
         pattern = pattern.replace(match.group(0), r"([^/]+)")
 
-    # Match path against pattern
-    regex = re.compile(f"^{pattern}$")
+    return re.compile(f"^{pattern}$"), tuple(param_names)
+
+
+def parse_path_params(path: str, route_path: str) -> dict[str, str]:
+    """Parse path parameters from request path.
+
+    Args:
+        path: Actual request path (e.g., "/orders/123").
+        route_path: Route pattern with parameters (e.g., "/orders/:id").
+
+    Returns:
+        Dictionary of path parameters.
+
+    Example:
+        >>> parse_path_params("/orders/123", "/orders/:id")
+        {"id": "123"}
+    """
+    params: dict[str, str] = {}
+
+    # Match path against the (cached) route regex
+    regex, param_names = _compile_route_path(route_path)
     match = regex.match(path)
 
     if match:
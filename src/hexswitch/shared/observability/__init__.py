@@ -6,7 +6,9 @@ from hexswitch.shared.observability.metrics import (
     Histogram,
     MetricsCollector,
     create_metrics_collector,
+    flush_metrics,
     get_global_metrics_collector,
+    stop_metrics_flush,
 )
 from hexswitch.shared.observability.trace_context import (
     create_trace_context,
@@ -32,7 +34,9 @@ __all__ = [
     "Histogram",
     "MetricsCollector",
     "create_metrics_collector",
+    "flush_metrics",
     "get_global_metrics_collector",
+    "stop_metrics_flush",
     # Tracing
     "Span",
     "Tracer",
@@ -1,9 +1,14 @@
 """Metrics collection system for HexSwitch using OpenTelemetry."""
 
+import atexit
+from collections import deque
+import functools
 import logging
 import os
 import sys
-from typing import Any
+import threading
+from typing import Any, Callable, Generic, TypeVar
+import weakref
 
 from opentelemetry import metrics
 from opentelemetry.metrics import (
@@ -145,8 +150,180 @@ def _get_meter_provider() -> MeterProvider:
     return _meter_provider
 
 
+# Instruments buffer updates locally and push them to OpenTelemetry in batches
+_FLUSH_INTERVAL_SECONDS = 0.1
+# Observations a histogram holds for export between flushes; older ones are dropped first
+_HISTOGRAM_BUFFER_SIZE = 4096
+_buffered_instruments: "weakref.WeakSet[Counter | Gauge | Histogram]" = weakref.WeakSet()
+# Guards the instrument set and flush thread; flushing itself runs under _flush_lock
+_register_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_flush_thread: threading.Thread | None = None
+_flush_stop: threading.Event | None = None
+
+
+def flush_metrics() -> None:
+    """Push all buffered metric updates to OpenTelemetry.
+
+    Runs periodically in a background thread and once more at interpreter exit;
+    call it directly to export pending updates immediately.
+    """
+    with _register_lock:
+        instruments = list(_buffered_instruments)
+    with _flush_lock:
+        for instrument in instruments:
+            instrument._flush()
+
+
+def _flush_periodically(stop: threading.Event) -> None:
+    """Flush buffered metrics at a fixed interval until ``stop`` is set.
+
+    Args:
+        stop: Event that ends the loop when set.
+    """
+    while not stop.wait(_FLUSH_INTERVAL_SECONDS):
+        flush_metrics()
+
+
+def stop_metrics_flush() -> None:
+    """Stop the background flush thread and export any pending updates.
+
+    Registered to run at interpreter exit. The thread is started again the
+    next time an instrument is created.
+    """
+    global _flush_thread, _flush_stop
+    with _register_lock:
+        thread, stop = _flush_thread, _flush_stop
+        _flush_thread = _flush_stop = None
+    if thread is not None and stop is not None:
+        stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+    flush_metrics()
+
+
+def _register_buffered(instrument: "Counter | Gauge | Histogram") -> None:
+    """Track an instrument for flushing and start the flush thread if needed.
+
+    Args:
+        instrument: Instrument with pending updates to flush.
+    """
+    global _flush_thread, _flush_stop
+    with _register_lock:
+        _buffered_instruments.add(instrument)
+        if _flush_thread is None:
+            _flush_stop = threading.Event()
+            _flush_thread = threading.Thread(
+                target=_flush_periodically,
+                args=(_flush_stop,),
+                name="hexswitch-metrics-flush",
+                daemon=True,
+            )
+            _flush_thread.start()
+
+
+atexit.register(stop_metrics_flush)
+
+
+_CellT = TypeVar("_CellT")
+
+
+class _ThreadCells(Generic[_CellT]):
+    """Per-thread cells of one instrument.
+
+    Each thread updates its own cell without locking. Cells are remembered
+    together with their owning thread so the cells of finished threads can
+    be reaped and folded into the instrument's base value instead of
+    accumulating under thread-pool churn.
+    """
+
+    __slots__ = ("_factory", "_local", "_cells", "lock")
+
+    def __init__(self, factory: Callable[[], _CellT]) -> None:
+        """Initialize an empty set of cells.
+
+        Args:
+            factory: Creates the cell for a thread on its first update.
+        """
+        self._factory = factory
+        self._local = threading.local()
+        self._cells: list[tuple[weakref.ref[threading.Thread], _CellT]] = []
+        # Guards the cell list and whatever base value the instrument folds reaped cells into
+        self.lock = threading.Lock()
+
+    def get(self) -> _CellT:
+        """Get the calling thread's cell, creating it on first use.
+
+        Returns:
+            Cell owned by the current thread.
+        """
+        try:
+            cell: _CellT = self._local.cell
+            return cell
+        except AttributeError:
+            cell = self._factory()
+            owner = weakref.ref(threading.current_thread())
+            with self.lock:
+                self._cells.append((owner, cell))
+            self._local.cell = cell
+            return cell
+
+    def live(self) -> list[_CellT]:
+        """List the cells still tracked; the caller must hold ``lock``.
+
+        Returns:
+            Cells not yet reaped.
+        """
+        return [cell for _, cell in self._cells]
+
+    def reap(self) -> list[_CellT]:
+        """Stop tracking the cells of finished threads; the caller must hold ``lock``.
+
+        A finished thread can no longer write to its cell, so its value is final.
+
+        Returns:
+            Cells whose owning thread has finished.
+        """
+        finished: list[_CellT] = []
+        remaining: list[tuple[weakref.ref[threading.Thread], _CellT]] = []
+        for owner, cell in self._cells:
+            thread = owner()
+            if thread is None or not thread.is_alive():
+                finished.append(cell)
+            else:
+                remaining.append((owner, cell))
+        if finished:
+            self._cells = remaining
+        return finished
+
+    def clear(self) -> None:
+        """Forget every cell; the caller must hold ``lock``.
+
+        Threads pick up fresh cells lazily on their next update.
+        """
+        self._local = threading.local()
+        self._cells = []
+
+
+class _CounterCell:
+    """Per-thread slot holding one thread's share of a counter's value."""
+
+    __slots__ = ("value", "exported")
+
+    def __init__(self) -> None:
+        # value is only written by the owning thread, exported only by the flusher
+        self.value = 0.0
+        self.exported = 0.0
+
+
 class Counter:
-    """Wrapper around OpenTelemetry Counter for compatibility."""
+    """Wrapper around OpenTelemetry Counter for compatibility.
+
+    OpenTelemetry doesn't expose a counter's current value, so increments are
+    tallied locally. Each thread bumps its own cell, so ``inc()`` never contends
+    on a shared value; ``get()`` sums the cells and ``flush_metrics()`` sends
+    the unexported part of each cell to OpenTelemetry.
+    """
 
     def __init__(self, name: str, labels: dict[str, str] | None = None):
         """Initialize counter.
@@ -159,6 +336,40 @@ class Counter:
         self.labels = labels or {}
         meter = _get_meter_provider().get_meter("hexswitch")
         self._counter = meter.create_counter(name, description=f"Counter: {name}")
+        self._cells = _ThreadCells(_CounterCell)
+        # Lifetime value of cells whose threads have finished, guarded by the cells' lock
+        self._retired = 0.0
+        self._reset_base = 0.0
+        _register_buffered(self)
+
+    def _total(self) -> float:
+        """Sum every cell's lifetime value.
+
+        Returns:
+            Total of all increments ever recorded.
+        """
+        with self._cells.lock:
+            cells = self._cells.live()
+            retired = self._retired
+        return retired + sum(cell.value for cell in cells)
+
+    def _flush(self) -> None:
+        """Send increments recorded since the last flush to OpenTelemetry.
+
+        Cells of finished threads are folded into the retired total here.
+        """
+        pending = 0.0
+        with self._cells.lock:
+            for cell in self._cells.reap():
+                pending += cell.value - cell.exported
+                self._retired += cell.value
+            cells = self._cells.live()
+        for cell in cells:
+            value = cell.value
+            pending += value - cell.exported
+            cell.exported = value
+        if pending:
+            self._counter.add(pending, attributes=self.labels)
 
     def inc(self, value: float = 1.0) -> None:
         """Increment counter by value.
@@ -166,23 +377,24 @@ class Counter:
         Args:
             value: Value to increment by (default: 1.0).
         """
-        self._counter.add(value, attributes=self.labels)
+        self._cells.get().value += value
 
     def get(self) -> float:
-        """Get current counter value (not directly available in OTel).
-
-        Note:
-            OpenTelemetry doesn't expose current value directly.
-            This method returns 0 for compatibility.
+        """Get current counter value.
 
         Returns:
-            Always returns 0 (OpenTelemetry doesn't expose current value).
+            Sum of all increments recorded locally since the last reset.
         """
-        return 0.0  # OTel doesn't expose current value directly
+        return self._total() - self._reset_base
 
     def reset(self) -> None:
-        """Reset counter (not supported in OpenTelemetry)."""
-        logger.warning("Counter reset not supported in OpenTelemetry")
+        """Reset the locally tracked value.
+
+        Note:
+            Values already exported to OpenTelemetry are cumulative and are
+            not affected.
+        """
+        self._reset_base = self._total()
 
 
 class Gauge:
@@ -200,6 +412,16 @@ class Gauge:
         meter = _get_meter_provider().get_meter("hexswitch")
         self._gauge = meter.create_up_down_counter(name, description=f"Gauge: {name}")
         self._value = 0.0
+        self._exported = 0.0
+        _register_buffered(self)
+
+    def _flush(self) -> None:
+        """Send the change since the last flush to OpenTelemetry."""
+        value = self._value
+        delta = value - self._exported
+        self._exported = value
+        if delta:
+            self._gauge.add(delta, attributes=self.labels)
 
     def set(self, value: float) -> None:
         """Set gauge value.
@@ -207,8 +429,6 @@ class Gauge:
         Args:
             value: Value to set.
         """
-        delta = value - self._value
-        self._gauge.add(delta, attributes=self.labels)
         self._value = value
 
     def inc(self, value: float = 1.0) -> None:
@@ -217,7 +437,6 @@ class Gauge:
         Args:
             value: Value to increment by (default: 1.0).
         """
-        self._gauge.add(value, attributes=self.labels)
         self._value += value
 
     def dec(self, value: float = 1.0) -> None:
@@ -226,7 +445,6 @@ class Gauge:
         Args:
             value: Value to decrement by (default: 1.0).
         """
-        self._gauge.add(-value, attributes=self.labels)
         self._value -= value
 
     def get(self) -> float:
@@ -238,8 +456,46 @@ class Gauge:
         return self._value
 
 
+class _HistogramCell:
+    """Per-thread summary of the observations one thread has made."""
+
+    __slots__ = ("count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def merged(self, other: "_HistogramCell") -> "_HistogramCell":
+        """Combine this summary with another.
+
+        Args:
+            other: Summary to combine with.
+
+        Returns:
+            New summary covering the observations of both.
+        """
+        cell = _HistogramCell()
+        cell.count = self.count + other.count
+        cell.sum = self.sum + other.sum
+        cell.min = min(self.min, other.min)
+        cell.max = max(self.max, other.max)
+        return cell
+
+
 class Histogram:
-    """Wrapper around OpenTelemetry Histogram for compatibility."""
+    """Wrapper around OpenTelemetry Histogram for compatibility.
+
+    Statistics are kept as a running count/sum/min/max per thread instead of a
+    list of every observation, so ``get()`` only combines one summary per
+    running thread plus one for finished threads.
+
+    Observations waiting for export sit in a ring buffer of
+    ``_HISTOGRAM_BUFFER_SIZE`` values. If more arrive between flushes, for
+    example while the flush thread is stopped or falling behind, the oldest
+    are dropped from the export; ``get()`` still counts them.
+    """
 
     def __init__(self, name: str, labels: dict[str, str] | None = None):
         """Initialize histogram.
@@ -252,7 +508,24 @@ class Histogram:
         self.labels = labels or {}
         meter = _get_meter_provider().get_meter("hexswitch")
         self._histogram = meter.create_histogram(name, description=f"Histogram: {name}")
-        self._values: list[float] = []
+        self._cells = _ThreadCells(_HistogramCell)
+        # Summary of cells whose threads have finished, guarded by the cells' lock.
+        # Replaced rather than mutated so readers can use it outside the lock.
+        self._retired = _HistogramCell()
+        self._pending: deque[float] = deque(maxlen=_HISTOGRAM_BUFFER_SIZE)
+        _register_buffered(self)
+
+    def _flush(self) -> None:
+        """Record observations made since the last flush in OpenTelemetry.
+
+        Summaries of finished threads are folded into the retired summary here.
+        """
+        with self._cells.lock:
+            for cell in self._cells.reap():
+                self._retired = self._retired.merged(cell)
+        pending = self._pending
+        while pending:
+            self._histogram.record(pending.popleft(), attributes=self.labels)
 
     def observe(self, value: float) -> None:
         """Record a value in the histogram.
@@ -260,8 +533,14 @@ class Histogram:
         Args:
             value: Value to record.
         """
-        self._histogram.record(value, attributes=self.labels)
-        self._values.append(value)
+        cell = self._cells.get()
+        cell.count += 1
+        cell.sum += value
+        if value < cell.min:
+            cell.min = value
+        if value > cell.max:
+            cell.max = value
+        self._pending.append(value)
 
     def get(self) -> dict[str, Any]:
         """Get histogram statistics.
@@ -269,7 +548,12 @@ class Histogram:
         Returns:
             Dictionary with count, sum, min, max, avg.
         """
-        if not self._values:
+        with self._cells.lock:
+            cells = [cell for cell in self._cells.live() if cell.count]
+            if self._retired.count:
+                cells.append(self._retired)
+
+        if not cells:
             return {
                 "count": 0,
                 "sum": 0.0,
@@ -278,17 +562,21 @@ class Histogram:
                 "avg": 0.0,
             }
 
+        count = sum(cell.count for cell in cells)
+        total = sum(cell.sum for cell in cells)
         return {
-            "count": len(self._values),
-            "sum": sum(self._values),
-            "min": min(self._values),
-            "max": max(self._values),
-            "avg": sum(self._values) / len(self._values),
+            "count": count,
+            "sum": total,
+            "min": min(cell.min for cell in cells),
+            "max": max(cell.max for cell in cells),
+            "avg": total / count,
         }
 
     def reset(self) -> None:
         """Reset histogram."""
-        self._values.clear()
+        with self._cells.lock:
+            self._cells.clear()
+            self._retired = _HistogramCell()
 
 
 class MetricsCollector:
@@ -299,6 +587,8 @@ class MetricsCollector:
         self._counters: dict[str, Counter] = {}
         self._gauges: dict[str, Gauge] = {}
         self._histograms: dict[str, Histogram] = {}
+        # Only taken when an instrument is created; lookups of existing ones are lock-free
+        self._create_lock = threading.Lock()
 
     def counter(
         self, name: str, labels: dict[str, str] | None = None
@@ -313,9 +603,13 @@ class MetricsCollector:
             Counter instance.
         """
         key = self._metric_key(name, labels)
-        if key not in self._counters:
-            self._counters[key] = Counter(name, labels)
-        return self._counters[key]
+        counter = self._counters.get(key)
+        if counter is None:
+            with self._create_lock:
+                counter = self._counters.get(key)
+                if counter is None:
+                    counter = self._counters[key] = Counter(name, labels)
+        return counter
 
     def gauge(self, name: str, labels: dict[str, str] | None = None) -> Gauge:
         """Get or create a gauge.
@@ -328,9 +622,13 @@ class MetricsCollector:
             Gauge instance.
         """
         key = self._metric_key(name, labels)
-        if key not in self._gauges:
-            self._gauges[key] = Gauge(name, labels)
-        return self._gauges[key]
+        gauge = self._gauges.get(key)
+        if gauge is None:
+            with self._create_lock:
+                gauge = self._gauges.get(key)
+                if gauge is None:
+                    gauge = self._gauges[key] = Gauge(name, labels)
+        return gauge
 
     def histogram(
         self, name: str, labels: dict[str, str] | None = None
@@ -345,9 +643,13 @@ class MetricsCollector:
             Histogram instance.
         """
         key = self._metric_key(name, labels)
-        if key not in self._histograms:
-            self._histograms[key] = Histogram(name, labels)
-        return self._histograms[key]
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._create_lock:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram(name, labels)
+        return histogram
 
     def get_all_metrics(self) -> dict[str, Any]:
         """Get all metrics as dictionary.
@@ -357,13 +659,13 @@ class MetricsCollector:
         """
         return {
             "counters": {
-                key: counter.get() for key, counter in self._counters.items()
+                key: counter.get() for key, counter in list(self._counters.items())
             },
             "gauges": {
-                key: gauge.get() for key, gauge in self._gauges.items()
+                key: gauge.get() for key, gauge in list(self._gauges.items())
             },
             "histograms": {
-                key: histogram.get() for key, histogram in self._histograms.items()
+                key: histogram.get() for key, histogram in list(self._histograms.items())
             },
         }
 
@@ -379,8 +681,24 @@ class MetricsCollector:
         """
         if not labels:
             return name
-        label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        return _labeled_metric_key(name, tuple(labels.items()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _labeled_metric_key(name: str, label_items: tuple[tuple[str, str], ...]) -> str:
+    """Build the metric key for labeled metrics.
+
+    Cached so repeated lookups with the same labels skip sorting and formatting.
+
+    Args:
+        name: Metric name.
+        label_items: Label key/value pairs in insertion order.
+
+    Returns:
+        Metric key string.
+    """
+    label_str = ",".join(f"{k}={v}" for k, v in sorted(label_items))
+    return f"{name}{{{label_str}}}"
 
 
 _global_metrics_collector: MetricsCollector | None = None
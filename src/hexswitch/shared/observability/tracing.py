@@ -1,10 +1,15 @@
 """Tracing system for HexSwitch using OpenTelemetry."""
 
+from collections import deque
+from contextvars import Token
+from functools import cached_property
 import logging
 import sys
 from typing import Any
 
+from opentelemetry import context as otel_context
 from opentelemetry import trace
+from opentelemetry.context import Context
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace import (
@@ -25,6 +30,9 @@ from opentelemetry.trace import (
 
 logger = logging.getLogger(__name__)
 
+# Number of recent spans a Tracer keeps for get_spans()
+DEFAULT_MAX_SPANS = 10_000
+
 # Initialize OpenTelemetry TracerProvider
 _tracer_provider: TracerProvider | None = None
 
@@ -81,7 +89,14 @@ def _get_tracer_provider() -> TracerProvider:
 
 
 class Span:
-    """Wrapper around OpenTelemetry Span for compatibility."""
+    """Wrapper around OpenTelemetry Span for compatibility.
+
+    A span is not current just because it was started. ``attach()`` makes it
+    current and returns a token, and ``detach(token)`` restores the span that
+    was current before. Attach and detach in the same task, in LIFO order.
+    Spans from the module-level :func:`start_span` are attached on start and
+    detached by ``finish()``.
+    """
 
     def __init__(self, otel_span: OTelSpan):
         """Initialize span wrapper.
@@ -91,11 +106,21 @@ class Span:
         """
         self._span = otel_span
         self.name = otel_span.name
-        # Extract trace context
-        context = otel_span.get_span_context()
-        self.trace_id = format(context.trace_id, "032x")
-        self.span_id = format(context.span_id, "016x")
+        # Extract trace context; ids are formatted as hex on first access
+        self._context = otel_span.get_span_context()
         self._parent_id: str | None = None
+        # Set when start_span() made this span current; finish() restores the previous one
+        self._token: Token[Context] | None = None
+
+    @cached_property
+    def trace_id(self) -> str:
+        """Get trace ID as 32 hex characters."""
+        return format(self._context.trace_id, "032x")
+
+    @cached_property
+    def span_id(self) -> str:
+        """Get span ID as 16 hex characters."""
+        return format(self._context.span_id, "016x")
 
     @property
     def parent_id(self) -> str | None:
@@ -112,9 +137,28 @@ class Span:
         # OpenTelemetry spans start automatically, no action needed
 
     def finish(self) -> None:
-        """Finish the span."""
+        """Finish the span, detaching it first if start_span() attached it."""
+        token, self._token = self._token, None
+        if token is not None:
+            self.detach(token)
         self._span.end()
 
+    def attach(self) -> Token[Context]:
+        """Make this span the current span.
+
+        Returns:
+            Token to pass to detach() to restore the previous current span.
+        """
+        return otel_context.attach(trace.set_span_in_context(self._span))
+
+    def detach(self, token: Token[Context]) -> None:
+        """Restore the current span that was active before attach().
+
+        Args:
+            token: Token returned by attach().
+        """
+        otel_context.detach(token)
+
     def add_tag(self, key: str, value: str) -> None:
         """Add a tag to the span.
 
@@ -142,7 +186,6 @@ class Span:
         Returns:
             Span as dictionary.
         """
-        self._span.get_span_context()
         attributes = dict(self._span.attributes) if self._span.attributes else {}
         return {
             "name": self.name,
@@ -158,18 +201,23 @@ class Span:
 
 
 class Tracer:
-    """Wrapper around OpenTelemetry Tracer for compatibility."""
+    """Wrapper around OpenTelemetry Tracer for compatibility.
+
+    Started spans are kept in a ring buffer so a long-running tracer only
+    remembers its most recent ``max_spans`` spans.
+    """
 
-    def __init__(self, service_name: str):
+    def __init__(self, service_name: str, max_spans: int = DEFAULT_MAX_SPANS):
         """Initialize tracer.
 
         Args:
             service_name: Name of the service.
+            max_spans: Number of most recent spans kept for get_spans().
         """
         self.service_name = service_name
         provider = _get_tracer_provider()
         self._tracer = provider.get_tracer(service_name)
-        self._spans: list[Span] = []
+        self._spans: deque[Span] = deque(maxlen=max_spans)
 
     def start_span(
         self,
@@ -211,9 +259,9 @@ class Tracer:
         """Get all spans.
 
         Returns:
-            List of spans.
+            List of the most recent spans, oldest first.
         """
-        return self._spans.copy()
+        return list(self._spans)
 
     def clear(self) -> None:
         """Clear all spans."""
@@ -223,16 +271,17 @@ class Tracer:
 _global_tracer: Tracer | None = None
 
 
-def create_tracer(service_name: str) -> Tracer:
+def create_tracer(service_name: str, max_spans: int = DEFAULT_MAX_SPANS) -> Tracer:
     """Create a new tracer instance.
 
     Args:
         service_name: Name of the service.
+        max_spans: Number of most recent spans kept for get_spans().
 
     Returns:
         New Tracer instance.
     """
-    return Tracer(service_name)
+    return Tracer(service_name, max_spans=max_spans)
 
 
 def get_global_tracer() -> Tracer:
@@ -252,7 +301,10 @@ def start_span(
     parent: Span | None = None,
     tags: dict[str, str] | None = None,
 ) -> Span:
-    """Start a new span using global tracer.
+    """Start a new span using global tracer and make it the current span.
+
+    The span stays current until ``finish()`` is called, which restores the
+    previously current span.
 
     Args:
         name: Span name.
@@ -284,9 +336,8 @@ def start_span(
     if parent:
         span.parent_id = parent.span_id
 
-    # Set as current span in context
-    trace.set_span_in_context(otel_span)
-    trace.use_span(otel_span, end_on_exit=False).__enter__()
+    # Set as current span until finish()
+    span._token = span.attach()
 
     tracer._spans.append(span)
     return span
@@ -34,6 +34,14 @@ except ImportError:
     pass
 
 
+# Try to import uvloop, if available
+try:
+    import uvloop
+except ImportError:
+    # uvloop not installed, async tests run on the default asyncio loop
+    uvloop = None
+
+
 # Auto-mark tests based on directory structure
 def pytest_collection_modifyitems(config, items):
     """Automatically mark tests based on their location."""
@@ -58,6 +66,14 @@ def pytest_collection_modifyitems(config, items):
                 item.add_marker(pytest.mark.order(3))
 
 
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run pytest-asyncio test loops on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
 @pytest.fixture
 def free_port() -> int:
     """Get a free port for testing.
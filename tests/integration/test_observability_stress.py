@@ -28,8 +28,8 @@ def test_metrics_high_concurrency() -> None:
     for t in threads:
         t.join()
 
-    # OpenTelemetry doesn't expose counter values directly
-    # Gauge tracks value locally
+    # Counter and gauge track their values locally
+    assert counter.get() == 5000
     assert gauge.get() == 5000
 
 
@@ -14,39 +14,31 @@ from hexswitch.shared.config.config import ConfigError
 class TestCmdValidate:
     """Test cmd_validate function."""
 
-    def test_validate_valid_config(self) -> None:
+    def test_validate_valid_config(self, tmp_path: Path) -> None:
         """Test validating a valid config file."""
         config_content = {
             "service": {"name": "test-service"},
             "inbound": {"http": {"enabled": True, "port": 8000}},
         }
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-            f.write(tomli_w.dumps(config_content).encode("utf-8"))
-            config_path = f.name
+        config_path = tmp_path / "hex-config.toml"
+        config_path.write_bytes(tomli_w.dumps(config_content).encode("utf-8"))
 
-        try:
-            args = argparse.Namespace(config=config_path)
-            result = cmd_validate(args)
-            assert result == 0
-        finally:
-            Path(config_path).unlink()
+        args = argparse.Namespace(config=str(config_path))
+        result = cmd_validate(args)
+        assert result == 0
 
-    def test_validate_invalid_config(self) -> None:
+    def test_validate_invalid_config(self, tmp_path: Path) -> None:
         """Test validating an invalid config file."""
         config_content = {
             "service": {"name": "test-service"},
             "inbound": {"http": {"enabled": True, "port": 70000}},  # Invalid port
         }
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-            f.write(tomli_w.dumps(config_content).encode("utf-8"))
-            config_path = f.name
+        config_path = tmp_path / "hex-config.toml"
+        config_path.write_bytes(tomli_w.dumps(config_content).encode("utf-8"))
 
-        try:
-            args = argparse.Namespace(config=config_path)
-            result = cmd_validate(args)
-            assert result == 1
-        finally:
-            Path(config_path).unlink()
+        args = argparse.Namespace(config=str(config_path))
+        result = cmd_validate(args)
+        assert result == 1
 
     def test_validate_missing_file(self) -> None:
         """Test validating a non-existent config file."""
@@ -54,18 +46,14 @@ class TestCmdValidate:
         result = cmd_validate(args)
         assert result == 1
 
-    def test_validate_invalid_toml(self) -> None:
+    def test_validate_invalid_toml(self, tmp_path: Path) -> None:
         """Test validating a file with invalid TOML."""
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-            f.write(b"invalid toml content [")
-            config_path = f.name
+        config_path = tmp_path / "hex-config.toml"
+        config_path.write_bytes(b"invalid toml content [")
 
-        try:
-            args = argparse.Namespace(config=config_path)
-            result = cmd_validate(args)
-            assert result == 1
-        finally:
-            Path(config_path).unlink()
+        args = argparse.Namespace(config=str(config_path))
+        result = cmd_validate(args)
+        assert result == 1
 
 
 class TestCmdRun:
@@ -179,33 +167,27 @@ class TestCmdInit:
             mock_example.assert_called_once()
 
     @patch("hexswitch.app.get_example_config")
-    def test_init_existing_file_no_force(self, mock_example: MagicMock) -> None:
+    def test_init_existing_file_no_force(self, mock_example: MagicMock, tmp_path: Path) -> None:
         """Test init command fails when file exists and force is False."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            config_path = Path(f.name)
+        config_path = tmp_path / "hex-config.toml"
+        config_path.write_bytes(b"")
 
-        try:
-            args = argparse.Namespace(config=str(config_path), force=False)
-            result = cmd_init(args)
-            assert result == 1
-            mock_example.assert_not_called()
-        finally:
-            config_path.unlink()
+        args = argparse.Namespace(config=str(config_path), force=False)
+        result = cmd_init(args)
+        assert result == 1
+        mock_example.assert_not_called()
 
     @patch("hexswitch.app.get_example_config")
-    def test_init_existing_file_with_force(self, mock_example: MagicMock) -> None:
+    def test_init_existing_file_with_force(self, mock_example: MagicMock, tmp_path: Path) -> None:
         """Test init command overwrites existing file with force."""
         mock_example.return_value = '[service]\nname = "test"'
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            config_path = Path(f.name)
+        config_path = tmp_path / "hex-config.toml"
+        config_path.write_bytes(b"")
 
-        try:
-            args = argparse.Namespace(config=str(config_path), force=True)
-            result = cmd_init(args)
-            assert result == 0
-            mock_example.assert_called_once()
-        finally:
-            config_path.unlink()
+        args = argparse.Namespace(config=str(config_path), force=True)
+        result = cmd_init(args)
+        assert result == 0
+        mock_example.assert_called_once()
 
 
 class TestMain:
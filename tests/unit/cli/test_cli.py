@@ -1,9 +1,12 @@
 """Unit tests for CLI entry point."""
 
+import os
 from pathlib import Path
+import selectors
+import signal
 import subprocess
 import sys
-import tempfile
+import time
 
 import pytest
 import tomli_w
@@ -14,284 +17,223 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 # Default timeout for all subprocess calls (in seconds)
 SUBPROCESS_TIMEOUT = 10
 
+# Configs serialized once at import time and written verbatim by each test
+VALID_CONFIG_TOML = tomli_w.dumps(
+    {
+        "service": {"name": "test-service", "runtime": "python"},
+        "inbound": {"http": {"enabled": True, "port": 8000, "routes": []}},
+    }
+).encode("utf-8")
+MINIMAL_CONFIG_TOML = tomli_w.dumps({"service": {"name": "test-service"}}).encode("utf-8")
 
-def test_cli_version_flag() -> None:
-    """Test that --version flag works and returns exit code 0."""
-    result = subprocess.run(
-        [sys.executable, "-m", "hexswitch.app", "--version"],
-        capture_output=True,
-        text=True,
-        timeout=SUBPROCESS_TIMEOUT,
-        cwd=Path(__file__).parent.parent.parent,
-    )
-    assert result.returncode == 0
-    assert "HexSwitch" in result.stdout
-    assert "0.1.2" in result.stdout
+# Repository root, used as working directory for CLI subprocesses
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Cap for waiting on the runtime startup log line, the same as the fixed sleep it replaced.
+# If the line has not appeared by then, the test only checks the process is still running.
+STARTUP_TIMEOUT = 0.5
 
-def test_cli_version_command() -> None:
-    """Test that 'version' command works and returns exit code 0."""
-    result = subprocess.run(
-        [sys.executable, "-m", "hexswitch.app", "version"],
-        capture_output=True,
-        text=True,
-        timeout=SUBPROCESS_TIMEOUT,
-        cwd=Path(__file__).parent.parent.parent,
-    )
-    assert result.returncode == 0
-    assert "HexSwitch" in result.stdout
-    assert "0.1.2" in result.stdout
-    assert "Hexagonal runtime switchboard" in result.stdout
 
+def _run_cli(*args: str, stdout: int = subprocess.DEVNULL, stderr: int = subprocess.DEVNULL) -> subprocess.CompletedProcess[str]:
+    """Run the HexSwitch CLI in a subprocess.
 
-def test_cli_default_run_shows_version() -> None:
-    """Test that CLI runs without arguments and shows version (backwards compatibility)."""
-    result = subprocess.run(
-        [sys.executable, "-m", "hexswitch.app"],
-        capture_output=True,
+    Streams default to DEVNULL; pass subprocess.PIPE for the one being asserted.
+
+    Args:
+        *args: Command-line arguments passed to hexswitch.app.
+        stdout: Destination for the child's stdout.
+        stderr: Destination for the child's stderr.
+
+    Returns:
+        Completed process with text output for piped streams.
+    """
+    return subprocess.run(
+        [sys.executable, "-m", "hexswitch.app", *args],
+        stdout=stdout,
+        stderr=stderr,
         text=True,
         timeout=SUBPROCESS_TIMEOUT,
-        cwd=Path(__file__).parent.parent.parent,
+        cwd=PROJECT_ROOT,
     )
+
+
+def _wait_for_output(stream, marker: bytes, timeout: float) -> tuple[bool, bytes]:
+    """Read from a binary subprocess pipe until marker appears, EOF, or timeout.
+
+    Args:
+        stream: Binary pipe of a running subprocess.
+        marker: Byte string to wait for.
+        timeout: Maximum time to wait in seconds.
+
+    Returns:
+        Whether marker was seen (False on EOF or timeout), and everything read
+        from the pipe, since those bytes are no longer available to communicate().
+    """
+    deadline = time.monotonic() + timeout
+    output = b""
+    with selectors.DefaultSelector() as selector:
+        selector.register(stream, selectors.EVENT_READ)
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not selector.select(remaining):
+                break
+            chunk = os.read(stream.fileno(), 4096)
+            if not chunk:
+                break
+            output += chunk
+            if marker in output:
+                return True, output
+    return False, output
+
+
+@pytest.mark.parametrize(
+    ("args", "expected_substrings"),
+    [
+        (["--version"], ["HexSwitch", "0.1.2"]),
+        (["version"], ["HexSwitch", "0.1.2", "Hexagonal runtime switchboard"]),
+        ([], ["HexSwitch"]),  # No command shows version (backwards compatibility)
+    ],
+    ids=["flag", "command", "default"],
+)
+def test_cli_version(args: list[str], expected_substrings: list[str]) -> None:
+    """Test that --version flag, 'version' command and bare invocation print the version."""
+    result = _run_cli(*args, stdout=subprocess.PIPE)
     assert result.returncode == 0
-    assert "HexSwitch" in result.stdout
+    assert all(s in result.stdout for s in expected_substrings)
 
 
 def test_cli_help_flag() -> None:
     """Test that --help flag works and returns exit code 0."""
-    result = subprocess.run(
-        [sys.executable, "-m", "hexswitch.app", "--help"],
-        capture_output=True,
-        text=True,
-        timeout=SUBPROCESS_TIMEOUT,
-        cwd=Path(__file__).parent.parent.parent,
-    )
+    result = _run_cli("--help", stdout=subprocess.PIPE)
     assert result.returncode == 0
     assert "HexSwitch" in result.stdout
     assert "config-driven microservices" in result.stdout
 
 
-def test_cli_init_creates_config() -> None:
+def test_cli_init_creates_config(tmp_path: Path) -> None:
     """Test that 'init' command creates example configuration."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "hex-config.toml"
-        result = subprocess.run(
-            [sys.executable, "-m", "hexswitch.app", "--config", str(config_path), "init"],
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-        assert result.returncode == 0
-        assert config_path.exists()
-        assert "example-service" in config_path.read_text()
-
-
-def test_cli_init_refuses_overwrite() -> None:
+    config_path = tmp_path / "hex-config.toml"
+
+    result = _run_cli("--config", str(config_path), "init")
+    assert result.returncode == 0
+    assert config_path.exists()
+    assert "example-service" in config_path.read_text()
+
+
+def test_cli_init_refuses_overwrite(tmp_path: Path) -> None:
     """Test that 'init' command refuses to overwrite existing config without --force."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "hex-config.toml"
-        config_path.write_text("existing: config")
-
-        result = subprocess.run(
-            [sys.executable, "-m", "hexswitch.app", "--config", str(config_path), "init"],
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-        assert result.returncode == 1
-        assert "already exists" in result.stderr or "already exists" in result.stdout
-
-
-def test_cli_init_force_overwrite() -> None:
+    config_path = tmp_path / "hex-config.toml"
+    config_path.write_text("existing: config")
+
+    result = _run_cli("--config", str(config_path), "init", stderr=subprocess.PIPE)
+    assert result.returncode == 1
+    assert "already exists" in result.stderr
+
+
+def test_cli_init_force_overwrite(tmp_path: Path) -> None:
     """Test that 'init' command overwrites with --force."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "hex-config.toml"
-        config_path.write_text("existing: config")
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "hexswitch.app",
-                "--config",
-                str(config_path),
-                "init",
-                "--force",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-        assert result.returncode == 0
-        assert "example-service" in config_path.read_text()
-
-
-def test_cli_validate_success() -> None:
-    """Test that 'validate' command succeeds with valid config."""
-    config_data = {
-        "service": {"name": "test-service", "runtime": "python"},
-        "inbound": {"http": {"enabled": True}},
-    }
+    config_path = tmp_path / "hex-config.toml"
+    config_path.write_text("existing: config")
+
+    result = _run_cli("--config", str(config_path), "init", "--force")
+    assert result.returncode == 0
+    assert "example-service" in config_path.read_text()
+
+
+@pytest.mark.parametrize(
+    ("content", "returncode", "expected"),
+    [
+        (VALID_CONFIG_TOML, 0, "valid"),
+        (b"invalid toml content [", 1, "error"),
+    ],
+    ids=["success", "failure"],
+)
+def test_cli_validate(tmp_path: Path, content: bytes, returncode: int, expected: str) -> None:
+    """Test that 'validate' command reports valid and invalid configs."""
+    config_path = tmp_path / "hex-config.toml"
+    config_path.write_bytes(content)
+
+    result = _run_cli("--config", str(config_path), "validate", stderr=subprocess.PIPE)
+    assert result.returncode == returncode
+    assert expected in result.stderr.lower()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "hex-config.toml"
-        with config_path.open("wb") as f:
-            f.write(tomli_w.dumps(config_data).encode("utf-8"))
-
-        result = subprocess.run(
-            [sys.executable, "-m", "hexswitch.app", "--config", str(config_path), "validate"],
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-        assert result.returncode == 0
-        assert "valid" in result.stderr.lower() or "valid" in result.stdout.lower()
-
-
-def test_cli_validate_failure() -> None:
-    """Test that 'validate' command fails with invalid config."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "hex-config.toml"
-        config_path.write_bytes(b"invalid toml content [")
-
-        result = subprocess.run(
-            [sys.executable, "-m", "hexswitch.app", "--config", str(config_path), "validate"],
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-        assert result.returncode == 1
-        assert "error" in result.stderr.lower() or "error" in result.stdout.lower()
-
-
-def test_cli_run_dry_run() -> None:
+
+def test_cli_run_dry_run(tmp_path: Path) -> None:
     """Test that 'run --dry-run' command works."""
-    config_data = {
-        "service": {"name": "test-service", "runtime": "python"},
-        "inbound": {"http": {"enabled": True, "port": 8000, "routes": []}},
-    }
+    config_path = tmp_path / "hex-config.toml"
+    config_path.write_bytes(VALID_CONFIG_TOML)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "hex-config.toml"
-        with config_path.open("wb") as f:
-            f.write(tomli_w.dumps(config_data).encode("utf-8"))
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "hexswitch.app",
-                "--config",
-                str(config_path),
-                "run",
-                "--dry-run",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-        # Dry-run should succeed (exit code 0) or fail with config error (exit code 1)
-        # Both are acceptable - we just want to verify it doesn't hang
-        assert result.returncode in [0, 1]
-        if result.returncode == 0:
-            assert "test-service" in result.stderr or "test-service" in result.stdout
+    result = _run_cli("--config", str(config_path), "run", "--dry-run", stderr=subprocess.PIPE)
+    # Dry-run should succeed (exit code 0) or fail with config error (exit code 1)
+    # Both are acceptable - we just want to verify it doesn't hang
+    assert result.returncode in [0, 1]
+    if result.returncode == 0:
+        assert "test-service" in result.stderr
 
 
 @pytest.mark.timeout(15)  # Extra timeout for this test since it starts a runtime
-def test_cli_run_starts_runtime() -> None:
+def test_cli_run_starts_runtime(tmp_path: Path) -> None:
     """Test that 'run' command starts runtime (with timeout to avoid hanging)."""
-    import shutil
-    import signal
-    import time
-
-    config_data = {"service": {"name": "test-service"}}
-
-    # Create temporary directory and config file
-    tmpdir = tempfile.mkdtemp()
-    config_path = Path(tmpdir) / "hex-config.yaml"
+    config_path = tmp_path / "hex-config.toml"
+    config_path.write_bytes(MINIMAL_CONFIG_TOML)
+
+    # Start process with explicit timeout
+    process = subprocess.Popen(
+        [sys.executable, "-m", "hexswitch.app", "--config", str(config_path), "run"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=PROJECT_ROOT,
+    )
 
     try:
-        with config_path.open("wb") as f:
-            f.write(tomli_w.dumps(config_data).encode("utf-8"))
-
-        # Start process with explicit timeout
-        process = subprocess.Popen(
-            [sys.executable, "-m", "hexswitch.app", "--config", str(config_path), "run"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-
-        try:
-            # Wait a bit for runtime to start (with timeout)
-            time.sleep(0.5)
-
-            # Check if process is still running (runtime started successfully)
-            poll_result = process.poll()
-            if poll_result is not None:
-                # Process exited, check output for errors
-                stdout, stderr = process.communicate(timeout=1)
-                # If it exited with error, that's okay for this test - we just want to verify
-                # it doesn't hang. But let's check if it's a configuration error vs runtime error
-                if "Configuration error" in stderr or "error" in stderr.lower():
-                    # Configuration error is acceptable - runtime tried to start
-                    pass
-                else:
-                    # Unexpected exit - might be an issue
-                    raise AssertionError(f"Process exited unexpectedly: {poll_result}\n" f"stdout: {stdout}\nstderr: {stderr}")
+        # Wait for the runtime to report startup (pipes are not selectable on Windows)
+        if sys.platform == "win32":
+            time.sleep(STARTUP_TIMEOUT)
+            started, early_stderr = False, b""
+        else:
+            started, early_stderr = _wait_for_output(process.stderr, b"Runtime started", STARTUP_TIMEOUT)
+
+        # Check if process is still running (runtime started successfully)
+        poll_result = process.poll()
+        if poll_result is not None:
+            # Process exited, check output for errors
+            stdout_bytes, stderr_bytes = process.communicate(timeout=1)
+            stdout = stdout_bytes.decode(errors="replace")
+            stderr = (early_stderr + stderr_bytes).decode(errors="replace")
+            assert not started, f"Process exited after reporting startup: {poll_result}\nstdout: {stdout}\nstderr: {stderr}"
+            # If it exited with error, that's okay for this test - we just want to verify
+            # it doesn't hang. But let's check if it's a configuration error vs runtime error
+            if "Configuration error" in stderr or "error" in stderr.lower():
+                # Configuration error is acceptable - runtime tried to start
+                pass
             else:
-                # Process is still running - good! Now terminate it
-                try:
-                    if sys.platform == "win32":
-                        process.terminate()
-                    else:
-                        process.send_signal(signal.SIGTERM)
-                    process.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait()
-        finally:
-            # Ensure process is always terminated and wait for it to fully exit
-            if process.poll() is None:
-                try:
-                    if sys.platform == "win32":
-                        process.terminate()
-                    else:
-                        process.send_signal(signal.SIGTERM)
-                    process.wait(timeout=1)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait()
-
-            # On Windows, wait a bit longer to ensure file handles are released
-            if sys.platform == "win32":
-                time.sleep(0.2)
-
-            # Close stdout/stderr to release file handles
-            if process.stdout:
-                process.stdout.close()
-            if process.stderr:
-                process.stderr.close()
+                # Unexpected exit - might be an issue
+                raise AssertionError(f"Process exited unexpectedly: {poll_result}\n" f"stdout: {stdout}\nstderr: {stderr}")
+        else:
+            # Process is still running - good! Now terminate it
+            try:
+                if sys.platform == "win32":
+                    process.terminate()
+                else:
+                    process.send_signal(signal.SIGTERM)
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
     finally:
-        # Clean up temporary directory
-        # On Windows, retry deletion if it fails due to file locks
-        max_retries = 3
-        for attempt in range(max_retries):
+        # Ensure process is always terminated and wait for it to fully exit
+        if process.poll() is None:
             try:
-                shutil.rmtree(tmpdir)
-                break
-            except (PermissionError, OSError) as e:
-                if attempt < max_retries - 1:
-                    time.sleep(0.1)
+                if sys.platform == "win32":
+                    process.terminate()
                 else:
-                    # Last attempt failed - log but don't fail the test
-                    import warnings
-                    warnings.warn(f"Could not delete temporary directory {tmpdir}: {e}", stacklevel=2)
-
+                    process.send_signal(signal.SIGTERM)
+                process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+        # Close stdout/stderr to release file handles
+        if process.stdout:
+            process.stdout.close()
+        if process.stderr:
+            process.stderr.close()
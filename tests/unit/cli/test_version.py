@@ -1,7 +1,11 @@
 """Unit tests for version import."""
 
+import re
+
 from hexswitch import __version__
 
+SEMVER_PATTERN = re.compile(r"\d+\.\d+\.\d+")
+
 
 def test_version_is_defined() -> None:
     """Test that __version__ is defined and is a string."""
@@ -11,7 +15,4 @@ def test_version_is_defined() -> None:
 
 def test_version_format() -> None:
     """Test that version follows semantic versioning format."""
-    parts = __version__.split(".")
-    assert len(parts) == 3
-    assert all(part.isdigit() for part in parts)
-
+    assert SEMVER_PATTERN.fullmatch(__version__)
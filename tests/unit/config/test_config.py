@@ -1,75 +1,17 @@
-"""Unit tests for configuration loading and validation."""
+"""Unit tests for configuration validation and defaults."""
 
-from pathlib import Path
-import tempfile
 import tomllib
 
 import pytest
-import tomli_w
 
 from hexswitch.shared.config import (
     DEFAULT_CONFIG_PATH,
     ConfigError,
     get_example_config,
-    load_config,
     validate_config,
 )
 
 
-def test_load_config_file_not_found() -> None:
-    """Test that loading non-existent config file raises ConfigError."""
-    with pytest.raises(ConfigError, match="Configuration file not found"):
-        load_config("nonexistent-config.toml")
-
-
-def test_load_config_invalid_toml() -> None:
-    """Test that loading invalid TOML raises ConfigError."""
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-        f.write(b"invalid toml content [")
-        f.flush()
-        temp_path = Path(f.name)
-
-    try:
-        with pytest.raises(ConfigError, match="Invalid TOML"):
-            load_config(temp_path)
-    finally:
-        temp_path.unlink()
-
-
-def test_load_config_empty_file() -> None:
-    """Test that loading empty config file raises ConfigError."""
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-        f.write(b"")
-        f.flush()
-        temp_path = Path(f.name)
-
-    try:
-        with pytest.raises(ConfigError, match="Configuration file is empty"):
-            load_config(temp_path)
-    finally:
-        temp_path.unlink()
-
-
-def test_load_config_valid() -> None:
-    """Test loading valid configuration file."""
-    config_data = {
-        "service": {"name": "test-service", "runtime": "python"},
-        "inbound": {"http": {"enabled": True}},
-    }
-
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-        f.write(tomli_w.dumps(config_data).encode("utf-8"))
-        f.flush()
-        temp_path = Path(f.name)
-
-    try:
-        config = load_config(temp_path)
-        assert config["service"]["name"] == "test-service"
-        assert config["inbound"]["http"]["enabled"] is True
-    finally:
-        temp_path.unlink()
-
-
 def test_validate_config_missing_service() -> None:
     """Test that validation fails when service section is missing."""
     config = {"inbound": {}}
@@ -124,14 +66,17 @@ def test_validate_config_minimal() -> None:
     validate_config(config)
 
 
-def test_get_example_config() -> None:
-    """Test that example config is valid TOML and structure."""
+@pytest.fixture(scope="module")
+def example_config() -> tuple[str, dict]:
+    """Render and parse the example config once per module."""
     example = get_example_config()
-    assert isinstance(example, str)
+    return example, tomllib.loads(example)
+
 
-    # Parse as TOML to verify it's valid
-    import io
-    config = tomllib.load(io.BytesIO(example.encode("utf-8")))
+def test_get_example_config(example_config: tuple[str, dict]) -> None:
+    """Test that example config is valid TOML and structure."""
+    example, config = example_config
+    assert isinstance(example, str)
     assert isinstance(config, dict)
     assert "service" in config
     assert config["service"]["name"] == "example-service"
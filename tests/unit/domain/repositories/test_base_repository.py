@@ -7,7 +7,7 @@ import pytest
 from hexswitch.domain.repositories import BaseRepository, BaseRepositoryPort
 
 
-@dataclass
+@dataclass(slots=True)
 class SampleEntity:
     """Sample entity for repository tests."""
     id: str
@@ -47,18 +47,30 @@ class TestBaseRepositoryPort:
         assert isinstance(repo, BaseRepositoryPort)
 
 
+@pytest.fixture
+def repo() -> SampleRepository:
+    """Empty repository for tests that mutate storage."""
+    return SampleRepository()
+
+
+@pytest.fixture(scope="module")
+def populated_repo() -> SampleRepository:
+    """Repository pre-populated with three entities; must not be mutated."""
+    repository = SampleRepository()
+    repository.save_many(SampleEntity(str(i), f"test{i}", i) for i in range(1, 4))
+    return repository
+
+
 class TestBaseRepository:
     """Tests for BaseRepository implementation."""
 
-    def test_repository_initialization(self):
+    def test_repository_initialization(self, repo: SampleRepository):
         """Test repository initialization."""
-        repo = SampleRepository()
         assert repo.count() == 0
-        assert len(repo.list_all()) == 0
+        assert repo.list_all() == []
 
-    def test_save_entity(self):
+    def test_save_entity(self, repo: SampleRepository):
         """Test saving an entity."""
-        repo = SampleRepository()
         entity = SampleEntity(id="1", name="test", value=42)
 
         saved = repo.save(entity)
@@ -67,9 +79,8 @@ class TestBaseRepository:
         assert saved.value == 42
         assert repo.count() == 1
 
-    def test_save_entity_without_id_raises_error(self):
+    def test_save_entity_without_id_raises_error(self, repo: SampleRepository):
         """Test that saving entity without id raises error."""
-        repo = SampleRepository()
 
         @dataclass
         class EntityWithoutId:
@@ -79,94 +90,47 @@ class TestBaseRepository:
         with pytest.raises(ValueError, match="id"):
             repo.save(entity)  # type: ignore
 
-    def test_find_by_id_existing(self):
-        """Test finding existing entity by ID."""
-        repo = SampleRepository()
-        entity = SampleEntity(id="1", name="test", value=42)
-        repo.save(entity)
-
-        found = repo.find_by_id("1")
-        assert found is not None
-        assert found.id == "1"
-        assert found.name == "test"
-        assert found.value == 42
-
-    def test_find_by_id_nonexistent(self):
-        """Test finding non-existent entity returns None."""
-        repo = SampleRepository()
-        found = repo.find_by_id("nonexistent")
-        assert found is None
-
-    def test_list_all_empty(self):
-        """Test listing all entities when repository is empty."""
-        repo = SampleRepository()
-        entities = repo.list_all()
-        assert entities == []
-        assert len(entities) == 0
-
-    def test_list_all_multiple(self):
+    @pytest.mark.parametrize(
+        ("entity_id", "expected"),
+        [
+            ("1", SampleEntity(id="1", name="test1", value=1)),
+            ("nonexistent", None),
+        ],
+    )
+    def test_find_by_id(self, populated_repo: SampleRepository, entity_id: str, expected: SampleEntity | None):
+        """Test finding existing and non-existent entities by ID."""
+        assert populated_repo.find_by_id(entity_id) == expected
+
+    @pytest.mark.parametrize(("entity_id", "expected"), [("1", True), ("nonexistent", False)])
+    def test_exists(self, populated_repo: SampleRepository, entity_id: str, expected: bool):
+        """Test exists for existing and non-existent entities."""
+        assert populated_repo.exists(entity_id) is expected
+
+    def test_list_all_multiple(self, populated_repo: SampleRepository):
         """Test listing all entities."""
-        repo = SampleRepository()
-        entity1 = SampleEntity(id="1", name="test1", value=1)
-        entity2 = SampleEntity(id="2", name="test2", value=2)
-        entity3 = SampleEntity(id="3", name="test3", value=3)
-
-        repo.save(entity1)
-        repo.save(entity2)
-        repo.save(entity3)
-
-        entities = repo.list_all()
+        entities = populated_repo.list_all()
         assert len(entities) == 3
         assert {e.id for e in entities} == {"1", "2", "3"}
 
-    def test_delete_existing(self):
+    def test_count_multiple(self, populated_repo: SampleRepository):
+        """Test count with multiple entities."""
+        assert populated_repo.count() == 3
+
+    def test_delete_existing(self, repo: SampleRepository):
         """Test deleting existing entity."""
-        repo = SampleRepository()
-        entity = SampleEntity(id="1", name="test", value=42)
-        repo.save(entity)
+        repo.save(SampleEntity(id="1", name="test", value=42))
 
-        deleted = repo.delete("1")
-        assert deleted is True
+        assert repo.delete("1") is True
         assert repo.count() == 0
         assert repo.find_by_id("1") is None
 
-    def test_delete_nonexistent(self):
+    def test_delete_nonexistent(self, repo: SampleRepository):
         """Test deleting non-existent entity returns False."""
-        repo = SampleRepository()
-        deleted = repo.delete("nonexistent")
-        assert deleted is False
+        assert repo.delete("nonexistent") is False
         assert repo.count() == 0
 
-    def test_count_empty(self):
-        """Test count when repository is empty."""
-        repo = SampleRepository()
-        assert repo.count() == 0
-
-    def test_count_multiple(self):
-        """Test count with multiple entities."""
-        repo = SampleRepository()
-        for i in range(5):
-            entity = SampleEntity(id=str(i), name=f"test{i}", value=i)
-            repo.save(entity)
-
-        assert repo.count() == 5
-
-    def test_exists_true(self):
-        """Test exists returns True for existing entity."""
-        repo = SampleRepository()
-        entity = SampleEntity(id="1", name="test", value=42)
-        repo.save(entity)
-
-        assert repo.exists("1") is True
-
-    def test_exists_false(self):
-        """Test exists returns False for non-existent entity."""
-        repo = SampleRepository()
-        assert repo.exists("nonexistent") is False
-
-    def test_save_updates_existing(self):
+    def test_save_updates_existing(self, repo: SampleRepository):
         """Test that saving entity with existing ID updates it."""
-        repo = SampleRepository()
         entity1 = SampleEntity(id="1", name="original", value=1)
         repo.save(entity1)
 
@@ -179,15 +143,35 @@ class TestBaseRepository:
         assert found.name == "updated"
         assert found.value == 2
 
+    def test_save_many(self, repo: SampleRepository):
+        """Test saving a batch of entities loaded via from_dict."""
+        saved = repo.save_many(
+            repo.from_dict({"id": str(i), "name": f"t{i}", "value": i}) for i in range(1000)
+        )
+
+        assert len(saved) == 1000
+        assert repo.count() == 1000
+        assert repo.find_by_id("999").value == 999
+
+    def test_save_many_without_id_leaves_repository_unchanged(self, repo: SampleRepository):
+        """Test that a batch containing an entity without id is rejected as a whole."""
+
+        @dataclass
+        class EntityWithoutId:
+            name: str
+
+        with pytest.raises(ValueError, match="id"):
+            repo.save_many([SampleEntity(id="1", name="test"), EntityWithoutId(name="test")])  # type: ignore
+        assert repo.count() == 0
+
     def test_from_dict_not_implemented(self):
         """Test that from_dict raises NotImplementedError if not overridden."""
         repo = BaseRepository[SampleEntity]()
         with pytest.raises(NotImplementedError):
             repo.from_dict({"id": "1", "name": "test"})
 
-    def test_from_dict_implemented(self):
+    def test_from_dict_implemented(self, repo: SampleRepository):
         """Test that from_dict works when implemented."""
-        repo = SampleRepository()
         entity = repo.from_dict({"id": "1", "name": "test", "value": 42})
 
         assert entity.id == "1"
@@ -10,7 +10,7 @@ from hexswitch.domain.repositories import BaseRepositoryPort
 from hexswitch.domain.services import BaseService
 
 
-@dataclass
+@dataclass(slots=True)
 class SampleEntity:
     """Sample entity for service tests."""
     id: str
@@ -18,25 +18,41 @@ class SampleEntity:
     value: int = 0
 
 
+def _make_entity(i: int) -> SampleEntity:
+    """Create the i-th sample entity."""
+    return SampleEntity(str(i), f"test{i}", i)
+
+
 class MockRepository(BaseRepositoryPort[SampleEntity]):
     """Mock repository for testing services."""
 
     def __init__(self):
         self._storage: dict[str, SampleEntity] = {}
+        self._cached_list: Optional[list[SampleEntity]] = None
 
     def save(self, entity: SampleEntity) -> SampleEntity:
         self._storage[entity.id] = entity
+        self._cached_list = None
         return entity
 
+    def save_many(self, entities: list[SampleEntity]) -> list[SampleEntity]:
+        self._storage.update((entity.id, entity) for entity in entities)
+        self._cached_list = None
+        return entities
+
     def find_by_id(self, entity_id: str) -> Optional[SampleEntity]:
         return self._storage.get(entity_id)
 
     def list_all(self) -> list[SampleEntity]:
-        return list(self._storage.values())
+        # Materialize once per mutation; callers must not modify the result
+        if self._cached_list is None:
+            self._cached_list = list(self._storage.values())
+        return self._cached_list
 
     def delete(self, entity_id: str) -> bool:
         if entity_id in self._storage:
             del self._storage[entity_id]
+            self._cached_list = None
             return True
         return False
 
@@ -52,99 +68,88 @@ class SampleService(BaseService[SampleEntity, MockRepository]):
 
     def create_entity(self, name: str, value: int = 0) -> SampleEntity:
         """Create a new entity."""
-        entity_id = f"entity_{len(self.repository.list_all()) + 1}"
+        entity_id = f"entity_{self.repository.count() + 1}"
         entity = SampleEntity(id=entity_id, name=name, value=value)
         return self.repository.save(entity)
 
 
+@pytest.fixture
+def empty_repo() -> MockRepository:
+    """Empty repository for tests that mutate storage."""
+    return MockRepository()
+
+
+@pytest.fixture
+def service(empty_repo: MockRepository) -> SampleService:
+    """Service backed by the empty repository."""
+    return SampleService(empty_repo)
+
+
+@pytest.fixture(scope="module")
+def populated_repo() -> MockRepository:
+    """Repository pre-populated with five entities; must not be mutated."""
+    repo = MockRepository()
+    repo.save_many([_make_entity(i) for i in range(5)])
+    return repo
+
+
+@pytest.fixture(scope="module")
+def populated_service(populated_repo: MockRepository) -> SampleService:
+    """Service backed by the pre-populated repository; read-only use."""
+    return SampleService(populated_repo)
+
+
 class TestBaseService:
     """Tests for BaseService."""
 
-    def test_service_initialization(self):
+    def test_service_initialization(self, empty_repo: MockRepository, service: SampleService):
         """Test service initialization with repository."""
-        repo = MockRepository()
-        service = SampleService(repo)
-
-        assert service.repository is repo
+        assert service.repository is empty_repo
         assert service.logger is not None
 
-    def test_get_by_id_existing(self):
+    def test_get_by_id_existing(self, populated_service: SampleService):
         """Test getting existing entity by ID."""
-        repo = MockRepository()
-        entity = SampleEntity(id="1", name="test", value=42)
-        repo.save(entity)
-
-        service = SampleService(repo)
-        found = service.get_by_id("1")
+        found = populated_service.get_by_id("1")
 
         assert found.id == "1"
-        assert found.name == "test"
-        assert found.value == 42
+        assert found.name == "test1"
+        assert found.value == 1
 
-    def test_get_by_id_nonexistent_raises_error(self):
+    def test_get_by_id_nonexistent_raises_error(self, service: SampleService):
         """Test that getting non-existent entity raises ValueError."""
-        repo = MockRepository()
-        service = SampleService(repo)
-
         with pytest.raises(ValueError, match="not found"):
             service.get_by_id("nonexistent")
 
-    def test_list_all_empty(self):
+    def test_list_all_empty(self, service: SampleService):
         """Test listing all entities when empty."""
-        repo = MockRepository()
-        service = SampleService(repo)
+        assert service.list_all() == []
 
-        entities = service.list_all()
-        assert entities == []
-
-    def test_list_all_multiple(self):
+    def test_list_all_multiple(self, populated_service: SampleService):
         """Test listing all entities."""
-        repo = MockRepository()
-        entity1 = SampleEntity(id="1", name="test1", value=1)
-        entity2 = SampleEntity(id="2", name="test2", value=2)
-        repo.save(entity1)
-        repo.save(entity2)
-
-        service = SampleService(repo)
-        entities = service.list_all()
+        entities = populated_service.list_all()
 
-        assert len(entities) == 2
-        assert {e.id for e in entities} == {"1", "2"}
+        assert len(entities) == 5
+        assert {e.id for e in entities} == {"0", "1", "2", "3", "4"}
 
-    def test_delete_existing(self):
+    def test_delete_existing(self, empty_repo: MockRepository, service: SampleService):
         """Test deleting existing entity."""
-        repo = MockRepository()
-        entity = SampleEntity(id="1", name="test", value=42)
-        repo.save(entity)
+        empty_repo.save(SampleEntity(id="1", name="test", value=42))
 
-        service = SampleService(repo)
         deleted = service.delete("1")
 
         assert deleted is True
-        assert repo.find_by_id("1") is None
+        assert empty_repo.find_by_id("1") is None
 
-    def test_delete_nonexistent(self):
+    def test_delete_nonexistent(self, service: SampleService):
         """Test deleting non-existent entity returns False."""
-        repo = MockRepository()
-        service = SampleService(repo)
-
-        deleted = service.delete("nonexistent")
-        assert deleted is False
+        assert service.delete("nonexistent") is False
 
-    def test_exists_true(self):
+    def test_exists_true(self, populated_service: SampleService):
         """Test exists returns True for existing entity."""
-        repo = MockRepository()
-        entity = SampleEntity(id="1", name="test", value=42)
-        repo.save(entity)
+        assert populated_service.exists("1") is True
 
-        service = SampleService(repo)
-        assert service.exists("1") is True
-
-    def test_exists_false(self):
+    def test_exists_false(self, service: SampleService):
         """Test exists returns False for non-existent entity."""
-        repo = MockRepository()
-        service = SampleService(repo)
-
         assert service.exists("nonexistent") is False
 
     def test_exists_without_method_fallback(self):
@@ -161,22 +166,13 @@ class TestBaseService:
         repo.exists = Mock(return_value=True)
         assert service.exists("1") is True
 
-    def test_count_empty(self):
+    def test_count_empty(self, service: SampleService):
         """Test count when repository is empty."""
-        repo = MockRepository()
-        service = SampleService(repo)
-
         assert service.count() == 0
 
-    def test_count_multiple(self):
+    def test_count_multiple(self, populated_service: SampleService):
         """Test count with multiple entities."""
-        repo = MockRepository()
-        for i in range(5):
-            entity = SampleEntity(id=str(i), name=f"test{i}", value=i)
-            repo.save(entity)
-
-        service = SampleService(repo)
-        assert service.count() == 5
+        assert populated_service.count() == 5
 
     def test_count_without_method_fallback(self):
         """Test count works even if repository doesn't have count method."""
@@ -190,11 +186,8 @@ class TestBaseService:
         service = SampleService(repo)  # type: ignore
         assert service.count() == 2
 
-    def test_service_can_add_domain_methods(self):
+    def test_service_can_add_domain_methods(self, service: SampleService):
         """Test that service can add domain-specific methods."""
-        repo = MockRepository()
-        service = SampleService(repo)
-
         entity = service.create_entity("test", 42)
         assert entity.name == "test"
         assert entity.value == 42
@@ -203,3 +196,7 @@ class TestBaseService:
         found = service.get_by_id(entity.id)
         assert found.name == "test"
 
+        second = service.create_entity("other")
+        assert second.id != entity.id
+        assert service.list_all() == [entity, second]
+
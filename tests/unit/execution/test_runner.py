@@ -2,6 +2,7 @@
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+import threading
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -13,7 +14,7 @@ from hexswitch.execution.runner import (
 )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="class")
 @pytest.mark.fast
 class TestAsyncAdapterRunner:
     """Test AsyncAdapterRunner."""
@@ -21,12 +22,15 @@ class TestAsyncAdapterRunner:
     async def test_start_with_async_start_method(self):
         """Test starting adapter with async start_async method."""
         runner = AsyncAdapterRunner()
-        adapter = MagicMock()
-        adapter.start_async = AsyncMock(return_value=None)
+
+        class AsyncAdapter:
+            start_async = AsyncMock(return_value=None)
+
+        adapter = AsyncAdapter()
 
         await runner.start(adapter)
 
-        adapter.start_async.assert_called_once()
+        adapter.start_async.assert_awaited_once()
 
     async def test_start_with_sync_start_method(self):
         """Test starting adapter with sync start method."""
@@ -46,7 +50,11 @@ class TestAsyncAdapterRunner:
     async def test_start_without_start_method(self):
         """Test starting adapter without start method raises error."""
         runner = AsyncAdapterRunner()
-        adapter = MagicMock(spec=[])  # No methods
+
+        class NoMethodsAdapter:
+            pass
+
+        adapter = NoMethodsAdapter()
 
         with pytest.raises(ValueError, match="has no start method"):
             await runner.start(adapter)
@@ -54,12 +62,15 @@ class TestAsyncAdapterRunner:
     async def test_stop_with_async_stop_method(self):
         """Test stopping adapter with async stop_async method."""
         runner = AsyncAdapterRunner()
-        adapter = MagicMock()
-        adapter.stop_async = AsyncMock(return_value=None)
+
+        class AsyncAdapter:
+            stop_async = AsyncMock(return_value=None)
+
+        adapter = AsyncAdapter()
 
         await runner.stop(adapter)
 
-        adapter.stop_async.assert_called_once()
+        adapter.stop_async.assert_awaited_once()
 
     async def test_stop_with_sync_stop_method(self):
         """Test stopping adapter with sync stop method."""
@@ -76,148 +87,106 @@ class TestAsyncAdapterRunner:
         # Should complete without error
         assert True
 
-    async def test_stop_cancels_tasks(self):
-        """Test that stop cancels all running tasks."""
+    @pytest.mark.parametrize(
+        ("n_tasks", "task_kind"),
+        [
+            (1, "cancellable"),
+            (1, "swallows_cancel"),
+            (2, "cancellable"),
+            (2, "completed"),
+        ],
+    )
+    async def test_stop_settles_background_tasks(self, n_tasks: int, task_kind: str):
+        """Test that stop cancels pending tasks and waits for all of them to settle."""
         runner = AsyncAdapterRunner()
         adapter = MagicMock()
         adapter.stop_async = AsyncMock(return_value=None)
+        started = [asyncio.Event() for _ in range(n_tasks)]
 
-        # Create a task that will be cancelled
-        async def long_running_task():
+        async def background_task(event: asyncio.Event):
+            event.set()
+            if task_kind == "completed":
+                return
             try:
-                await asyncio.sleep(10)
+                await asyncio.Event().wait()  # Never set; only cancellation ends it
             except asyncio.CancelledError:
-                pass
+                if task_kind == "cancellable":
+                    raise
 
-        task = runner.run_in_background(long_running_task())
+        tasks = [runner.run_in_background(background_task(event)) for event in started]
+        # Barrier instead of a timed sleep: every task has entered its body
+        await asyncio.gather(*(event.wait() for event in started))
 
-        # Wait a bit to ensure task is running
-        await asyncio.sleep(0.01)
-
-        # Stop should cancel the task
         await runner.stop(adapter)
 
-        # Task should be cancelled
-        assert task.cancelled() or task.done()
-
-    async def test_stop_waits_for_tasks(self):
-        """Test that stop waits for tasks to complete."""
-        runner = AsyncAdapterRunner()
-        adapter = MagicMock()
-        adapter.stop_async = AsyncMock(return_value=None)
-
-        task_completed = False
-
-        async def quick_task():
-            nonlocal task_completed
-            await asyncio.sleep(0.01)
-            task_completed = True
-
-        task = runner.run_in_background(quick_task())
-
-        # Wait a bit to ensure task is running
-        await asyncio.sleep(0.005)
-
-        await runner.stop(adapter)
-
-        # Task should have completed (stop waits for tasks)
-        assert task_completed or task.done()
+        assert all(task.done() for task in tasks)
+        assert [task.cancelled() for task in tasks] == [task_kind == "cancellable"] * n_tasks
+        adapter.stop_async.assert_awaited_once()
 
     async def test_run_in_background(self):
         """Test running coroutine in background."""
         runner = AsyncAdapterRunner()
+        release = asyncio.Event()
 
         async def background_task():
-            await asyncio.sleep(0.01)
+            await release.wait()
             return "done"
 
         task = runner.run_in_background(background_task())
 
         assert isinstance(task, asyncio.Task)
         assert task in runner._tasks
+        assert not task.done()
 
-        # Wait for task to complete
+        # Let the task finish deterministically
+        release.set()
         result = await task
         assert result == "done"
 
-    async def test_stop_with_multiple_tasks(self):
-        """Test stopping with multiple background tasks."""
+    async def test_init_without_loop(self):
+        """Test initializing without loop uses current loop."""
+        # This test needs to run in an async context with an event loop
         runner = AsyncAdapterRunner()
-        adapter = MagicMock()
-        adapter.stop_async = AsyncMock(return_value=None)
-
-        task_results = []
 
-        async def task1():
-            await asyncio.sleep(0.01)
-            task_results.append(1)
+        assert runner.loop is asyncio.get_running_loop()
 
-        async def task2():
-            await asyncio.sleep(0.01)
-            task_results.append(2)
 
-        task1_handle = runner.run_in_background(task1())
-        task2_handle = runner.run_in_background(task2())
+@pytest.fixture
+def custom_loop():
+    """Create a standalone event loop without installing it as current."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
-        # Wait a bit to ensure tasks are running
-        await asyncio.sleep(0.005)
-
-        await runner.stop(adapter)
 
-        # Both tasks should have completed (stop waits for tasks)
-        # Tasks might complete before or during stop, so check both conditions
-        assert len(task_results) == 2 or (task1_handle.done() and task2_handle.done())
-        if len(task_results) >= 2:
-            assert 1 in task_results
-            assert 2 in task_results
+@pytest.mark.fast
+class TestAsyncAdapterRunnerLoopSelection:
+    """Test AsyncAdapterRunner loop selection outside a running loop."""
 
-    @pytest.mark.asyncio
-    async def test_init_with_custom_loop(self):
+    def test_init_with_custom_loop(self, custom_loop):
         """Test initializing with custom event loop."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            runner = AsyncAdapterRunner(loop=loop)
-
-            assert runner.loop == loop
-        finally:
-            loop.close()
-
-    @pytest.mark.asyncio
-    async def test_init_without_loop(self):
-        """Test initializing without loop uses current loop."""
-        # This test needs to run in an async context with an event loop
-        runner = AsyncAdapterRunner()
+        runner = AsyncAdapterRunner(loop=custom_loop)
 
-        assert runner.loop is not None
-        assert isinstance(runner.loop, asyncio.AbstractEventLoop)
+        assert runner.loop is custom_loop
 
-    def test_init_without_loop_no_event_loop(self):
+    def test_init_without_loop_no_event_loop(self, monkeypatch):
         """Test initializing without loop when no event loop exists creates new one."""
-        import threading
+        installed = []
 
-        def run_in_thread():
-            # This thread has no event loop - remove any existing loop
-            try:
-                loop = asyncio.get_event_loop()
-                if loop and not loop.is_closed():
-                    loop.close()
-            except RuntimeError:
-                pass
+        def no_current_loop():
+            raise RuntimeError("There is no current event loop")
 
-            # Clear the event loop for this thread
-            asyncio.set_event_loop(None)
+        # Simulate a thread without a loop and keep the new loop from becoming global state
+        monkeypatch.setattr(asyncio, "get_event_loop", no_current_loop)
+        monkeypatch.setattr(asyncio, "set_event_loop", installed.append)
 
-            # Now create runner - should create new loop
-            runner = AsyncAdapterRunner()
-            assert runner.loop is not None
+        runner = AsyncAdapterRunner()
+        try:
             assert isinstance(runner.loop, asyncio.AbstractEventLoop)
+            assert installed == [runner.loop]
+        finally:
             runner.loop.close()
 
-        thread = threading.Thread(target=run_in_thread)
-        thread.start()
-        thread.join()
-
 
 @pytest.mark.fast
 class TestBlockingAdapterRunner:
@@ -258,71 +227,73 @@ class TestBlockingAdapterRunner:
 
         adapter.stop.assert_called_once()
 
-    def test_shutdown_executor_wait(self):
-        """Test shutting down executor with wait=True."""
-        runner = BlockingAdapterRunner()
+    @pytest.mark.parametrize("wait", [True, False])
+    def test_shutdown_custom_executor(self, wait: bool):
+        """Test shutting down a custom executor with and without waiting."""
+        runner = BlockingAdapterRunner(executor=ThreadPoolExecutor(max_workers=1))
 
-        # Should not raise exception
-        runner.shutdown(wait=True)
+        runner.shutdown(wait=wait)
 
-        # Executor should be shut down
         assert runner.executor._shutdown
 
-    def test_shutdown_executor_no_wait(self):
-        """Test shutting down executor with wait=False."""
+    def test_shutdown_without_executor(self):
+        """Test that shutdown is a no-op when no executor is owned."""
         runner = BlockingAdapterRunner()
 
-        # Should not raise exception
-        runner.shutdown(wait=False)
-
-        # Executor should be shut down
-        assert runner.executor._shutdown
-
-    def test_init_with_custom_executor(self):
-        """Test initializing with custom executor."""
-        executor = ThreadPoolExecutor(max_workers=5)
-        runner = BlockingAdapterRunner(executor=executor)
-
-        assert runner.executor == executor
-
         runner.shutdown(wait=True)
 
-    def test_init_without_executor(self):
-        """Test initializing without executor creates new one."""
-        runner = BlockingAdapterRunner()
+        assert runner.executor is None
 
-        assert runner.executor is not None
-        assert isinstance(runner.executor, ThreadPoolExecutor)
+    @pytest.mark.parametrize("custom_executor", [True, False], ids=["custom", "default"])
+    def test_init_executor(self, custom_executor: bool):
+        """Test initializing with a custom executor or leaving the loop's default executor in use."""
+        executor = ThreadPoolExecutor(max_workers=5) if custom_executor else None
+        runner = BlockingAdapterRunner(executor=executor)
 
-        runner.shutdown(wait=True)
+        try:
+            assert runner.executor is executor
+        finally:
+            runner.shutdown(wait=True)
 
-    async def test_start_stores_future(self):
-        """Test that start stores future in _futures list."""
-        runner = BlockingAdapterRunner()
-        adapter = MagicMock()
-        adapter.start = MagicMock(return_value=None)
+    @pytest.mark.parametrize("custom_executor", [True, False], ids=["custom", "default"])
+    async def test_start_runs_off_loop_thread(self, custom_executor: bool):
+        """Test that start runs the blocking call outside the event loop thread."""
+        executor = ThreadPoolExecutor(max_workers=1) if custom_executor else None
+        runner = BlockingAdapterRunner(executor=executor)
+        loop_thread = threading.get_ident()
+        start_threads = []
 
-        initial_futures_count = len(runner._futures)
+        class BlockingAdapter:
+            def start(self):
+                start_threads.append(threading.get_ident())
 
-        await runner.start(adapter)
+        try:
+            await runner.start(BlockingAdapter())
+        finally:
+            runner.shutdown(wait=True)
 
-        assert len(runner._futures) == initial_futures_count + 1
+        assert len(start_threads) == 1
+        assert start_threads[0] != loop_thread
 
-    async def test_stop_with_multiple_futures(self):
-        """Test stopping with multiple futures."""
-        runner = BlockingAdapterRunner()
+    @pytest.mark.parametrize("n_starts", [1, 2])
+    async def test_custom_executor_receives_each_call(self, n_starts: int):
+        """Test that every start and the final stop are submitted to a custom executor."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit = MagicMock(wraps=executor.submit)
+        runner = BlockingAdapterRunner(executor=executor)
         adapter = MagicMock()
-        adapter.start = MagicMock(return_value=None)
-        adapter.stop = MagicMock(return_value=None)
-
-        # Start multiple times to create multiple futures
-        await runner.start(adapter)
-        await runner.start(adapter)
 
-        # Stop should handle all futures
-        await runner.stop(adapter)
+        try:
+            for _ in range(n_starts):
+                await runner.start(adapter)
+            # Stop should wait for all start futures before stopping
+            await runner.stop(adapter)
+        finally:
+            runner.shutdown(wait=True)
 
-        adapter.stop.assert_called_once()
+        assert adapter.start.call_count == n_starts
+        adapter.stop.assert_called_once_with()
+        assert executor.submit.call_count == n_starts + 1
 
 
 @pytest.mark.fast
@@ -2,26 +2,50 @@
 
 from unittest.mock import MagicMock
 
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
 import pytest
 
 from hexswitch.gui.routes import router
-from hexswitch.gui.server import GuiServer
 
 
-@pytest.fixture
-def app():
+def _create_app() -> FastAPI:
     """Create FastAPI app with GUI routes."""
-    from fastapi import FastAPI
-
     app = FastAPI()
     app.include_router(router)
     return app
 
 
+# Stateless app built once at import; tests that need app.state build their own
+APP = _create_app()
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create test client shared by tests that do not touch app state."""
+    from fastapi.testclient import TestClient
+
+    # Entering the client runs the ASGI lifespan once for the whole module
+    with TestClient(APP) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(app):
-    """Create test client."""
+def runtime_client():
+    """Create test client for a fresh app with a mock runtime in its state."""
+    from fastapi.testclient import TestClient
+
+    mock_runtime = MagicMock()
+    mock_inbound = MagicMock()
+    mock_inbound.name = "http"
+    mock_inbound._running = True
+    mock_outbound = MagicMock()
+    mock_outbound.name = "http_client"
+    mock_outbound._connected = True
+    mock_runtime.inbound_adapters = [mock_inbound]
+    mock_runtime.outbound_adapters = [mock_outbound]
+
+    app = _create_app()
+    app.state.runtime = mock_runtime
     return TestClient(app)
 
 
@@ -53,43 +77,18 @@ class TestGuiRoutes:
         assert isinstance(data["adapters"], list)
         assert len(data["adapters"]) == 0
 
-    def test_get_adapters_with_runtime(self, app, client) -> None:
+    def test_get_adapters_with_runtime(self, runtime_client) -> None:
         """Test /api/adapters endpoint with runtime."""
-        # Create mock runtime
-        mock_runtime = MagicMock()
-        mock_inbound = MagicMock()
-        mock_inbound.name = "http"
-        mock_inbound._running = True
-        mock_outbound = MagicMock()
-        mock_outbound.name = "http_client"
-        mock_outbound._connected = True
-        mock_runtime.inbound_adapters = [mock_inbound]
-        mock_runtime.outbound_adapters = [mock_outbound]
-
-        # Set runtime in app state
-        app.state.runtime = mock_runtime
-
-        response = client.get("/api/adapters")
+        response = runtime_client.get("/api/adapters")
         assert response.status_code == 200
         data = response.json()
         assert "adapters" in data
-        assert len(data["adapters"]) == 2
-
-        # Check inbound adapter
-        inbound_adapter = next(
-            (a for a in data["adapters"] if a["type"] == "inbound"), None
-        )
-        assert inbound_adapter is not None
-        assert inbound_adapter["name"] == "http"
-        assert inbound_adapter["running"] is True
-
-        # Check outbound adapter
-        outbound_adapter = next(
-            (a for a in data["adapters"] if a["type"] == "outbound"), None
-        )
-        assert outbound_adapter is not None
-        assert outbound_adapter["name"] == "http_client"
-        assert outbound_adapter["connected"] is True
+
+        # One pass: index adapters by (type, name) and compare their status flags
+        adapters = {(a["type"], a["name"]): a for a in data["adapters"]}
+        assert set(adapters) == {("inbound", "http"), ("outbound", "http_client")}
+        assert adapters[("inbound", "http")]["running"] is True
+        assert adapters[("outbound", "http_client")]["connected"] is True
 
     def test_get_metrics(self, client) -> None:
         """Test /api/metrics endpoint."""
@@ -107,57 +106,3 @@ class TestGuiRoutes:
         assert data["status"] == "healthy"
         assert "service" in data
 
-
-class TestGuiServer:
-    """Test GUI server."""
-
-    def test_init_disabled(self) -> None:
-        """Test GUI server initialization when disabled."""
-        config = {"enabled": False, "port": 8080}
-        server = GuiServer(config)
-        assert not server.enabled
-        assert server.port == 8080
-
-    def test_init_enabled(self) -> None:
-        """Test GUI server initialization when enabled."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
-        assert server.enabled
-        assert server.port == 8080
-
-    def test_init_default_port(self) -> None:
-        """Test GUI server with default port."""
-        config = {"enabled": True}
-        server = GuiServer(config)
-        assert server.port == 8080
-
-    def test_create_app(self) -> None:
-        """Test app creation."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
-        app = server._create_app()
-        assert app is not None
-        assert app.title == "HexSwitch GUI"
-
-    def test_create_app_with_runtime(self) -> None:
-        """Test app creation with runtime."""
-        config = {"enabled": True, "port": 8080}
-        mock_runtime = MagicMock()
-        server = GuiServer(config, runtime=mock_runtime)
-        app = server._create_app()
-        assert app.state.runtime == mock_runtime
-
-    def test_start_when_disabled(self) -> None:
-        """Test start when disabled."""
-        config = {"enabled": False, "port": 8080}
-        server = GuiServer(config)
-        server.start()  # Should not raise
-        assert not server._running
-
-    def test_stop_when_not_running(self) -> None:
-        """Test stop when not running."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
-        server.stop()  # Should not raise
-        assert not server._running
-
@@ -2,31 +2,28 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from hexswitch.gui.server import GuiServer
 
 
 class TestGuiServer:
     """Test GUI server."""
 
-    def test_init_disabled(self) -> None:
-        """Test GUI server initialization when disabled."""
-        config = {"enabled": False, "port": 8080}
-        server = GuiServer(config)
-        assert not server.enabled
-        assert server.port == 8080
-
-    def test_init_enabled(self) -> None:
-        """Test GUI server initialization when enabled."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
-        assert server.enabled
-        assert server.port == 8080
-
-    def test_init_default_port(self) -> None:
-        """Test GUI server with default port."""
-        config = {"enabled": True}
+    @pytest.mark.parametrize(
+        ("config", "expected_enabled", "expected_port"),
+        [
+            ({"enabled": False, "port": 8080}, False, 8080),
+            ({"enabled": True, "port": 8080}, True, 8080),
+            ({"enabled": True}, True, 8080),  # Default port
+        ],
+        ids=["disabled", "enabled", "default_port"],
+    )
+    def test_init(self, config: dict, expected_enabled: bool, expected_port: int) -> None:
+        """Test GUI server initialization from config."""
         server = GuiServer(config)
-        assert server.port == 8080
+        assert server.enabled is expected_enabled
+        assert server.port == expected_port
 
     def test_create_app(self) -> None:
         """Test app creation."""
@@ -1,109 +1,150 @@
 """Additional unit tests for GUI server to improve coverage."""
 
-import time
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
 from hexswitch.gui.server import GuiServer
 
+GUI_CONFIG = {"enabled": True, "port": 8080}
+
+# Attributes GuiServer.stop() touches; spec_set mocks reject anything else
+SERVER_ATTRS = ["should_exit", "serve"]
+LOOP_ATTRS = ["is_running", "is_closed", "call_soon_threadsafe", "create_task", "run_until_complete", "close", "stop"]
+THREAD_ATTRS = ["is_alive", "join"]
+
+# Captured before the start tests monkeypatch asyncio.new_event_loop
+_new_real_event_loop = asyncio.new_event_loop
+
+
+class _StubServer:
+    """Minimal stand-in for uvicorn.Server; stop() only sets should_exit."""
+
+    __slots__ = ("should_exit",)
+
+    def __init__(self) -> None:
+        self.should_exit = None
+
+
+class _BrokenLoop:
+    """Event loop stand-in whose state check fails."""
+
+    def is_running(self) -> bool:
+        raise RuntimeError("Loop error")
+
+
+@pytest.fixture(scope="module")
+def shared_server() -> GuiServer:
+    """Create one GuiServer for the whole module."""
+    return GuiServer(GUI_CONFIG)
+
+
+@pytest.fixture
+def real_loop():
+    """Create a real event loop that is closed after the test."""
+    loop = _new_real_event_loop()
+    yield loop
+    if not loop.is_closed():
+        loop.close()
+
+
+@pytest.fixture
+def server(shared_server: GuiServer):
+    """Provide the shared GuiServer and restore its initial state afterwards."""
+    initial_state = dict(vars(shared_server))
+    yield shared_server
+    vars(shared_server).clear()
+    vars(shared_server).update(initial_state)
+
 
 class TestGuiServerStart:
     """Test GuiServer.start() full lifecycle."""
 
-    def test_start_success(self) -> None:
+    @pytest.fixture(autouse=True)
+    def mock_server_class(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Patch uvicorn.Server to avoid actually starting a server."""
+        mock_server_class = MagicMock()
+        monkeypatch.setattr("hexswitch.gui.server.uvicorn.Server", mock_server_class)
+        return mock_server_class
+
+    @pytest.fixture(autouse=True)
+    def mock_new_loop(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Patch asyncio loop creation so start() never installs a real loop."""
+        mock_new_loop = MagicMock()
+        monkeypatch.setattr(asyncio, "new_event_loop", mock_new_loop)
+        monkeypatch.setattr(asyncio, "set_event_loop", MagicMock())
+        return mock_new_loop
+
+    def test_start_success(self, server: GuiServer, mock_new_loop: MagicMock) -> None:
         """Test successful server start."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
-
-        # Mock uvicorn to avoid actually starting server
-        with patch("hexswitch.gui.server.uvicorn.Server") as mock_server_class:
-            mock_server = MagicMock()
-            mock_server_class.return_value = mock_server
+        started = threading.Event()
+        mock_new_loop.return_value.run_forever.side_effect = started.set
 
-            # Mock asyncio module functions
-            with patch("asyncio.new_event_loop") as mock_new_loop, \
-                 patch("asyncio.set_event_loop") as mock_set_loop:
-                mock_loop = MagicMock()
-                mock_new_loop.return_value = mock_loop
-                mock_task = MagicMock()
-                mock_loop.create_task.return_value = mock_task
+        server.start()
 
-                server.start()
+        # Wait for the server thread to enter the loop instead of sleeping
+        assert started.wait(timeout=2.0)
 
-                # Give thread time to start
-                time.sleep(0.1)
-
-                assert server._running is True
-                assert server._app is not None
-                assert server._server is not None
+        assert server._running is True
+        assert server._app is not None
+        assert server._server is not None
 
-    def test_start_with_exception(self) -> None:
+    def test_start_with_exception(self, server: GuiServer, mock_server_class: MagicMock) -> None:
         """Test start() when exception occurs."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
+        mock_server_class.side_effect = Exception("Server creation failed")
+
+        with pytest.raises(RuntimeError, match="Failed to start GUI server"):
+            server.start()
+
+    def test_start_static_files_error(
+        self,
+        server: GuiServer,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_new_loop: MagicMock,
+        real_loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Test start() when static files mounting fails."""
+        # Mock os.path.exists to return True, but mount to fail
+        monkeypatch.setattr("os.path.exists", MagicMock(return_value=True))
+        mock_app = MagicMock()
+        # Make mount raise exception
+        mock_app.mount.side_effect = Exception("Mount failed")
+        monkeypatch.setattr(server, "_create_app", MagicMock(return_value=mock_app))
 
-        # Mock uvicorn to raise exception
-        with patch("hexswitch.gui.server.uvicorn.Server") as mock_server_class:
-            mock_server_class.side_effect = Exception("Server creation failed")
+        # Use real event loop instead of MagicMock
+        mock_new_loop.return_value = real_loop
+        mock_task = MagicMock()
+        real_loop.create_task = MagicMock(return_value=mock_task)
+        started = threading.Event()
+        real_loop.call_soon(started.set)
 
-            with pytest.raises(RuntimeError, match="Failed to start GUI server"):
-                server.start()
+        # Should not raise, just log warning
+        server.start()
+        assert started.wait(timeout=2.0)
 
-    def test_start_static_files_error(self) -> None:
-        """Test start() when static files mounting fails."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
+        # Server should still start
+        assert server._running is True
 
-        # Mock os.path.exists to return True, but mount to fail
-        with patch("os.path.exists", return_value=True):
-            with patch.object(server, "_create_app") as mock_create:
-                mock_app = MagicMock()
-                # Make mount raise exception
-                mock_app.mount.side_effect = Exception("Mount failed")
-                mock_create.return_value = mock_app
-
-                # Mock uvicorn
-                with patch("hexswitch.gui.server.uvicorn.Server") as mock_server_class:
-                    mock_server = MagicMock()
-                    mock_server_class.return_value = mock_server
-
-                    # Use real event loop instead of MagicMock
-                    with patch("asyncio.new_event_loop") as mock_new_loop, \
-                         patch("asyncio.set_event_loop") as mock_set_loop:
-                        import asyncio
-                        real_loop = asyncio.new_event_loop()
-                        mock_new_loop.return_value = real_loop
-                        mock_task = MagicMock()
-                        real_loop.create_task = MagicMock(return_value=mock_task)
-
-                        # Should not raise, just log warning
-                        server.start()
-                        time.sleep(0.1)
-
-                        # Server should still start
-                        assert server._running is True
-
-                        # Cleanup
-                        if not real_loop.is_closed():
-                            real_loop.close()
+        # Stop the loop's thread so the fixture can close the loop
+        real_loop.call_soon_threadsafe(real_loop.stop)
+        server._server_thread.join(timeout=5.0)
 
 
 class TestGuiServerStop:
     """Test GuiServer.stop() full lifecycle."""
 
-    def test_stop_success(self) -> None:
+    def test_stop_success(self, server: GuiServer) -> None:
         """Test successful server stop."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
         server._running = True
-        mock_server = MagicMock()
+        mock_server = Mock(spec_set=SERVER_ATTRS)
         server._server = mock_server
-        mock_loop = MagicMock()
+        mock_loop = Mock(spec_set=LOOP_ATTRS)
         mock_loop.is_running.return_value = False
         mock_loop.is_closed.return_value = False
         server._loop = mock_loop
-        server._server_thread = MagicMock()
+        server._server_thread = Mock(spec_set=THREAD_ATTRS)
         server._server_thread.is_alive.return_value = False
 
         server.stop()
@@ -111,16 +152,14 @@ class TestGuiServerStop:
         assert server._running is False
         assert mock_server.should_exit is True
 
-    def test_stop_with_running_loop(self) -> None:
+    def test_stop_with_running_loop(self, server: GuiServer) -> None:
         """Test stop() when event loop is running."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
         server._running = True
-        server._server = MagicMock()
-        mock_loop = MagicMock()
+        server._server = Mock(spec_set=SERVER_ATTRS)
+        mock_loop = Mock(spec_set=LOOP_ATTRS)
         mock_loop.is_running.return_value = True
         server._loop = mock_loop
-        server._server_thread = MagicMock()
+        server._server_thread = Mock(spec_set=THREAD_ATTRS)
         server._server_thread.is_alive.return_value = False
 
         server.stop()
@@ -128,15 +167,13 @@ class TestGuiServerStop:
         assert server._running is False
         mock_loop.call_soon_threadsafe.assert_called()
 
-    def test_stop_with_alive_thread(self) -> None:
+    def test_stop_with_alive_thread(self, server: GuiServer) -> None:
         """Test stop() when server thread is alive."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
         server._running = True
-        server._server = MagicMock()
-        server._loop = MagicMock()
+        server._server = Mock(spec_set=SERVER_ATTRS)
+        server._loop = Mock(spec_set=LOOP_ATTRS)
         server._loop.is_running.return_value = False
-        server._server_thread = MagicMock()
+        server._server_thread = Mock(spec_set=THREAD_ATTRS)
         server._server_thread.is_alive.return_value = True
 
         server.stop()
@@ -144,15 +181,11 @@ class TestGuiServerStop:
         assert server._running is False
         server._server_thread.join.assert_called_once_with(timeout=5.0)
 
-    def test_stop_with_exception(self) -> None:
+    def test_stop_with_exception(self, server: GuiServer) -> None:
         """Test stop() when exception occurs."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
         server._running = True
-        server._server = MagicMock()
-        server._server.should_exit = None  # Will cause AttributeError
-        server._loop = MagicMock()
-        server._loop.is_running.side_effect = Exception("Loop error")
+        server._server = _StubServer()
+        server._loop = _BrokenLoop()
         server._server_thread = None
 
         # Should not raise, just log error
@@ -169,29 +202,24 @@ class TestGuiServerStop:
 class TestGuiServerStaticFiles:
     """Test GUI server static files mounting."""
 
-    def test_create_app_with_static_files(self) -> None:
-        """Test app creation with static files directory."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
-
-        # Mock os.path.exists to return True
-        with patch("os.path.exists", return_value=True):
-            with patch("hexswitch.gui.server.StaticFiles") as mock_static:
-                app = server._create_app()
-
-                assert app is not None
-                # Should attempt to mount static files
-                mock_static.assert_called()
-
-    def test_create_app_without_static_files(self) -> None:
-        """Test app creation without static files directory."""
-        config = {"enabled": True, "port": 8080}
-        server = GuiServer(config)
-
-        # Mock os.path.exists to return False
-        with patch("os.path.exists", return_value=False):
-            app = server._create_app()
-
-            assert app is not None
-            # Should not raise if static dir doesn't exist
-
+    @pytest.mark.parametrize(
+        ("static_dir_exists", "expect_mount"),
+        [(True, True), (False, False)],
+        ids=["with_static_dir", "without_static_dir"],
+    )
+    def test_create_app_static_files(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        server: GuiServer,
+        static_dir_exists: bool,
+        expect_mount: bool,
+    ) -> None:
+        """Test that static files are mounted only when the static directory exists."""
+        monkeypatch.setattr("os.path.exists", lambda path: static_dir_exists)
+        mock_static = MagicMock()
+        monkeypatch.setattr("hexswitch.gui.server.StaticFiles", mock_static)
+
+        app = server._create_app()
+
+        assert app is not None
+        assert mock_static.called is expect_mount
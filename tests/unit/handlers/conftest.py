@@ -0,0 +1,36 @@
+"""Shared fixtures for handler and port tests."""
+
+import pytest
+
+from hexswitch.ports import PortRegistry, get_port_registry, reset_port_registry
+from hexswitch.shared.envelope import Envelope
+
+
+@pytest.fixture(scope="module")
+def module_port_registry() -> PortRegistry:
+    """Reset the global port registry once per test module."""
+    reset_port_registry()
+    return get_port_registry()
+
+
+@pytest.fixture
+def registry(module_port_registry: PortRegistry):
+    """Provide the global port registry and restore its ports after the test."""
+    saved_ports = dict(module_port_registry._ports)
+    saved_handlers = {name: list(p.handlers) for name, p in saved_ports.items()}
+    yield module_port_registry
+    for name, handlers in saved_handlers.items():
+        saved_ports[name].set_handlers(handlers)
+    module_port_registry._ports = saved_ports
+
+
+@pytest.fixture(scope="session")
+def get_envelope() -> Envelope:
+    """Provide a read-only GET request envelope."""
+    return Envelope(path="/test", method="GET")
+
+
+@pytest.fixture(scope="session")
+def metrics_envelope() -> Envelope:
+    """Provide a read-only GET /metrics request envelope."""
+    return Envelope(path="/metrics", method="GET")
@@ -1,5 +1,8 @@
 """Unit tests for handler helpers."""
 
+from typing import Any
+
+import pytest
 
 from hexswitch.shared.helpers import (
     extract_query_params,
@@ -8,61 +11,77 @@ from hexswitch.shared.helpers import (
     parse_request_body,
     prepare_request_data,
 )
-
-
-def test_parse_path_params():
+from hexswitch.shared.helpers.helpers import _compile_route_path
+
+
+@pytest.mark.parametrize(
+    ("path", "route_path", "expected"),
+    [
+        ("/orders/123", "/orders/:id", {"id": "123"}),
+        (
+            "/orders/123/items/456",
+            "/orders/:order_id/items/:item_id",
+            {"order_id": "123", "item_id": "456"},
+        ),
+        ("/orders/123", "/products/:id", {}),
+    ],
+    ids=["single", "nested", "no_match"],
+)
+def test_parse_path_params(path: str, route_path: str, expected: dict[str, str]):
     """Test parsing path parameters."""
-    params = parse_path_params("/orders/123", "/orders/:id")
-    assert params == {"id": "123"}
+    assert parse_path_params(path, route_path) == expected
 
-    params = parse_path_params("/orders/123/items/456", "/orders/:order_id/items/:item_id")
-    assert params == {"order_id": "123", "item_id": "456"}
 
+def test_parse_path_params_reuses_compiled_route():
+    """Test that a route pattern is compiled once and reused across requests."""
+    _compile_route_path.cache_clear()
 
-def test_parse_path_params_no_match():
-    """Test parsing path parameters with no match."""
-    params = parse_path_params("/orders/123", "/products/:id")
-    assert params == {}
-
-
-def test_parse_request_body():
-    """Test parsing request body."""
-    body = '{"key": "value"}'
-    result = parse_request_body(body)
-    assert result == {"key": "value"}
-
+    assert parse_path_params("/orders/1", "/orders/:id") == {"id": "1"}
+    assert parse_path_params("/orders/2", "/orders/:id") == {"id": "2"}
 
-def test_parse_request_body_empty():
-    """Test parsing empty request body."""
-    assert parse_request_body(None) is None
-    assert parse_request_body("") is None
+    info = _compile_route_path.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
 
 
-def test_parse_request_body_invalid_json():
-    """Test parsing invalid JSON."""
-    result = parse_request_body("invalid json")
-    assert result is None
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ('{"key": "value"}', {"key": "value"}),
+        (None, None),
+        ("", None),
+        ("invalid json", None),
+    ],
+    ids=["json", "none", "empty", "invalid_json"],
+)
+def test_parse_request_body(body: str | None, expected: dict | None):
+    """Test parsing request body."""
+    assert parse_request_body(body) == expected
 
 
-def test_format_response():
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (({"key": "value"},), {"key": "value"}),
+        (({"error": "Not found"}, 404), (404, {"error": "Not found"})),
+        (((404, {"error": "Not found"}),), (404, {"error": "Not found"})),
+    ],
+    ids=["default_status", "explicit_status", "already_tuple"],
+)
+def test_format_response(args: tuple[Any, ...], expected: Any):
     """Test formatting response."""
-    response = format_response({"key": "value"})
-    assert response == {"key": "value"}
-
-    response = format_response({"error": "Not found"}, 404)
-    assert response == (404, {"error": "Not found"})
+    assert format_response(*args) == expected
 
 
-def test_format_response_tuple():
-    """Test formatting response that's already a tuple."""
-    response = format_response((404, {"error": "Not found"}))
-    assert response == (404, {"error": "Not found"})
-
-
-def test_extract_query_params():
+@pytest.mark.parametrize(
+    ("query_params", "expected"),
+    [
+        ({"id": ["123"], "name": "test"}, {"id": "123", "name": "test"}),
+    ],
+    ids=["list_and_scalar"],
+)
+def test_extract_query_params(query_params: dict[str, Any], expected: dict[str, str]):
     """Test extracting query parameters."""
-    params = extract_query_params({"id": ["123"], "name": "test"})
-    assert params == {"id": "123", "name": "test"}
+    assert extract_query_params(query_params) == expected
 
 
 def test_prepare_request_data():
@@ -82,4 +101,3 @@ def test_prepare_request_data():
     assert data["query_params"] == {"filter": "active"}
     assert data["headers"]["Content-Type"] == "application/json"
     assert data["body"] == {"key": "value"}
-
@@ -1,8 +1,12 @@
 """Unit tests for HandlerLoader."""
 
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 import sys
+import threading
 from types import ModuleType
-from unittest.mock import MagicMock, patch
+from typing import Callable
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -10,191 +14,154 @@ from hexswitch.handlers.loader import HandlerError, HandlerLoader
 from hexswitch.ports.exceptions import PortNotFoundError
 from hexswitch.shared.envelope import Envelope
 
+THREAD_COUNT = 10
 
-def test_handler_loader_resolves_import_path():
-    """Test handler loader resolves import path."""
-    loader = HandlerLoader()
-
-    # Create test module
-    test_module = ModuleType("test_handler_module")
-
-    def test_handler(envelope: Envelope) -> Envelope:
-        return Envelope.success({"test": "data"})
-
-    test_module.test_handler = test_handler
-    sys.modules["test_handler_module"] = test_module
-
-    try:
-        # Resolve handler
-        handler = loader.resolve("test_handler_module:test_handler")
-
-        # Verify handler was loaded
-        assert handler is not None
-        assert callable(handler)
-        assert handler == test_handler
+HANDLER_MODULE_NAME = "loader_test_handlers"
+HANDLER_MODULE_SOURCE = """\
+from hexswitch.shared.envelope import Envelope
 
-        # Verify handler is cached
-        cached_handler = loader.get_cached("test_handler_module:test_handler")
-        assert cached_handler == handler
 
-    finally:
-        if "test_handler_module" in sys.modules:
-            del sys.modules["test_handler_module"]
+def handle(envelope: Envelope) -> Envelope:
+    return Envelope.success({"test": "data"})
 
 
-def test_handler_loader_resolves_port_name():
-    """Test handler loader resolves port name."""
-    loader = HandlerLoader()
+def valid(envelope: Envelope) -> Envelope:
+    return envelope
 
-    # Mock port registry
-    mock_port = MagicMock()
-    mock_handler = MagicMock(return_value=Envelope.success({"port": "handler"}))
-    mock_port.handlers = [mock_handler]
 
-    with patch("hexswitch.handlers.loader.get_port_registry") as mock_registry:
-        mock_registry.return_value.get_handler.return_value = mock_handler
+def invalid():  # No parameters
+    return None
+"""
 
-        # Resolve handler from port
-        handler = loader.resolve("test_port")
 
-        # Verify handler was loaded
-        assert handler is not None
-        assert callable(handler)
-        assert handler == mock_handler
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Create one thread pool shared by the module's concurrency tests."""
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as pool:
+        yield pool
 
-        # Verify handler is cached
-        cached_handler = loader.get_cached("test_port")
-        assert cached_handler == handler
 
+@pytest.fixture(scope="module")
+def loader() -> HandlerLoader:
+    """Create one HandlerLoader shared by the module's tests."""
+    return HandlerLoader()
 
-def test_handler_loader_caches_handlers():
-    """Test handler loader caches handlers."""
-    loader = HandlerLoader()
 
-    # Create test module
-    test_module = ModuleType("test_cache_module")
+@pytest.fixture(autouse=True)
+def _clear_loader_cache(loader: HandlerLoader):
+    """Start every test with an empty handler cache."""
+    loader.clear_cache()
 
-    call_count = 0
-
-    def test_handler(envelope: Envelope) -> Envelope:
-        nonlocal call_count
-        call_count += 1
-        return Envelope.success({"count": call_count})
-
-    test_module.test_handler = test_handler
-    sys.modules["test_cache_module"] = test_module
 
+@pytest.fixture(scope="module")
+def handler_module(tmp_path_factory: pytest.TempPathFactory) -> ModuleType:
+    """Write a real handler module once and make it importable for the module's tests."""
+    module_dir = tmp_path_factory.mktemp("handlers")
+    (module_dir / f"{HANDLER_MODULE_NAME}.py").write_text(HANDLER_MODULE_SOURCE)
+    sys.path.insert(0, str(module_dir))
     try:
-        # Resolve handler first time
-        handler1 = loader.resolve("test_cache_module:test_handler")
-
-        # Resolve handler second time (should use cache)
-        handler2 = loader.resolve("test_cache_module:test_handler")
-
-        # Verify same handler instance
-        assert handler1 is handler2
-
-        # Verify cache was used (importlib.import_module should only be called once)
-        # This is implicit - if cache wasn't used, we'd see different behavior
-
+        yield importlib.import_module(HANDLER_MODULE_NAME)
     finally:
-        if "test_cache_module" in sys.modules:
-            del sys.modules["test_cache_module"]
-
-
-def test_handler_loader_validates_signature():
-    """Test handler loader validates signature."""
-    loader = HandlerLoader()
-
-    # Create test module with valid handler
-    test_module = ModuleType("test_signature_module")
+        sys.path.remove(str(module_dir))
+        sys.modules.pop(HANDLER_MODULE_NAME, None)
 
-    def valid_handler(envelope: Envelope) -> Envelope:
-        return envelope
 
-    def invalid_handler():  # No parameters
-        return None
-
-    test_module.valid = valid_handler
-    test_module.invalid = invalid_handler
-    sys.modules["test_signature_module"] = test_module
-
-    try:
-        # Valid handler should work
-        handler = loader.resolve("test_signature_module:valid")
-        assert handler is not None
+def test_handler_loader_resolves_import_path(loader: HandlerLoader, handler_module: ModuleType):
+    """Test handler loader resolves import path."""
+    # Resolve handler
+    handler = loader.resolve(f"{HANDLER_MODULE_NAME}:handle")
 
-        # Invalid handler should still work (signature validation is lenient)
-        # The validation is more of a warning than a hard error
-        handler2 = loader.resolve("test_signature_module:invalid")
-        assert handler2 is not None
+    # Verify handler was loaded
+    assert handler is not None
+    assert callable(handler)
+    assert handler is handler_module.handle
 
-    finally:
-        if "test_signature_module" in sys.modules:
-            del sys.modules["test_signature_module"]
+    # Verify handler is cached
+    cached_handler = loader.get_cached(f"{HANDLER_MODULE_NAME}:handle")
+    assert cached_handler is handler
 
 
-def test_handler_loader_invalid_path():
-    """Test handler loader error handling for invalid paths."""
-    loader = HandlerLoader()
+@pytest.mark.parametrize("method", ["resolve", "load_from_port"])
+def test_handler_loader_loads_from_port(
+    loader: HandlerLoader, monkeypatch: pytest.MonkeyPatch, method: str
+):
+    """Test handler loader resolves a port name through the port registry."""
+    mock_handler = MagicMock(return_value=Envelope.success({"port": "handler"}))
+    mock_registry = MagicMock()
+    mock_registry.get_handler.return_value = mock_handler
+    monkeypatch.setattr("hexswitch.handlers.loader.get_port_registry", lambda: mock_registry)
 
-    # Test invalid format (no colon)
-    with pytest.raises(HandlerError, match="Invalid handler path"):
-        loader.resolve("invalid.path")
+    handler = getattr(loader, method)("test_port")
 
-    # Test non-existent module
-    with pytest.raises(HandlerError, match="Failed to import module"):
-        loader.resolve("nonexistent.module:function")
+    # Verify handler was loaded
+    assert handler is not None
+    assert callable(handler)
+    assert handler == mock_handler
 
-    # Test non-existent function
-    test_module = ModuleType("test_nonexistent_module")
-    sys.modules["test_nonexistent_module"] = test_module
+    # Verify handler is cached
+    assert loader.get_cached("test_port") == handler
 
-    try:
-        with pytest.raises(HandlerError, match="does not have attribute"):
-            loader.resolve("test_nonexistent_module:nonexistent_function")
-    finally:
-        if "test_nonexistent_module" in sys.modules:
-            del sys.modules["test_nonexistent_module"]
 
+def test_handler_loader_caches_handlers(loader: HandlerLoader, handler_module: ModuleType):
+    """Test handler loader caches handlers."""
+    # Resolve handler first time
+    handler1 = loader.resolve(f"{HANDLER_MODULE_NAME}:handle")
 
-def test_handler_loader_load_from_port():
-    """Test handler loader load_from_port method."""
-    loader = HandlerLoader()
+    # Resolve handler second time (should use cache)
+    handler2 = loader.resolve(f"{HANDLER_MODULE_NAME}:handle")
 
-    # Mock port registry
-    mock_port = MagicMock()
-    mock_handler = MagicMock(return_value=Envelope.success({"port": "handler"}))
-    mock_port.handlers = [mock_handler]
+    # Verify same handler instance
+    assert handler1 is handler2
 
-    with patch("hexswitch.handlers.loader.get_port_registry") as mock_registry:
-        mock_registry.return_value.get_handler.return_value = mock_handler
 
-        # Load handler from port
-        handler = loader.load_from_port("test_port")
+def test_handler_loader_validates_signature(loader: HandlerLoader, handler_module: ModuleType):
+    """Test handler loader validates signature."""
+    # Valid handler should work
+    handler = loader.resolve(f"{HANDLER_MODULE_NAME}:valid")
+    assert handler is not None
+
+    # Invalid handler should still work (signature validation is lenient)
+    # The validation is more of a warning than a hard error
+    handler2 = loader.resolve(f"{HANDLER_MODULE_NAME}:invalid")
+    assert handler2 is not None
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_message"),
+    [
+        ("invalid.path", "Invalid handler path"),
+        ("nonexistent.module:function", "Failed to import module"),
+        (f"{HANDLER_MODULE_NAME}:nonexistent_function", "does not have attribute"),
+    ],
+    ids=["no_colon", "missing_module", "missing_attribute"],
+)
+def test_handler_loader_invalid_path(
+    loader: HandlerLoader, handler_module: ModuleType, path: str, expected_message: str
+):
+    """Test handler loader error handling for invalid paths."""
+    with pytest.raises(HandlerError) as exc_info:
+        loader.resolve(path)
 
-        # Verify handler was loaded
-        assert handler is not None
-        assert callable(handler)
-        assert handler == mock_handler
+    assert expected_message in str(exc_info.value)
 
 
-def test_handler_loader_load_from_port_not_found():
+def test_handler_loader_load_from_port_not_found(
+    loader: HandlerLoader, monkeypatch: pytest.MonkeyPatch
+):
     """Test handler loader error handling for non-existent port."""
-    loader = HandlerLoader()
-
     # Mock port registry to raise PortNotFoundError
-    with patch("hexswitch.handlers.loader.get_port_registry") as mock_registry:
-        mock_registry.return_value.get_handler.side_effect = PortNotFoundError("Port not found")
+    mock_registry = MagicMock()
+    mock_registry.get_handler.side_effect = PortNotFoundError("Port not found")
+    monkeypatch.setattr("hexswitch.handlers.loader.get_port_registry", lambda: mock_registry)
 
-        with pytest.raises(HandlerError, match="Port 'nonexistent_port' not found"):
-            loader.load_from_port("nonexistent_port")
+    with pytest.raises(HandlerError) as exc_info:
+        loader.load_from_port("nonexistent_port")
 
+    assert "Port 'nonexistent_port' not found" in str(exc_info.value)
 
-def test_handler_loader_cache_handler():
-    """Test handler loader cache_handler method."""
-    loader = HandlerLoader()
 
+def test_handler_loader_cache_handler(loader: HandlerLoader):
+    """Test handler loader cache_handler method."""
     # Create mock handler
     mock_handler = MagicMock()
 
@@ -206,76 +173,33 @@ def test_handler_loader_cache_handler():
     assert cached_handler == mock_handler
 
 
-def test_handler_loader_clear_cache():
+def test_handler_loader_clear_cache(loader: HandlerLoader, handler_module: ModuleType):
     """Test handler loader clear_cache method."""
-    loader = HandlerLoader()
-
-    # Create test module
-    test_module = ModuleType("test_clear_module")
-
-    def test_handler(envelope: Envelope) -> Envelope:
-        return envelope
-
-    test_module.test = test_handler
-    sys.modules["test_clear_module"] = test_module
+    # Resolve and cache handler
+    handler = loader.resolve(f"{HANDLER_MODULE_NAME}:valid")
+    assert loader.get_cached(f"{HANDLER_MODULE_NAME}:valid") == handler
 
-    try:
-        # Resolve and cache handler
-        handler = loader.resolve("test_clear_module:test")
-        assert loader.get_cached("test_clear_module:test") == handler
-
-        # Clear cache
-        loader.clear_cache()
+    # Clear cache
+    loader.clear_cache()
 
-        # Verify cache is empty
-        assert loader.get_cached("test_clear_module:test") is None
-
-    finally:
-        if "test_clear_module" in sys.modules:
-            del sys.modules["test_clear_module"]
+    # Verify cache is empty
+    assert loader.get_cached(f"{HANDLER_MODULE_NAME}:valid") is None
 
 
-def test_handler_loader_thread_safety():
+def test_handler_loader_thread_safety(
+    loader: HandlerLoader, handler_module: ModuleType, thread_pool: ThreadPoolExecutor
+):
     """Test that handler loader is thread-safe."""
-    import threading
-
-    loader = HandlerLoader()
-
-    # Create test module
-    test_module = ModuleType("test_thread_module")
-
-    def test_handler(envelope: Envelope) -> Envelope:
-        return envelope
+    # Release every worker at once to maximize contention on the loader
+    barrier = threading.Barrier(THREAD_COUNT)
 
-    test_module.test = test_handler
-    sys.modules["test_thread_module"] = test_module
+    def resolve_handler() -> Callable:
+        barrier.wait(timeout=5.0)
+        return loader.resolve(f"{HANDLER_MODULE_NAME}:valid")
 
-    results = []
-
-    def resolve_handler():
-        try:
-            handler = loader.resolve("test_thread_module:test")
-            results.append(handler)
-        except Exception as e:
-            results.append(f"Error: {e}")
-
-    try:
-        # Create multiple threads
-        threads = []
-        for _ in range(10):
-            t = threading.Thread(target=resolve_handler)
-            threads.append(t)
-            t.start()
-
-        # Wait for all threads to complete
-        for t in threads:
-            t.join()
-
-        # Verify all threads got the same handler
-        assert len(results) == 10
-        assert all(r == test_handler for r in results)
-
-    finally:
-        if "test_thread_module" in sys.modules:
-            del sys.modules["test_thread_module"]
+    futures = [thread_pool.submit(resolve_handler) for _ in range(THREAD_COUNT)]
+    results = [future.result(timeout=5.0) for future in futures]
 
+    # Verify all threads got the very same handler object
+    assert len({id(r) for r in results}) == 1
+    assert results[0] is handler_module.valid
@@ -1,76 +1,56 @@
 """Unit tests for metrics handler."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from hexswitch.handlers.metrics import metrics_handler
 from hexswitch.shared.envelope import Envelope
 
 
-class TestMetricsHandler:
-    """Test metrics handler."""
-
-    def test_metrics_handler_returns_prometheus_format(self) -> None:
-        """Test metrics handler returns Prometheus format."""
-        envelope = Envelope(path="/metrics", method="GET")
-
-        with patch(
-            "hexswitch.handlers.metrics.get_global_metrics_collector"
-        ) as mock_collector:
-            mock_metrics = MagicMock()
-            mock_metrics.get_all_metrics.return_value = {
-                "counters": {"test_counter": 10},
-                "gauges": {"test_gauge": 5},
-                "histograms": {},
-            }
-            mock_collector.return_value = mock_metrics
-
-            response = metrics_handler(envelope)
-
-            assert response.status_code == 200
-            assert "metrics" in response.data
-            metrics_text = response.data["metrics"]
-            assert isinstance(metrics_text, str)
-            assert "test_counter" in metrics_text or "#" in metrics_text
-
-    def test_metrics_handler_with_empty_metrics(self) -> None:
-        """Test metrics handler with empty metrics."""
-        envelope = Envelope(path="/metrics", method="GET")
+@pytest.fixture
+def metrics_collector(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the global metrics collector seen by the metrics handler."""
+    collector = MagicMock()
+    monkeypatch.setattr(
+        "hexswitch.handlers.metrics.get_global_metrics_collector", lambda: collector
+    )
+    return collector
 
-        with patch(
-            "hexswitch.handlers.metrics.get_global_metrics_collector"
-        ) as mock_collector:
-            mock_metrics = MagicMock()
-            mock_metrics.get_all_metrics.return_value = {
-                "counters": {},
-                "gauges": {},
-                "histograms": {},
-            }
-            mock_collector.return_value = mock_metrics
 
-            response = metrics_handler(envelope)
-
-            assert response.status_code == 200
-            assert "metrics" in response.data
-
-    def test_metrics_handler_with_labeled_metrics(self) -> None:
-        """Test metrics handler with labeled metrics."""
-        envelope = Envelope(path="/metrics", method="GET")
-
-        with patch(
-            "hexswitch.handlers.metrics.get_global_metrics_collector"
-        ) as mock_collector:
-            mock_metrics = MagicMock()
-            mock_metrics.get_all_metrics.return_value = {
-                "counters": {"test_counter{method=GET}": 5},
-                "gauges": {},
-                "histograms": {},
-            }
-            mock_collector.return_value = mock_metrics
-
-            response = metrics_handler(envelope)
-
-            assert response.status_code == 200
-            assert "metrics" in response.data
-            metrics_text = response.data["metrics"]
-            assert "test_counter" in metrics_text
+class TestMetricsHandler:
+    """Test metrics handler."""
 
+    @pytest.mark.parametrize(
+        ("metrics", "expected_substr"),
+        [
+            (
+                {"counters": {"test_counter": 10}, "gauges": {"test_gauge": 5}, "histograms": {}},
+                "test_counter",
+            ),
+            ({"counters": {}, "gauges": {}, "histograms": {}}, None),
+            (
+                {"counters": {"test_counter{method=GET}": 5}, "gauges": {}, "histograms": {}},
+                "test_counter",
+            ),
+        ],
+        ids=["prometheus_format", "empty_metrics", "labeled_metrics"],
+    )
+    def test_metrics_handler_returns_prometheus_text(
+        self,
+        metrics_envelope: Envelope,
+        metrics_collector: MagicMock,
+        metrics: dict,
+        expected_substr: str | None,
+    ) -> None:
+        """Test metrics handler renders collector metrics as Prometheus text."""
+        metrics_collector.get_all_metrics.return_value = metrics
+
+        response = metrics_handler(metrics_envelope)
+
+        assert response.status_code == 200
+        assert "metrics" in response.data
+        metrics_text = response.data["metrics"]
+        assert isinstance(metrics_text, str)
+        if expected_substr is not None:
+            assert expected_substr in metrics_text
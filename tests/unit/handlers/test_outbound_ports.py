@@ -4,70 +4,49 @@ Note: Outbound ports are now handled directly through the port registry's route(
 with outbound adapters. These tests verify that outbound adapters can be used with ports.
 """
 
+from typing import Any
 
-from hexswitch.ports import get_port_registry, reset_port_registry
 from hexswitch.shared.envelope import Envelope
 
 
-class TestOutboundPortIntegration:
-    """Test outbound adapter integration with ports."""
+class MockOutboundAdapter:
+    """Outbound adapter stub that records every envelope it is asked to send."""
 
-    def test_outbound_adapter_can_be_used_with_port(self) -> None:
-        """Test that outbound adapters can route through ports."""
-        reset_port_registry()
-        registry = get_port_registry()
+    def __init__(self, response_data: dict[str, Any]):
+        self.name = "test_adapter"
+        self.response_data = response_data
+        self.received_envelopes: list[Envelope] = []
 
-        # Create mock adapter
-        received_envelopes = []
+    def request(self, envelope: Envelope) -> Envelope:
+        self.received_envelopes.append(envelope)
+        return Envelope.success(self.response_data)
 
-        class MockOutboundAdapter:
-            def __init__(self):
-                self.name = "test_adapter"
 
-            def request(self, envelope: Envelope) -> Envelope:
-                received_envelopes.append(envelope)
-                return Envelope.success({"result": "ok"})
+class TestOutboundPortIntegration:
+    """Test outbound adapter integration with ports."""
 
-        adapter = MockOutboundAdapter()
+    def test_outbound_adapter_can_be_used_with_port(self, registry, get_envelope: Envelope) -> None:
+        """Test that outbound adapters can route through ports."""
+        adapter = MockOutboundAdapter({"result": "ok"})
 
         # Register handler that uses the adapter
-        def handler(envelope: Envelope) -> Envelope:
-            return adapter.request(envelope)
-
-        registry.register_handler("test_outbound_port", handler)
+        registry.register_handler("test_outbound_port", adapter.request)
 
         # Route envelope through port
-        request_envelope = Envelope(path="/test", method="GET")
-        results = registry.route("test_outbound_port", request_envelope)
+        results = registry.route("test_outbound_port", get_envelope)
 
         # Verify adapter was called
-        assert len(received_envelopes) == 1
-        assert received_envelopes[0].path == "/test"
+        assert len(adapter.received_envelopes) == 1
+        assert adapter.received_envelopes[0].path == "/test"
         assert len(results) == 1
         assert results[0].status_code == 200
         assert results[0].data == {"result": "ok"}
 
-    def test_outbound_adapter_passes_envelope_correctly(self) -> None:
+    def test_outbound_adapter_passes_envelope_correctly(self, registry) -> None:
         """Test that outbound adapter receives correct envelope."""
-        reset_port_registry()
-        registry = get_port_registry()
+        adapter = MockOutboundAdapter({"received": True})
 
-        received_envelopes = []
-
-        class MockOutboundAdapter:
-            def __init__(self):
-                self.name = "test_adapter"
-
-            def request(self, envelope: Envelope) -> Envelope:
-                received_envelopes.append(envelope)
-                return Envelope.success({"received": True})
-
-        adapter = MockOutboundAdapter()
-
-        def handler(envelope: Envelope) -> Envelope:
-            return adapter.request(envelope)
-
-        registry.register_handler("test_port", handler)
+        registry.register_handler("test_port", adapter.request)
 
         # Call port with complex envelope
         request_envelope = Envelope(
@@ -78,9 +57,8 @@ class TestOutboundPortIntegration:
         results = registry.route("test_port", request_envelope)
 
         # Verify envelope was passed correctly
-        assert len(received_envelopes) == 1
-        assert received_envelopes[0].path == "/test"
-        assert received_envelopes[0].method == "POST"
-        assert received_envelopes[0].body == {"key": "value"}
+        assert len(adapter.received_envelopes) == 1
+        assert adapter.received_envelopes[0].path == "/test"
+        assert adapter.received_envelopes[0].method == "POST"
+        assert adapter.received_envelopes[0].body == {"key": "value"}
         assert results[0].status_code == 200
-
@@ -1,17 +1,13 @@
 """Unit tests for port decorator."""
 
 
-from hexswitch.ports import get_port_registry, port, reset_port_registry
+from hexswitch.ports import port
 from hexswitch.shared.envelope import Envelope
 
 
-def test_port_decorator_registers():
+def test_port_decorator_registers(registry):
     """Test that @port decorator registers function."""
-    reset_port_registry()
-    registry = get_port_registry()
-
-    # Use unique name to avoid conflicts
-    port_name = f"test_port_unique_{id(registry)}"
+    port_name = "test_port_unique"
 
     @port(name=port_name)
     def test_handler(envelope: Envelope) -> Envelope:
@@ -25,7 +21,7 @@ def test_port_decorator_registers():
     assert test_handler._port_name == port_name
 
 
-def test_port_decorator_preserves_function():
+def test_port_decorator_preserves_function(registry):
     """Test that @port decorator preserves function behavior."""
     @port(name="test_port2")
     def test_handler(envelope: Envelope) -> Envelope:
@@ -37,11 +33,8 @@ def test_port_decorator_preserves_function():
     assert result.data == {"result": "test"}
 
 
-def test_port_decorator_multiple_handlers():
+def test_port_decorator_multiple_handlers(registry):
     """Test that multiple handlers can bind to the same port."""
-    reset_port_registry()
-    registry = get_port_registry()
-
     @port(name="shared_port")
     def handler1(envelope: Envelope) -> Envelope:
         return Envelope.success({"result": "ok"})
@@ -56,4 +49,3 @@ def test_port_decorator_multiple_handlers():
     assert len(port_obj.handlers) == 2
     assert handler1 in port_obj.handlers
     assert handler2 in port_obj.handlers
-
@@ -1,8 +1,10 @@
 """Unit tests for port registry."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from hexswitch.ports import PortNotFoundError, PortRegistry, get_port_registry
+from hexswitch.ports import PortNotFoundError, PortRegistry, get_port_registry, reset_port_registry
 from hexswitch.shared.envelope import Envelope
 
 
@@ -89,3 +91,29 @@ def test_get_port_registry_singleton():
     registry2 = get_port_registry()
     assert registry1 is registry2
 
+
+def test_get_port_registry_skips_lock_once_created(monkeypatch):
+    """Test that an existing global registry is returned without taking the lock."""
+    from hexswitch.ports import registry as registry_module
+
+    registry = get_port_registry()
+    lock = MagicMock()
+    monkeypatch.setattr(registry_module, "_registry_lock", lock)
+
+    assert get_port_registry() is registry
+    lock.__enter__.assert_not_called()
+
+
+def test_reset_port_registry_creates_new_instance(monkeypatch):
+    """Test that resetting the global registry yields a fresh instance on next access."""
+    from hexswitch.ports import registry as registry_module
+
+    # Keep the shared global registry intact for the rest of the session
+    monkeypatch.setattr(registry_module, "_global_registry", registry_module._global_registry)
+    before = get_port_registry()
+
+    reset_port_registry()
+
+    after = get_port_registry()
+    assert after is not before
+    assert after is get_port_registry()
@@ -1,8 +1,11 @@
 """Pro-level unit tests for observability system."""
 
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import time
 
+import pytest
+
 from hexswitch.shared.observability import (
     Counter,
     Gauge,
@@ -12,41 +15,46 @@ from hexswitch.shared.observability import (
     start_span,
 )
 
+THREAD_COUNT = 10
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Create one thread pool shared by the module's concurrency tests."""
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as pool:
+        yield pool
+
 
 def test_counter_basic() -> None:
     """Test basic counter operations."""
     counter = Counter("test_counter")
-    # OpenTelemetry doesn't expose current value directly
     assert counter.get() == 0.0
 
     counter.inc()
-    # Counter increments are recorded but not directly readable
-    assert counter.get() == 0.0
+    assert counter.get() == 1.0
 
     counter.inc(5)
-    assert counter.get() == 0.0
+    assert counter.get() == 6.0
 
-    counter.reset()  # Warning logged but no-op
+    counter.reset()
     assert counter.get() == 0.0
 
 
-def test_counter_thread_safety() -> None:
+def test_counter_thread_safety(thread_pool: ThreadPoolExecutor) -> None:
     """Test counter thread safety."""
     counter = Counter("test_counter")
+    # Release every worker at once so the increments actually contend
+    barrier = threading.Barrier(THREAD_COUNT)
 
-    def increment():
+    def increment(_: int) -> None:
+        barrier.wait(timeout=5.0)
         for _ in range(100):
             counter.inc()
 
-    threads = [threading.Thread(target=increment) for _ in range(10)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    list(thread_pool.map(increment, range(THREAD_COUNT)))
 
-    # OpenTelemetry doesn't expose current value, but increments are thread-safe
-    # We just verify no exceptions occurred
-    assert counter.get() == 0.0
+    # Every increment from every thread is accounted for
+    assert counter.get() == 1000.0
 
 
 def test_gauge_basic() -> None:
@@ -89,6 +97,39 @@ def test_histogram_empty() -> None:
     assert stats["sum"] == 0.0
 
 
+def test_histogram_thread_safety(thread_pool: ThreadPoolExecutor) -> None:
+    """Test histogram statistics combine observations from all threads."""
+    histogram = Histogram("test_histogram")
+    barrier = threading.Barrier(THREAD_COUNT)
+
+    def observe(offset: int) -> None:
+        barrier.wait(timeout=5.0)
+        for i in range(100):
+            histogram.observe(float(offset * 100 + i))
+
+    list(thread_pool.map(observe, range(THREAD_COUNT)))
+
+    stats = histogram.get()
+    assert stats["count"] == 1000
+    assert stats["sum"] == sum(range(1000))
+    assert stats["min"] == 0.0
+    assert stats["max"] == 999.0
+
+
+def test_histogram_reset() -> None:
+    """Test histogram reset clears statistics."""
+    histogram = Histogram("test_histogram")
+    histogram.observe(10.0)
+
+    histogram.reset()
+    assert histogram.get()["count"] == 0
+
+    histogram.observe(5.0)
+    stats = histogram.get()
+    assert stats["count"] == 1
+    assert stats["min"] == stats["max"] == 5.0
+
+
 def test_metrics_collector() -> None:
     """Test metrics collector."""
     collector = create_metrics_collector()
@@ -139,6 +180,18 @@ def test_span_basic() -> None:
     assert span_dict["name"] == "test_span"
 
 
+def test_span_ids_match_otel_context() -> None:
+    """Test span IDs are the hex form of the OpenTelemetry span context, formatted once."""
+    tracer = create_tracer("test_service")
+    span = tracer.start_span("test_span")
+    context = span._span.get_span_context()
+
+    assert span.trace_id == format(context.trace_id, "032x")
+    assert span.span_id == format(context.span_id, "016x")
+    assert span.trace_id is span.trace_id
+    span.finish()
+
+
 def test_span_tags() -> None:
     """Test span tags."""
     tracer = create_tracer("test_service")
@@ -191,6 +244,16 @@ def test_tracer_clear() -> None:
     assert len(tracer.get_spans()) == 0
 
 
+def test_tracer_keeps_most_recent_spans() -> None:
+    """Test tracer drops the oldest spans once max_spans is reached."""
+    tracer = create_tracer("test_service", max_spans=2)
+    tracer.start_span("operation1")
+    tracer.start_span("operation2")
+    tracer.start_span("operation3")
+
+    assert [span.name for span in tracer.get_spans()] == ["operation2", "operation3"]
+
+
 def test_start_span_global() -> None:
     """Test global span creation."""
     span = start_span("test_operation")
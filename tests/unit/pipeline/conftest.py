@@ -0,0 +1,46 @@
+"""Shared fixtures for pipeline tests."""
+
+from typing import Any, Awaitable, Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from hexswitch.shared.envelope import Envelope
+
+
+@pytest.fixture(scope="session")
+def counting_handler() -> Callable[[Envelope], Callable[[Envelope], Awaitable[Envelope]]]:
+    """Provide a factory for async handlers that always return ``response``.
+
+    Every envelope a handler receives is appended to its ``calls`` attribute.
+    """
+
+    def make(response: Envelope) -> Callable[[Envelope], Awaitable[Envelope]]:
+        calls: list[Envelope] = []
+
+        async def handler(envelope: Envelope) -> Envelope:
+            calls.append(envelope)
+            return response
+
+        handler.calls = calls  # type: ignore[attr-defined]
+        return handler
+
+    return make
+
+
+@pytest.fixture
+def mock_runtime_factory(counting_handler: Callable[[Envelope], Callable]) -> Callable[..., MagicMock]:
+    """Provide a factory for mock runtimes accepted by Pipeline.
+
+    The runtime's handler loader resolves every port to ``handler`` (a handler
+    returning an empty success envelope by default) and its config holds
+    ``ports`` as the per-port settings.
+    """
+
+    def make(handler: Callable | None = None, ports: dict[str, Any] | None = None) -> MagicMock:
+        runtime = MagicMock()
+        runtime.handler_loader.resolve.return_value = handler or counting_handler(Envelope.success({}))
+        runtime.config = {"ports": ports or {}}
+        return runtime
+
+    return make
@@ -0,0 +1,39 @@
+"""Shared fixtures for pipeline middleware tests."""
+
+from typing import Any, Awaitable, Callable
+
+import pytest
+
+from hexswitch.pipeline.pipeline import PipelineContext
+from hexswitch.shared.envelope import Envelope
+
+
+@pytest.fixture(scope="session")
+def envelope_factory() -> Callable[..., Envelope]:
+    """Provide a factory for GET /test request envelopes.
+
+    Keyword arguments override the template fields. Every call builds a fresh
+    Envelope, so tests never share mutable fields such as ``metadata``.
+    """
+    template: dict[str, Any] = {"path": "/test", "method": "GET"}
+
+    def make(**overrides: Any) -> Envelope:
+        return Envelope(**{**template, **overrides})
+
+    return make
+
+
+@pytest.fixture
+def passthrough_next() -> Callable[[PipelineContext], Awaitable[PipelineContext]]:
+    """Provide a next function that returns its context unchanged.
+
+    Every context it receives is appended to its ``calls`` attribute.
+    """
+    calls: list[PipelineContext] = []
+
+    async def next_func(ctx: PipelineContext) -> PipelineContext:
+        calls.append(ctx)
+        return ctx
+
+    next_func.calls = calls  # type: ignore[attr-defined]
+    return next_func
@@ -6,15 +6,14 @@ import pytest
 
 from hexswitch.pipeline.middleware.backpressure import BackpressureMiddleware
 from hexswitch.pipeline.pipeline import PipelineContext
-from hexswitch.shared.envelope import Envelope
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_disabled():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_disabled(envelope_factory):
     """Test backpressure middleware when disabled."""
     middleware = BackpressureMiddleware({"enabled": False})
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
+    ctx = PipelineContext(envelope=envelope_factory())
 
     async def next_func(ctx: PipelineContext) -> PipelineContext:
         return ctx
@@ -24,8 +23,8 @@ async def test_backpressure_middleware_disabled():
     assert result == ctx
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_fail_fast():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_fail_fast(envelope_factory):
     """Test backpressure middleware with fail_fast strategy."""
     middleware = BackpressureMiddleware(
         {
@@ -35,23 +34,22 @@ async def test_backpressure_middleware_fail_fast():
         }
     )
 
-    ctx1 = PipelineContext(envelope=Envelope(path="/test1", method="GET"))
-    ctx2 = PipelineContext(envelope=Envelope(path="/test2", method="GET"))
+    ctx1 = PipelineContext(envelope=envelope_factory(path="/test1"))
+    ctx2 = PipelineContext(envelope=envelope_factory(path="/test2"))
 
-    async def slow_next(ctx: PipelineContext) -> PipelineContext:
-        await asyncio.sleep(0.1)
+    async def next_func(ctx: PipelineContext) -> PipelineContext:
         return ctx
 
     # First request should succeed
-    result1 = await middleware(ctx1, slow_next)
+    result1 = await middleware(ctx1, next_func)
     assert result1.envelope.error_message is None
 
     # Second request should be rejected if semaphore is locked
     # (This test is simplified - in practice, we'd need to test concurrent access)
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_queue():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_queue(envelope_factory):
     """Test backpressure middleware with queue strategy."""
     middleware = BackpressureMiddleware(
         {
@@ -62,7 +60,7 @@ async def test_backpressure_middleware_queue():
         }
     )
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
+    ctx = PipelineContext(envelope=envelope_factory())
 
     async def next_func(ctx: PipelineContext) -> PipelineContext:
         return ctx
@@ -72,8 +70,8 @@ async def test_backpressure_middleware_queue():
     assert result == ctx
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_fail_fast_rejection():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_fail_fast_rejection(envelope_factory):
     """Test backpressure middleware with fail_fast strategy when semaphore is full."""
     middleware = BackpressureMiddleware(
         {
@@ -83,18 +81,21 @@ async def test_backpressure_middleware_fail_fast_rejection():
         }
     )
 
-    ctx1 = PipelineContext(envelope=Envelope(path="/test1", method="GET"), port_name="test_port")
-    ctx2 = PipelineContext(envelope=Envelope(path="/test2", method="GET"), port_name="test_port")
+    ctx1 = PipelineContext(envelope=envelope_factory(path="/test1"), port_name="test_port")
+    ctx2 = PipelineContext(envelope=envelope_factory(path="/test2"), port_name="test_port")
+
+    # Handlers hold the semaphore until the test opens the gate
+    gate = asyncio.Event()
 
     async def slow_next(ctx: PipelineContext) -> PipelineContext:
-        await asyncio.sleep(0.1)
+        await gate.wait()
         return ctx
 
     # Start first request (will hold semaphore)
     task1 = asyncio.create_task(middleware(ctx1, slow_next))
 
-    # Wait a bit to ensure first request acquires semaphore
-    await asyncio.sleep(0.01)
+    # One loop tick lets the first request acquire the semaphore
+    await asyncio.sleep(0)
 
     # Second request should be rejected immediately
     result2 = await middleware(ctx2, slow_next)
@@ -103,12 +104,13 @@ async def test_backpressure_middleware_fail_fast_rejection():
     assert "503" in str(result2.envelope.status_code) or result2.envelope.status_code == 503
     assert result2.metadata.get("backpressure_rejected") is True
 
-    # Wait for first request to complete
+    # Release the first request and wait for it to complete
+    gate.set()
     await task1
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_queue_full():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_queue_full(envelope_factory):
     """Test backpressure middleware with queue strategy when queue is full."""
     middleware = BackpressureMiddleware(
         {
@@ -120,21 +122,24 @@ async def test_backpressure_middleware_queue_full():
     )
 
     # Fill the queue by starting a slow request
-    ctx1 = PipelineContext(envelope=Envelope(path="/test1", method="GET"), port_name="test_port")
-    ctx2 = PipelineContext(envelope=Envelope(path="/test2", method="GET"), port_name="test_port")
-    ctx3 = PipelineContext(envelope=Envelope(path="/test3", method="GET"), port_name="test_port")
+    ctx1 = PipelineContext(envelope=envelope_factory(path="/test1"), port_name="test_port")
+    ctx2 = PipelineContext(envelope=envelope_factory(path="/test2"), port_name="test_port")
+    ctx3 = PipelineContext(envelope=envelope_factory(path="/test3"), port_name="test_port")
+
+    # Handlers hold the semaphore until the test opens the gate
+    gate = asyncio.Event()
 
     async def slow_next(ctx: PipelineContext) -> PipelineContext:
-        await asyncio.sleep(0.1)
+        await gate.wait()
         return ctx
 
     # Start first request (will hold semaphore)
     task1 = asyncio.create_task(middleware(ctx1, slow_next))
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
     # Second request should be queued
     task2 = asyncio.create_task(middleware(ctx2, slow_next))
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
     # Third request should be rejected (queue full)
     result3 = await middleware(ctx3, slow_next)
@@ -143,13 +148,14 @@ async def test_backpressure_middleware_queue_full():
     assert "503" in str(result3.envelope.status_code) or result3.envelope.status_code == 503
     assert result3.metadata.get("backpressure_rejected") is True
 
-    # Wait for requests to complete
+    # Release the held requests and wait for them to complete
+    gate.set()
     await task1
     await task2
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_drop_strategy():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_drop_strategy(envelope_factory):
     """Test backpressure middleware with drop strategy."""
     middleware = BackpressureMiddleware(
         {
@@ -159,16 +165,19 @@ async def test_backpressure_middleware_drop_strategy():
         }
     )
 
-    ctx1 = PipelineContext(envelope=Envelope(path="/test1", method="GET"), port_name="test_port")
-    ctx2 = PipelineContext(envelope=Envelope(path="/test2", method="GET"), port_name="test_port")
+    ctx1 = PipelineContext(envelope=envelope_factory(path="/test1"), port_name="test_port")
+    ctx2 = PipelineContext(envelope=envelope_factory(path="/test2"), port_name="test_port")
+
+    # Handlers hold the semaphore until the test opens the gate
+    gate = asyncio.Event()
 
     async def slow_next(ctx: PipelineContext) -> PipelineContext:
-        await asyncio.sleep(0.1)
+        await gate.wait()
         return ctx
 
     # Start first request (will hold semaphore)
     task1 = asyncio.create_task(middleware(ctx1, slow_next))
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
     # Second request should be dropped when semaphore is full
     result2 = await middleware(ctx2, slow_next)
@@ -176,12 +185,13 @@ async def test_backpressure_middleware_drop_strategy():
     assert result2.envelope.error_message is not None
     assert result2.metadata.get("backpressure_dropped") is True
 
-    # Wait for first request to complete
+    # Release the first request and wait for it to complete
+    gate.set()
     await task1
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_unknown_strategy():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_unknown_strategy(envelope_factory):
     """Test backpressure middleware with unknown strategy."""
     middleware = BackpressureMiddleware(
         {
@@ -191,7 +201,7 @@ async def test_backpressure_middleware_unknown_strategy():
         }
     )
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
+    ctx = PipelineContext(envelope=envelope_factory())
 
     async def next_func(ctx: PipelineContext) -> PipelineContext:
         return ctx
@@ -201,13 +211,13 @@ async def test_backpressure_middleware_unknown_strategy():
     assert result == ctx
 
 
-@pytest.mark.asyncio
-async def test_backpressure_middleware_no_semaphore():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_backpressure_middleware_no_semaphore(envelope_factory):
     """Test backpressure middleware when semaphore is not initialized."""
     middleware = BackpressureMiddleware({"enabled": False})
     middleware._semaphore = None  # Simulate no semaphore
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
+    ctx = PipelineContext(envelope=envelope_factory())
 
     async def next_func(ctx: PipelineContext) -> PipelineContext:
         return ctx
@@ -216,3 +226,36 @@ async def test_backpressure_middleware_no_semaphore():
     assert result == ctx
 
 
+@pytest.mark.parametrize(
+    ("policy", "expected_impl"),
+    [
+        ({"enabled": False, "rejection_strategy": "queue"}, "_run_passthrough"),
+        ({"enabled": True, "rejection_strategy": "fail_fast"}, "_run_fail_fast"),
+        ({"enabled": True, "rejection_strategy": "queue"}, "_run_queue"),
+        ({"enabled": True, "rejection_strategy": "drop"}, "_run_drop"),
+        ({"enabled": True, "rejection_strategy": "unknown_strategy"}, "_run_unknown"),
+    ],
+)
+def test_backpressure_middleware_binds_strategy_at_init(policy, expected_impl):
+    """Test that the strategy runner is chosen once when the middleware is created."""
+    middleware = BackpressureMiddleware(policy)
+
+    assert middleware._impl == getattr(middleware, expected_impl)
+
+
+def test_backpressure_middleware_rebinds_strategy_on_change():
+    """Test that changing the configuration re-selects the strategy runner."""
+    middleware = BackpressureMiddleware({"enabled": False, "rejection_strategy": "fail_fast"})
+
+    middleware.enabled = True
+    assert middleware._impl == middleware._run_fail_fast
+    assert middleware._semaphore is not None
+    assert middleware._queue is None
+
+    middleware.rejection_strategy = "queue"
+    assert middleware._impl == middleware._run_queue
+    assert middleware._queue is not None
+
+    middleware.enabled = False
+    assert middleware._impl == middleware._run_passthrough
+    assert middleware._semaphore is None
@@ -1,6 +1,6 @@
 """Unit tests for RetryMiddleware."""
 
-from unittest.mock import AsyncMock
+from typing import Callable
 
 import pytest
 
@@ -8,254 +8,144 @@ from hexswitch.pipeline.middleware.retry import RetryMiddleware
 from hexswitch.pipeline.pipeline import PipelineContext
 from hexswitch.shared.envelope import Envelope
 
+# Shared successful response; the retry middleware never mutates the envelopes next returns
+OK_ENVELOPE = Envelope.success({"result": "ok"})
 
-@pytest.mark.asyncio
-async def test_retry_middleware_disabled():
-    """Test retry middleware when disabled."""
-    middleware = RetryMiddleware({"enabled": False})
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
-    next_func = AsyncMock(return_value=ctx)
+@pytest.fixture
+def recorded_delays(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace the retry backoff sleep with a virtual clock that records each delay."""
+    delays: list[float] = []
 
-    result = await middleware(ctx, next_func)
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
 
-    assert result == ctx
-    next_func.assert_called_once()
+    monkeypatch.setattr("hexswitch.pipeline.middleware.retry.asyncio.sleep", fake_sleep)
+    return delays
 
 
-@pytest.mark.asyncio
-async def test_retry_middleware_success_first_attempt():
-    """Test retry middleware with successful first attempt."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "max_attempts": 3,
-            "initial_delay": 0.1,
-            "retryable_errors": ["500"],
-        }
-    )
+@pytest.mark.asyncio(loop_scope="module")
+async def test_retry_middleware_disabled(envelope_factory, passthrough_next):
+    """Test retry middleware when disabled."""
+    middleware = RetryMiddleware({"enabled": False})
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
-    next_func = AsyncMock(return_value=ctx)
+    ctx = PipelineContext(envelope=envelope_factory())
 
-    result = await middleware(ctx, next_func)
+    result = await middleware(ctx, passthrough_next)
 
     assert result == ctx
-    next_func.assert_called_once()
-
+    assert passthrough_next.calls == [ctx]
 
-@pytest.mark.asyncio
-async def test_retry_middleware_retries_on_retryable_error():
-    """Test retry middleware retries on retryable error."""
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_retry_middleware_success_first_attempt(envelope_factory, passthrough_next):
+    """Test retry middleware with successful first attempt."""
     middleware = RetryMiddleware(
         {
             "enabled": True,
             "max_attempts": 3,
-            "initial_delay": 0.01,
-            "retryable_errors": ["500"],
-        }
-    )
-
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
-    error_ctx = PipelineContext(
-        envelope=Envelope.error(500, "Internal Server Error")
-    )
-    success_ctx = PipelineContext(envelope=Envelope.success({"result": "ok"}))
-
-    call_count = 0
-
-    async def next_func(ctx: PipelineContext) -> PipelineContext:
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            return error_ctx
-        return success_ctx
-
-    result = await middleware(ctx, next_func)
-
-    assert call_count == 2
-    assert result.envelope.data == {"result": "ok"}
-
-
-@pytest.mark.asyncio
-async def test_retry_middleware_max_attempts():
-    """Test retry middleware respects max attempts."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "max_attempts": 2,
-            "initial_delay": 0.01,
+            "initial_delay": 0.1,
             "retryable_errors": ["500"],
         }
     )
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
-    error_ctx = PipelineContext(
-        envelope=Envelope.error(500, "Internal Server Error")
-    )
-
-    call_count = 0
-
-    async def next_func(ctx: PipelineContext) -> PipelineContext:
-        nonlocal call_count
-        call_count += 1
-        return error_ctx
-
-    result = await middleware(ctx, next_func)
-
-    assert call_count == 2
-    assert result.envelope.error_message is not None
-
-
-@pytest.mark.asyncio
-async def test_retry_middleware_non_retryable_error():
-    """Test retry middleware doesn't retry non-retryable errors."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "max_attempts": 3,
-            "initial_delay": 0.01,
-            "retryable_errors": ["500", "503"],
-        }
-    )
-
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
-    error_ctx = PipelineContext(
-        envelope=Envelope.error(400, "Bad Request")
-    )
-
-    call_count = 0
-
-    async def next_func(ctx: PipelineContext) -> PipelineContext:
-        nonlocal call_count
-        call_count += 1
-        return error_ctx
-
-    result = await middleware(ctx, next_func)
-
-    assert call_count == 1  # Should not retry
-    assert result.envelope.error_message is not None
-
-
-@pytest.mark.asyncio
-async def test_retry_middleware_error_message_match():
-    """Test retry middleware retries based on error message."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "max_attempts": 2,
-            "initial_delay": 0.01,
-            "retryable_errors": ["timeout", "503"],
-        }
-    )
-
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"))
-    error_ctx = PipelineContext(
-        envelope=Envelope(path="/test", method="GET", status_code=200)
-    )
-    error_ctx.envelope.error_message = "Connection timeout occurred"
-
-    call_count = 0
-
-    async def next_func(ctx: PipelineContext) -> PipelineContext:
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            return error_ctx
-        return PipelineContext(envelope=Envelope.success({"result": "ok"}))
+    ctx = PipelineContext(envelope=envelope_factory())
 
-    result = await middleware(ctx, next_func)
+    result = await middleware(ctx, passthrough_next)
 
-    assert call_count == 2
-    assert result.envelope.data == {"result": "ok"}
+    assert result == ctx
+    assert passthrough_next.calls == [ctx]
 
 
-@pytest.mark.asyncio
-async def test_retry_middleware_exception_retryable():
-    """Test retry middleware retries on retryable exceptions."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "max_attempts": 2,
-            "initial_delay": 0.01,
-            "retryable_errors": ["timeout", "connection"],
-        }
-    )
+def _make_next(outcomes: list[Envelope | Exception], calls: list[PipelineContext]) -> Callable:
+    """Build a next function that plays back outcomes, repeating the last one.
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"), port_name="test_port")
+    Args:
+        outcomes: Envelope to return or exception to raise, one per attempt.
+        calls: List that records the context of every call.
 
-    call_count = 0
+    Returns:
+        Coroutine function usable as the middleware's next.
+    """
 
     async def next_func(ctx: PipelineContext) -> PipelineContext:
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            raise ConnectionError("Connection timeout")
-        return PipelineContext(envelope=Envelope.success({"result": "ok"}))
-
-    result = await middleware(ctx, next_func)
-
-    assert call_count == 2
-    assert result.envelope.data == {"result": "ok"}
-
-
-@pytest.mark.asyncio
-async def test_retry_middleware_exception_non_retryable():
-    """Test retry middleware doesn't retry non-retryable exceptions."""
+        outcome = outcomes[min(len(calls), len(outcomes) - 1)]
+        calls.append(ctx)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return PipelineContext(envelope=outcome)
+
+    return next_func
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    ("max_attempts", "retryable_errors", "outcomes", "expected_calls", "expected"),
+    [
+        pytest.param(
+            3, ["500"], [Envelope.error(500, "Internal Server Error"), OK_ENVELOPE], 2, {"result": "ok"},
+            id="retries_on_retryable_error",
+        ),
+        pytest.param(2, ["500"], [Envelope.error(500, "Internal Server Error")], 2, None, id="max_attempts"),
+        pytest.param(3, ["500", "503"], [Envelope.error(400, "Bad Request")], 1, None, id="non_retryable_error"),
+        pytest.param(
+            2, ["timeout", "503"],
+            [Envelope(path="/test", method="GET", error_message="Connection timeout occurred"), OK_ENVELOPE],
+            2, {"result": "ok"},
+            id="error_message_match",
+        ),
+        pytest.param(
+            2, ["timeout", "connection"], [ConnectionError("Connection timeout"), OK_ENVELOPE], 2, {"result": "ok"},
+            id="exception_retryable",
+        ),
+        pytest.param(3, ["timeout", "503"], [ValueError("Invalid input")], 1, ValueError, id="exception_non_retryable"),
+        pytest.param(2, ["timeout"], [TimeoutError("Connection timeout")], 2, TimeoutError, id="exception_max_attempts"),
+    ],
+)
+async def test_retry_middleware_outcomes(
+    envelope_factory,
+    recorded_delays: list[float],
+    max_attempts: int,
+    retryable_errors: list[str],
+    outcomes: list[Envelope | Exception],
+    expected_calls: int,
+    expected: dict | type[Exception] | None,
+):
+    """Test retry middleware retries only retryable failures, up to max_attempts.
+
+    ``expected`` is the final response data, ``None`` for a final error
+    response, or the exception type that must propagate.
+    """
     middleware = RetryMiddleware(
         {
             "enabled": True,
-            "max_attempts": 3,
+            "max_attempts": max_attempts,
             "initial_delay": 0.01,
-            "retryable_errors": ["timeout", "503"],
+            "retryable_errors": retryable_errors,
         }
     )
-
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"), port_name="test_port")
-
-    call_count = 0
-
-    async def next_func(ctx: PipelineContext) -> PipelineContext:
-        nonlocal call_count
-        call_count += 1
-        raise ValueError("Invalid input")
-
-    with pytest.raises(ValueError):
-        await middleware(ctx, next_func)
-
-    assert call_count == 1  # Should not retry
-
-
-@pytest.mark.asyncio
-async def test_retry_middleware_exception_max_attempts():
-    """Test retry middleware respects max attempts for exceptions."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "max_attempts": 2,
-            "initial_delay": 0.01,
-            "retryable_errors": ["timeout"],
-        }
-    )
-
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"), port_name="test_port")
-
-    call_count = 0
-
-    async def next_func(ctx: PipelineContext) -> PipelineContext:
-        nonlocal call_count
-        call_count += 1
-        raise TimeoutError("Connection timeout")
-
-    with pytest.raises(TimeoutError):
-        await middleware(ctx, next_func)
-
-    assert call_count == 2
-
-
-@pytest.mark.asyncio
-async def test_retry_middleware_exponential_backoff():
+    ctx = PipelineContext(envelope=envelope_factory(), port_name="test_port")
+    calls: list[PipelineContext] = []
+    next_func = _make_next(outcomes, calls)
+
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            await middleware(ctx, next_func)
+    else:
+        result = await middleware(ctx, next_func)
+        if expected is None:
+            assert result.envelope.error_message is not None
+        else:
+            assert result.envelope.data == expected
+
+    assert len(calls) == expected_calls
+    # One backoff wait between consecutive attempts
+    assert len(recorded_delays) == expected_calls - 1
+
+
+@pytest.mark.fast
+@pytest.mark.asyncio(loop_scope="module")
+async def test_retry_middleware_exponential_backoff(envelope_factory, recorded_delays: list[float]):
     """Test retry middleware uses exponential backoff."""
     middleware = RetryMiddleware(
         {
@@ -268,34 +158,31 @@ async def test_retry_middleware_exponential_backoff():
         }
     )
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"), port_name="test_port")
+    ctx = PipelineContext(envelope=envelope_factory(), port_name="test_port")
     error_ctx = PipelineContext(
         envelope=Envelope.error(500, "Internal Server Error")
     )
 
     call_count = 0
-    delays = []
 
     async def next_func(ctx: PipelineContext) -> PipelineContext:
         nonlocal call_count
         call_count += 1
         if call_count < 3:
             return error_ctx
-        return PipelineContext(envelope=Envelope.success({"result": "ok"}))
+        return PipelineContext(envelope=OK_ENVELOPE)
 
-    import time
-    start = time.time()
     result = await middleware(ctx, next_func)
-    elapsed = time.time() - start
 
     assert call_count == 3
-    # Should have waited: 0.05 + 0.1 = 0.15 seconds (approximately)
-    assert elapsed >= 0.14  # Allow some margin
+    # Should have waited 0.05s, then 0.1s
+    assert recorded_delays == [pytest.approx(0.05), pytest.approx(0.1)]
     assert result.envelope.data == {"result": "ok"}
 
 
-@pytest.mark.asyncio
-async def test_retry_middleware_max_delay_cap():
+@pytest.mark.fast
+@pytest.mark.asyncio(loop_scope="module")
+async def test_retry_middleware_max_delay_cap(envelope_factory, recorded_delays: list[float]):
     """Test retry middleware respects max_delay cap."""
     middleware = RetryMiddleware(
         {
@@ -308,7 +195,7 @@ async def test_retry_middleware_max_delay_cap():
         }
     )
 
-    ctx = PipelineContext(envelope=Envelope(path="/test", method="GET"), port_name="test_port")
+    ctx = PipelineContext(envelope=envelope_factory(), port_name="test_port")
     error_ctx = PipelineContext(
         envelope=Envelope.error(500, "Internal Server Error")
     )
@@ -320,63 +207,50 @@ async def test_retry_middleware_max_delay_cap():
         call_count += 1
         if call_count < 3:
             return error_ctx
-        return PipelineContext(envelope=Envelope.success({"result": "ok"}))
+        return PipelineContext(envelope=OK_ENVELOPE)
 
-    import time
-    start = time.time()
     result = await middleware(ctx, next_func)
-    elapsed = time.time() - start
 
     assert call_count == 3
-    # Should have waited: 0.1 + 0.2 (capped) = 0.3 seconds (approximately)
-    assert 0.25 <= elapsed <= 0.5  # Allow margin
+    # Should have waited 0.1s, then 0.2s (1.0s capped by max_delay)
+    assert recorded_delays == [0.1, 0.2]
     assert result.envelope.data == {"result": "ok"}
 
 
-@pytest.mark.asyncio
-async def test_retry_middleware_is_retryable_status_code():
-    """Test _is_retryable method with status code."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "retryable_errors": ["500", "502", "503"],
-        }
-    )
+@pytest.fixture(scope="module")
+def status_middleware() -> RetryMiddleware:
+    """Create one RetryMiddleware retrying on 5xx status codes for the module."""
+    return RetryMiddleware({"enabled": True, "retryable_errors": ["500", "502", "503"]})
 
-    ctx1 = PipelineContext(envelope=Envelope.error(500, "Error"))
-    assert middleware._is_retryable(ctx1) is True
 
-    ctx2 = PipelineContext(envelope=Envelope.error(400, "Bad Request"))
-    assert middleware._is_retryable(ctx2) is False
+@pytest.fixture(scope="module")
+def message_middleware() -> RetryMiddleware:
+    """Create one RetryMiddleware retrying on timeout/connection messages for the module."""
+    return RetryMiddleware({"enabled": True, "retryable_errors": ["timeout", "connection"]})
 
-    ctx3 = PipelineContext(envelope=Envelope.error(503, "Service Unavailable"))
-    assert middleware._is_retryable(ctx3) is True
 
+@pytest.mark.parametrize(("status", "expected"), [(500, True), (400, False), (503, True)])
+def test_retry_middleware_is_retryable_status_code(status_middleware: RetryMiddleware, status: int, expected: bool):
+    """Test _is_retryable method with status code."""
+    ctx = PipelineContext(envelope=Envelope.error(status, "Error"))
 
-@pytest.mark.asyncio
-async def test_retry_middleware_is_retryable_error_message():
-    """Test _is_retryable method with error message."""
-    middleware = RetryMiddleware(
-        {
-            "enabled": True,
-            "retryable_errors": ["timeout", "connection"],
-        }
-    )
+    assert status_middleware._is_retryable(ctx) is expected
 
-    ctx1 = PipelineContext(envelope=Envelope(path="/test", method="GET", status_code=200))
-    ctx1.envelope.error_message = "Connection timeout occurred"
-    assert middleware._is_retryable(ctx1) is True
 
-    ctx2 = PipelineContext(envelope=Envelope(path="/test", method="GET", status_code=200))
-    ctx2.envelope.error_message = "Invalid input"
-    assert middleware._is_retryable(ctx2) is False
+@pytest.mark.parametrize(
+    ("error_message", "expected"),
+    [("Connection timeout occurred", True), ("Invalid input", False), ("Connection refused", True)],
+)
+def test_retry_middleware_is_retryable_error_message(
+    message_middleware: RetryMiddleware, envelope_factory, error_message: str, expected: bool
+):
+    """Test _is_retryable method with error message."""
+    ctx = PipelineContext(envelope=envelope_factory(error_message=error_message))
 
-    ctx3 = PipelineContext(envelope=Envelope(path="/test", method="GET", status_code=200))
-    ctx3.envelope.error_message = "Connection refused"
-    assert middleware._is_retryable(ctx3) is True
+    assert message_middleware._is_retryable(ctx) is expected
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_retry_middleware_is_retryable_no_error():
     """Test _is_retryable method when no error."""
     middleware = RetryMiddleware(
@@ -386,7 +260,24 @@ async def test_retry_middleware_is_retryable_no_error():
         }
     )
 
-    ctx = PipelineContext(envelope=Envelope.success({"result": "ok"}))
+    ctx = PipelineContext(envelope=OK_ENVELOPE)
     assert middleware._is_retryable(ctx) is False
 
 
+@pytest.mark.parametrize(
+    ("retryable_errors", "error_message", "expected"),
+    [
+        (["(503)"], "Upstream failed (503)", True),
+        (["(503)"], "Upstream failed 503", False),
+        (["TIMEOUT"], "request timeout", True),
+        ([], "Connection timeout", False),
+    ],
+    ids=["metacharacters_literal", "metacharacters_no_match", "case_insensitive", "no_tokens"],
+)
+def test_retry_middleware_message_matching(envelope_factory, retryable_errors, error_message, expected):
+    """Test precompiled message matching treats tokens as literal, case-insensitive substrings."""
+    middleware = RetryMiddleware({"enabled": True, "retryable_errors": retryable_errors})
+
+    ctx = PipelineContext(envelope=envelope_factory(status_code=502, error_message=error_message))
+
+    assert middleware._is_retryable(ctx) is expected
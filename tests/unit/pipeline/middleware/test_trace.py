@@ -1,7 +1,5 @@
 """Unit tests for trace middleware."""
 
-from unittest.mock import patch
-
 import pytest
 
 from hexswitch.pipeline.middleware.trace import (
@@ -14,6 +12,16 @@ from hexswitch.pipeline.pipeline import PipelineContext
 from hexswitch.shared.envelope import Envelope
 
 
+@pytest.fixture
+def captured_warnings(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record messages passed to the trace middleware logger's warning()."""
+    messages: list[str] = []
+    monkeypatch.setattr(
+        "hexswitch.pipeline.middleware.trace.logger.warning", lambda msg, *args, **kwargs: messages.append(msg)
+    )
+    return messages
+
+
 @pytest.mark.fast
 class TestParseTraceparent:
     """Test parse_traceparent function."""
@@ -27,25 +35,32 @@ class TestParseTraceparent:
         assert span_id == "00f067aa0ba902b7"
         assert parent_span_id is None
 
-    def test_parse_traceparent_invalid_format(self):
+    @pytest.mark.parametrize(
+        "traceparent",
+        [
+            "invalid-format",
+            "00-4bf92f3577b34da6a3ce929d0e0e473-00f067aa0ba902b7-01",
+            "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902bz-01",
+            "00-4BF92F3577B34DA6A3CE929D0E0E4736-00f067aa0ba902b7-01",
+            "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01-extra",
+        ],
+        ids=["not_four_fields", "short_trace_id", "non_hex_span_id", "uppercase_hex", "trailing_field"],
+    )
+    def test_parse_traceparent_invalid_format(self, traceparent):
         """Test parsing invalid traceparent format."""
-        traceparent = "invalid-format"
-
         with pytest.raises(ValueError, match="Invalid traceparent format"):
             parse_traceparent(traceparent)
 
-    def test_parse_traceparent_wrong_version(self):
+    def test_parse_traceparent_wrong_version(self, captured_warnings):
         """Test parsing traceparent with unsupported version."""
         traceparent = "01-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
 
-        with patch("hexswitch.pipeline.middleware.trace.logger") as mock_logger:
-            trace_id, span_id, parent_span_id = parse_traceparent(traceparent)
+        trace_id, span_id, parent_span_id = parse_traceparent(traceparent)
 
-            assert trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
-            assert span_id == "00f067aa0ba902b7"
-            assert parent_span_id is None
-            mock_logger.warning.assert_called_once()
-            assert "Unsupported traceparent version" in str(mock_logger.warning.call_args)
+        assert trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert span_id == "00f067aa0ba902b7"
+        assert parent_span_id is None
+        assert captured_warnings == ["Unsupported traceparent version: 01"]
 
     def test_parse_traceparent_wrong_parts_count(self):
         """Test parsing traceparent with wrong number of parts."""
@@ -80,7 +95,7 @@ class TestFormatTraceparent:
         assert result == f"00-{trace_id}-{span_id}-01"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.fast
 class TestTraceExtractionMiddleware:
     """Test TraceExtractionMiddleware."""
@@ -103,7 +118,7 @@ class TestTraceExtractionMiddleware:
         assert result_ctx.envelope.span_id == "00f067aa0ba902b7"
         assert result_ctx.envelope.parent_span_id is None
 
-    async def test_extract_traceparent_invalid_handled_gracefully(self):
+    async def test_extract_traceparent_invalid_handled_gracefully(self, captured_warnings):
         """Test that invalid traceparent is handled gracefully."""
         middleware = TraceExtractionMiddleware()
         envelope = Envelope(
@@ -115,13 +130,12 @@ class TestTraceExtractionMiddleware:
         async def next_func(ctx: PipelineContext) -> PipelineContext:
             return ctx
 
-        with patch("hexswitch.pipeline.middleware.trace.logger") as mock_logger:
-            result_ctx = await middleware(ctx, next_func)
+        result_ctx = await middleware(ctx, next_func)
 
-            # Should continue without setting trace context
-            assert result_ctx.envelope.trace_id is None
-            mock_logger.warning.assert_called_once()
-            assert "Failed to parse traceparent header" in str(mock_logger.warning.call_args)
+        # Should continue without setting trace context
+        assert result_ctx.envelope.trace_id is None
+        assert len(captured_warnings) == 1
+        assert captured_warnings[0].startswith("Failed to parse traceparent header")
 
     async def test_extract_trace_from_metadata(self):
         """Test extracting trace context from metadata."""
@@ -180,7 +194,7 @@ class TestTraceExtractionMiddleware:
         assert result_ctx.envelope.span_id == "00f067aa0ba902b7"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.fast
 class TestTraceInjectionMiddleware:
     """Test TraceInjectionMiddleware."""
@@ -1,6 +1,6 @@
 """Unit tests for Pipeline."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
 
 import pytest
 
@@ -9,16 +9,12 @@ from hexswitch.shared.envelope import Envelope
 
 
 @pytest.mark.asyncio
-async def test_pipeline_processes_envelope():
+async def test_pipeline_processes_envelope(mock_runtime_factory, counting_handler):
     """Test pipeline processes envelope through all stages."""
-    # Create mock runtime
-    mock_runtime = MagicMock()
-    mock_handler = AsyncMock(return_value=Envelope.success({"result": "ok"}))
-    mock_runtime.handler_loader.resolve.return_value = mock_handler
-    mock_runtime.config = {"ports": {}}
+    mock_handler = counting_handler(Envelope.success({"result": "ok"}))
 
     # Create pipeline
-    pipeline = Pipeline(mock_runtime)
+    pipeline = Pipeline(mock_runtime_factory(handler=mock_handler))
 
     # Create input envelope
     input_envelope = Envelope(
@@ -33,20 +29,18 @@ async def test_pipeline_processes_envelope():
     # Verify handler was called
     assert output_envelope is not None
     assert output_envelope.data == {"result": "ok"}
-    mock_handler.assert_called_once()
+    assert len(mock_handler.calls) == 1
 
 
 @pytest.mark.asyncio
-async def test_pipeline_error_handling():
+async def test_pipeline_error_handling(mock_runtime_factory):
     """Test pipeline error handling."""
-    # Create mock runtime
-    mock_runtime = MagicMock()
-    mock_handler = AsyncMock(side_effect=Exception("Handler error"))
-    mock_runtime.handler_loader.resolve.return_value = mock_handler
-    mock_runtime.config = {"ports": {}}
+
+    async def mock_handler(envelope: Envelope) -> Envelope:
+        raise Exception("Handler error")
 
     # Create pipeline
-    pipeline = Pipeline(mock_runtime)
+    pipeline = Pipeline(mock_runtime_factory(handler=mock_handler))
 
     # Create input envelope
     input_envelope = Envelope(
@@ -65,14 +59,10 @@ async def test_pipeline_error_handling():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_no_port_name():
+async def test_pipeline_no_port_name(mock_runtime_factory):
     """Test pipeline handles missing port_name."""
-    # Create mock runtime
-    mock_runtime = MagicMock()
-    mock_runtime.config = {"ports": {}}
-
     # Create pipeline
-    pipeline = Pipeline(mock_runtime)
+    pipeline = Pipeline(mock_runtime_factory())
 
     # Create input envelope without port_name
     input_envelope = Envelope(path="/test", method="GET")
@@ -87,24 +77,22 @@ async def test_pipeline_no_port_name():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_concurrency_gates():
-    """Test pipeline concurrency gates."""
-    # Create mock runtime
-    mock_runtime = MagicMock()
-    call_count = 0
-
-    async def slow_handler(envelope: Envelope) -> Envelope:
-        nonlocal call_count
-        call_count += 1
-        import asyncio
-        await asyncio.sleep(0.1)
-        return Envelope.success({"count": call_count})
-
-    mock_runtime.handler_loader.resolve.return_value = slow_handler
-    mock_runtime.config = {"ports": {"test_port": {"max_concurrent": 2}}}
+async def test_pipeline_concurrency_gates(mock_runtime_factory):
+    """Test pipeline concurrency gates limit simultaneous handler executions."""
+    in_flight = 0
+    peak = 0
+
+    async def gated_handler(envelope: Envelope) -> Envelope:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Yield so other requests get a chance to enter the gate
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return Envelope.success({"peak": peak})
 
     # Create pipeline
-    pipeline = Pipeline(mock_runtime)
+    pipeline = Pipeline(mock_runtime_factory(handler=gated_handler, ports={"test_port": {"max_concurrent": 2}}))
 
     # Create input envelope
     input_envelope = Envelope(
@@ -114,30 +102,22 @@ async def test_pipeline_concurrency_gates():
     )
 
     # Process multiple envelopes concurrently
-    import asyncio
-
-    tasks = [pipeline.process(input_envelope) for _ in range(5)]
-    results = await asyncio.gather(*tasks)
+    results = await asyncio.gather(*(pipeline.process(input_envelope) for _ in range(5)))
 
     # Verify all envelopes were processed
     assert len(results) == 5
-    assert all(isinstance(r, Envelope) for r in results)
+    assert all(isinstance(r, Envelope) and r.error_message is None for r in results)
 
-    # Verify semaphore was created
+    # Verify the gate let exactly max_concurrent handlers run at once
     assert "test_port" in pipeline._concurrency_gates
+    assert peak == 2
 
 
 @pytest.mark.asyncio
-async def test_pipeline_middleware_stack():
+async def test_pipeline_middleware_stack(mock_runtime_factory):
     """Test pipeline middleware stack execution."""
-    # Create mock runtime
-    mock_runtime = MagicMock()
-    mock_handler = AsyncMock(return_value=Envelope.success({"result": "ok"}))
-    mock_runtime.handler_loader.resolve.return_value = mock_handler
-    mock_runtime.config = {"ports": {}}
-
     # Create pipeline
-    pipeline = Pipeline(mock_runtime)
+    pipeline = Pipeline(mock_runtime_factory())
 
     # Add middleware
     middleware_calls = []
@@ -164,3 +144,86 @@ async def test_pipeline_middleware_stack():
     assert "before" in middleware_calls
     assert "after" in middleware_calls
 
+
+@pytest.mark.asyncio
+async def test_pipeline_composes_middleware_chain_once(mock_runtime_factory):
+    """Test the middleware chain is built when the stack changes, not per request."""
+    pipeline = Pipeline(mock_runtime_factory())
+    calls = []
+
+    def make_middleware(name: str):
+        async def middleware(ctx: PipelineContext, next_func):
+            calls.append(name)
+            return await next_func(ctx)
+
+        return middleware
+
+    for name in ("outer", "middle", "inner"):
+        pipeline.add_middleware(make_middleware(name))
+    chain = pipeline._chain
+
+    input_envelope = Envelope(path="/test", method="GET", metadata={"port_name": "test_port"})
+    await pipeline.process(input_envelope)
+    await pipeline.process(input_envelope)
+
+    # Processing reuses the prebuilt chain and keeps the registration order
+    assert pipeline._chain is chain
+    assert calls == ["outer", "middle", "inner"] * 2
+
+    # Assigning a new stack rebuilds the chain
+    pipeline.middleware_stack = pipeline.middleware_stack[:1]
+    calls.clear()
+    await pipeline.process(input_envelope)
+
+    assert pipeline._chain is not chain
+    assert calls == ["outer"]
+
+
+def test_pipeline_middleware_stack_is_read_only(mock_runtime_factory):
+    """Test the stack is exposed as a tuple so changes go through the pipeline."""
+    pipeline = Pipeline(mock_runtime_factory())
+
+    async def middleware(ctx: PipelineContext, next_func):
+        return await next_func(ctx)
+
+    pipeline.add_middleware(middleware)
+
+    assert pipeline.middleware_stack == (middleware,)
+    with pytest.raises(AttributeError):
+        pipeline.middleware_stack.append(middleware)  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_port_middleware_chain_composed_once(mock_runtime_factory):
+    """Test port middleware runs inside the shared stack from a cached chain."""
+    pipeline = Pipeline(mock_runtime_factory())
+    calls = []
+
+    def make_middleware(name: str):
+        async def middleware(ctx: PipelineContext, next_func):
+            calls.append(name)
+            return await next_func(ctx)
+
+        return middleware
+
+    pipeline.add_middleware(make_middleware("shared"))
+    pipeline.set_port_middleware("test_port", [make_middleware("port")])
+    port_chain = pipeline._port_chains["test_port"]
+
+    await pipeline.process(Envelope(path="/test", method="GET", metadata={"port_name": "test_port"}))
+    await pipeline.process(Envelope(path="/test", method="GET", metadata={"port_name": "other_port"}))
+
+    assert pipeline._port_chains["test_port"] is port_chain
+    assert calls == ["shared", "port", "shared"]
+
+    # Changing the shared stack rebuilds the port chain around it
+    pipeline.add_middleware(make_middleware("added"))
+    calls.clear()
+    await pipeline.process(Envelope(path="/test", method="GET", metadata={"port_name": "test_port"}))
+
+    assert pipeline._port_chains["test_port"] is not port_chain
+    assert calls == ["shared", "added", "port"]
+
+    # A new policy drops the middleware built from the old one
+    pipeline.set_port_policy("test_port", {})
+    assert pipeline.get_port_middleware("test_port") is None
@@ -1,11 +1,16 @@
 """Unit tests for OutboundPortRegistry."""
 
+import sys
 import threading
 import time
 
 from hexswitch.ports.outbound_registry import OutboundPortRegistry
 from hexswitch.shared.envelope import Envelope
 
+# Thread-safety tests repeat operations on a few names to maximize contention
+PORT_COUNT = 10
+ITERATIONS = 100
+
 
 def test_outbound_port_registry_stores_ports():
     """Test outbound port registry storage."""
@@ -93,19 +98,21 @@ def test_outbound_port_registry_thread_safety():
     results = []
 
     def register_ports():
-        for i in range(10):
-            def factory(i=i) -> Envelope:  # noqa: B023
-                return Envelope(path=f"/api/{i}")
+        for i in range(ITERATIONS):
+            index = i % PORT_COUNT
+
+            def factory(index=index) -> Envelope:
+                return Envelope(path=f"/api/{index}")
 
-            registry.register_port(f"port_{i}", factory)
-            time.sleep(0.001)
+            registry.register_port(f"port_{index}", factory)
+            time.sleep(0)  # Yield to other threads to increase chance of race conditions
 
     def read_ports():
-        for i in range(10):
-            port = registry.get_port(f"port_{i}")
+        for i in range(ITERATIONS):
+            port = registry.get_port(f"port_{i % PORT_COUNT}")
             if port:
                 results.append(port.name)
-            time.sleep(0.001)
+            time.sleep(0)
 
     # Create multiple threads
     threads = []
@@ -124,7 +131,17 @@ def test_outbound_port_registry_thread_safety():
         t.join()
 
     # Verify no errors occurred (thread-safety)
-    assert len(registry.list_ports()) == 10
+    assert len(registry.list_ports()) == PORT_COUNT
+
+
+def test_outbound_port_registry_reads_do_not_take_lock():
+    """Test that lookups complete while a writer holds the registry lock."""
+    registry = OutboundPortRegistry()
+    registry.register_port("order_port", lambda: Envelope(path="/api/orders"))
+
+    with registry._lock:
+        assert registry.get_port("order_port").name == "order_port"
+        assert registry.list_ports() == ["order_port"]
 
 
 def test_outbound_port_registry_overwrite_warning():
@@ -144,3 +161,12 @@ def test_outbound_port_registry_overwrite_warning():
     port = registry.get_port("test_port")
     assert port.factory == factory2
 
+
+def test_outbound_port_registry_interns_port_names():
+    """Test that registered port names are stored as interned strings."""
+    registry = OutboundPortRegistry()
+    port_name = "".join(["order", "_port"])
+
+    registry.register_port(port_name, lambda: Envelope(path="/api/orders"))
+
+    assert registry.list_ports()[0] is sys.intern("order_port")
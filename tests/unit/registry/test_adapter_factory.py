@@ -1,9 +1,11 @@
 """Unit tests for AdapterFactory."""
 
+import importlib
+
 import pytest
 
 from hexswitch.adapters.exceptions import AdapterError
-from hexswitch.registry.factory import AdapterFactory
+from hexswitch.registry.factory import AdapterFactory, _resolve_adapter_class
 
 
 def test_adapter_factory_creates_adapter():
@@ -111,3 +113,29 @@ def test_adapter_factory_name_inference():
     assert adapter.name is not None
     assert len(adapter.name) > 0
 
+
+def test_adapter_factory_caches_resolved_classes(monkeypatch: pytest.MonkeyPatch):
+    """Test that adapter classes are imported once per path and failures are retried."""
+    import_calls = []
+    real_import_module = importlib.import_module
+
+    def counting_import_module(name: str):
+        import_calls.append(name)
+        return real_import_module(name)
+
+    monkeypatch.setattr("hexswitch.registry.factory.importlib.import_module", counting_import_module)
+    _resolve_adapter_class.cache_clear()
+
+    impl_path = "hexswitch.adapters.http:HttpAdapterClient"
+    first = AdapterFactory.create(impl_path, {"name": "a", "base_url": "https://api.example.com"})
+    second = AdapterFactory.create(impl_path, {"name": "b", "base_url": "https://api.example.com"})
+
+    assert type(first) is type(second)
+    assert first is not second
+    assert import_calls == ["hexswitch.adapters.http"]
+
+    # Failed lookups raise every time instead of caching a result
+    for _ in range(2):
+        with pytest.raises(AdapterError, match="does not have class"):
+            AdapterFactory.create("hexswitch.adapters.http:NonExistentClass", {})
+    assert import_calls.count("hexswitch.adapters.http") == 3
@@ -6,6 +6,10 @@ import time
 from hexswitch.adapters.base import InboundAdapter, OutboundAdapter
 from hexswitch.registry.adapters import ADAPTER_METADATA, AdapterRegistry
 
+# Thread-safety tests repeat operations on a few names to maximize contention
+ADAPTER_COUNT = 10
+ITERATIONS = 100
+
 
 class MockInboundAdapter(InboundAdapter):
     """Mock inbound adapter for testing."""
@@ -114,6 +118,52 @@ def test_adapter_registry_list_outbound():
     assert "http" not in outbound_list
 
 
+def test_adapter_registry_reregister_updates_direction():
+    """Test re-registering an adapter moves it to its new direction lists."""
+    registry = AdapterRegistry()
+
+    registry.register("grpc", MockInboundAdapter("grpc", {}), {"direction": "both"})
+    registry.register("grpc", MockOutboundAdapter("grpc", {}), {"direction": "outbound"})
+
+    assert registry.list_inbound() == []
+    assert registry.list_outbound() == ["grpc"]
+
+    registry.remove("grpc")
+
+    assert registry.list_outbound() == []
+
+
+def test_adapter_registry_direction_lists_are_prebuilt():
+    """Test the direction lists come from the snapshot, not a metadata scan."""
+    registry = AdapterRegistry()
+    registry.register("http", MockInboundAdapter("http", {}), {"direction": "inbound"})
+    registry.register("http_client", MockOutboundAdapter("http_client", {}), {"direction": "outbound"})
+    registry.register("grpc", MockInboundAdapter("grpc", {}), {"direction": "both"})
+
+    assert registry._snapshot.inbound == ("http", "grpc")
+    assert registry._snapshot.outbound == ("http_client", "grpc")
+    # Callers get their own list to modify
+    registry.list_inbound().clear()
+    assert registry.list_inbound() == ["http", "grpc"]
+
+
+def test_adapter_registry_reads_use_published_snapshot():
+    """Test lookups skip the writer lock and writers publish a new snapshot."""
+    registry = AdapterRegistry()
+    registry.register("http", MockInboundAdapter("http", {}), {"direction": "inbound"})
+    snapshot = registry._snapshot
+
+    with registry._lock:
+        assert registry.get("http") is not None
+        assert registry.list_inbound() == ["http"]
+
+    registry.register("grpc", MockInboundAdapter("grpc", {}), {"direction": "both"})
+
+    # The earlier snapshot is left untouched for readers still holding it
+    assert list(snapshot.adapters) == ["http"]
+    assert registry.list_all() == ["http", "grpc"]
+
+
 def test_adapter_registry_list_all():
     """Test listing all adapters."""
     registry = AdapterRegistry()
@@ -174,17 +224,18 @@ def test_adapter_registry_thread_safety():
     results = []
 
     def register_adapters():
-        for i in range(10):
-            adapter = MockInboundAdapter(f"adapter_{i}", {})
-            registry.register(f"adapter_{i}", adapter, {"direction": "inbound", "index": i})
-            time.sleep(0.001)  # Small delay to increase chance of race conditions
+        for i in range(ITERATIONS):
+            index = i % ADAPTER_COUNT
+            adapter = MockInboundAdapter(f"adapter_{index}", {})
+            registry.register(f"adapter_{index}", adapter, {"direction": "inbound", "index": index})
+            time.sleep(0)  # Yield to other threads to increase chance of race conditions
 
     def read_adapters():
-        for i in range(10):
-            adapter = registry.get(f"adapter_{i}")
+        for i in range(ITERATIONS):
+            adapter = registry.get(f"adapter_{i % ADAPTER_COUNT}")
             if adapter:
                 results.append(adapter.name)
-            time.sleep(0.001)
+            time.sleep(0)
 
     # Create multiple threads
     threads = []
@@ -204,7 +255,7 @@ def test_adapter_registry_thread_safety():
 
     # Verify no errors occurred (thread-safety)
     # All adapters should be registered
-    assert len(registry.list_all()) == 10
+    assert len(registry.list_all()) == ADAPTER_COUNT
 
 
 def test_adapter_registry_get_nonexistent():
@@ -1,5 +1,9 @@
 """Unit tests for OutboundRouteRegistry."""
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
 import pytest
 
 from hexswitch.routing.routes import OutboundRouteRegistry, OutboundTarget
@@ -136,3 +140,29 @@ def test_outbound_target_valid_strategies():
     assert target2.load_balancing == "round_robin"
     assert target3.load_balancing == "failover"
 
+
+def test_outbound_target_uses_slots():
+    """Test that OutboundTarget instances carry no per-instance __dict__."""
+    target = OutboundTarget(adapter_name="adapter1", config={})
+
+    assert not hasattr(target, "__dict__")
+    with pytest.raises(AttributeError):
+        target.unknown_field = "value"
+
+
+def test_outbound_route_registry_round_robin_is_fair_across_threads():
+    """Test concurrent round-robin selection hands out every target equally often."""
+    registry = OutboundRouteRegistry()
+    targets = [OutboundTarget(adapter_name=f"adapter{i}", config={}, load_balancing="round_robin") for i in range(4)]
+    registry.register_route("round_robin_port", targets)
+    envelope = Envelope(path="/test")
+    barrier = threading.Barrier(8)
+
+    def select_many() -> list[str]:
+        barrier.wait(timeout=5.0)
+        return [registry.select_target("round_robin_port", envelope).adapter_name for _ in range(100)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        selections = [name for names in pool.map(lambda _: select_many(), range(8)) for name in names]
+
+    assert Counter(selections) == {f"adapter{i}": 200 for i in range(4)}
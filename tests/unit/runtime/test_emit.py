@@ -1,12 +1,30 @@
 """Unit tests for Runtime.emit() and Runtime.deliver()."""
 
-from unittest.mock import MagicMock
-
 from hexswitch.adapters.base import OutboundAdapter
 from hexswitch.runtime import Runtime
 from hexswitch.shared.envelope import Envelope
 
 
+class _StubOutbound(OutboundAdapter):
+    """Outbound adapter stand-in that records requests and returns a fixed response."""
+
+    def __init__(self, response: Envelope | None = None, name: str = "http_client") -> None:
+        self.name = name
+        self.config = {}
+        self.calls: list[Envelope] = []
+        self._response = response
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def request(self, envelope: Envelope) -> Envelope | None:
+        self.calls.append(envelope)
+        return self._response
+
+
 def test_runtime_emit_calls_adapter():
     """Test that runtime.emit() calls correct adapter."""
     config = {
@@ -15,14 +33,12 @@ def test_runtime_emit_calls_adapter():
 
     runtime = Runtime(config)
 
-    # Create mock adapter that implements OutboundAdapter
-    mock_adapter = MagicMock(spec=OutboundAdapter)
-    mock_adapter.name = "http_client"
+    # Create stub adapter that implements OutboundAdapter
     mock_response = Envelope.success({"response": "data"})
-    mock_adapter.request.return_value = mock_response
+    mock_adapter = _StubOutbound(mock_response)
 
-    # Register adapter - need to add to outbound_adapters list
-    runtime.outbound_adapters.append(mock_adapter)
+    # Register adapter
+    runtime.add_outbound_adapter(mock_adapter)
 
     # Register outbound port factory
     def factory(order_id: str) -> Envelope:
@@ -43,9 +59,8 @@ def test_runtime_emit_calls_adapter():
 
     # Verify adapter was called
     assert response == mock_response
-    mock_adapter.request.assert_called_once()
-    call_envelope = mock_adapter.request.call_args[0][0]
-    assert call_envelope.body == {"id": "order-123"}
+    assert len(mock_adapter.calls) == 1
+    assert mock_adapter.calls[0].body == {"id": "order-123"}
 
 
 def test_runtime_emit_port_not_found():
@@ -91,12 +106,11 @@ def test_runtime_deliver_fire_and_forget():
 
     runtime = Runtime(config)
 
-    # Create mock adapter that implements OutboundAdapter
-    mock_adapter = MagicMock(spec=OutboundAdapter)
-    mock_adapter.name = "http_client"
+    # Create stub adapter that implements OutboundAdapter
+    mock_adapter = _StubOutbound()
 
-    # Register adapter - need to add to outbound_adapters list
-    runtime.outbound_adapters.append(mock_adapter)
+    # Register adapter
+    runtime.add_outbound_adapter(mock_adapter)
 
     # Register route
     from hexswitch.routing.routes import OutboundTarget
@@ -116,7 +130,8 @@ def test_runtime_deliver_fire_and_forget():
     runtime.deliver(envelope, "http_client")
 
     # Verify adapter was called
-    mock_adapter.request.assert_called_once_with(envelope)
+    assert len(mock_adapter.calls) == 1
+    assert mock_adapter.calls[0] is envelope
 
 
 def test_runtime_deliver_no_port_metadata():
@@ -1,5 +1,6 @@
 """Tests for outbound port binding in Runtime."""
 
+import pytest
 
 from hexswitch.ports import get_port_registry, reset_port_registry
 from hexswitch.runtime import Runtime
@@ -8,8 +9,15 @@ from hexswitch.runtime import Runtime
 class TestRuntimeOutboundPortBinding:
     """Test that Runtime binds outbound adapters to ports."""
 
-    def setup_method(self):
-        """Reset registry before each test."""
+    @pytest.fixture(autouse=True)
+    def _isolated_port_registry(self):
+        """Reset the global port registry before and after each test.
+
+        Runtime binds adapters into the process-wide registry, so ports must
+        not leak into other tests running on the same worker.
+        """
+        reset_port_registry()
+        yield
         reset_port_registry()
 
     def test_runtime_binds_outbound_adapter_to_port(self) -> None:
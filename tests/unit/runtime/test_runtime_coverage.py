@@ -32,7 +32,7 @@ class TestRuntimeDeliver:
         # Add a mock that is not an OutboundAdapter
         mock_adapter = MagicMock()
         mock_adapter.name = "invalid_adapter"
-        runtime.outbound_adapters.append(mock_adapter)
+        runtime.add_outbound_adapter(mock_adapter)
 
         envelope = Envelope(path="/test", method="POST")
         with pytest.raises(ValueError, match="not an OutboundAdapter"):
@@ -46,7 +46,7 @@ class TestRuntimeDeliver:
         mock_adapter = MagicMock(spec=OutboundAdapter)
         mock_adapter.name = "http_client"
         mock_adapter.request.side_effect = Exception("Connection failed")
-        runtime.outbound_adapters.append(mock_adapter)
+        runtime.add_outbound_adapter(mock_adapter)
 
         envelope = Envelope(path="/test", method="POST")
         response = runtime.deliver(envelope, "http_client")
@@ -54,6 +54,78 @@ class TestRuntimeDeliver:
         assert response.status_code == 500
         assert "Failed to deliver" in response.error_message
 
+    def test_deliver_uses_first_adapter_with_name(self) -> None:
+        """Test deliver() routes to the first adapter added under a name."""
+        config = {"service": {"name": "test-service"}}
+        runtime = Runtime(config)
+
+        first = MagicMock(spec=OutboundAdapter)
+        first.name = "http_client"
+        second = MagicMock(spec=OutboundAdapter)
+        second.name = "http_client"
+        runtime.add_outbound_adapter(first)
+        runtime.add_outbound_adapter(second)
+
+        envelope = Envelope(path="/test", method="POST")
+        runtime.deliver(envelope, "http_client")
+
+        assert runtime.outbound_adapters == [first, second]
+        first.request.assert_called_once_with(envelope)
+        second.request.assert_not_called()
+
+    def test_deliver_sees_adapters_changed_outside_add(self) -> None:
+        """Test deliver() finds adapters assigned or appended to the public list directly."""
+        config = {"service": {"name": "test-service"}}
+        runtime = Runtime(config)
+        original = MagicMock(spec=OutboundAdapter)
+        original.name = "http_client"
+        runtime.add_outbound_adapter(original)
+
+        replacement = MagicMock(spec=OutboundAdapter)
+        replacement.name = "http_client"
+        runtime.outbound_adapters = [replacement]
+        appended = MagicMock(spec=OutboundAdapter)
+        appended.name = "grpc_client"
+        runtime.outbound_adapters.append(appended)
+
+        envelope = Envelope(path="/test", method="POST")
+        runtime.deliver(envelope, "http_client")
+        runtime.deliver(envelope, "grpc_client")
+
+        original.request.assert_not_called()
+        replacement.request.assert_called_once_with(envelope)
+        appended.request.assert_called_once_with(envelope)
+
+        runtime.outbound_adapters.clear()
+        assert runtime.deliver(envelope, "http_client").status_code == 404
+
+    def test_deliver_sees_same_name_adapter_swapped_in_place(self) -> None:
+        """Test deliver() routes to an adapter that replaced another in the list under the same name."""
+        config = {"service": {"name": "test-service"}}
+        runtime = Runtime(config)
+        original = MagicMock(spec=OutboundAdapter)
+        original.name = "http_client"
+        runtime.add_outbound_adapter(original)
+        envelope = Envelope(path="/test", method="POST")
+
+        swapped = MagicMock(spec=OutboundAdapter)
+        swapped.name = "http_client"
+        runtime.outbound_adapters[0] = swapped
+        runtime.deliver(envelope, "http_client")
+
+        # Clearing and appending the same number of adapters is not seen by a length check either
+        renamed = MagicMock(spec=OutboundAdapter)
+        renamed.name = "grpc_client"
+        runtime.outbound_adapters.clear()
+        runtime.outbound_adapters.append(renamed)
+
+        assert runtime.deliver(envelope, "http_client").status_code == 404
+        runtime.deliver(envelope, "grpc_client")
+
+        original.request.assert_not_called()
+        swapped.request.assert_called_once_with(envelope)
+        renamed.request.assert_called_once_with(envelope)
+
 
 class TestRuntimeDispatch:
     """Test Runtime.dispatch() with port policies."""
@@ -149,6 +221,34 @@ class TestRuntimeDispatch:
             assert result.status_code == 200
             mock_process.assert_called_once_with(envelope)
 
+    @pytest.mark.asyncio
+    async def test_dispatch_builds_port_middleware_once(self) -> None:
+        """Test dispatch() reuses the port's middleware across requests."""
+        config = {
+            "service": {"name": "test-service"},
+            "ports": {
+                "test_port": {
+                    "policies": {
+                        "backpressure": {"enabled": True, "max_concurrent": 10},
+                        "timeout": {"seconds": 5},
+                    }
+                }
+            }
+        }
+        runtime = Runtime(config)
+
+        envelope = Envelope(path="/test", method="GET", metadata={"port_name": "test_port"})
+
+        with patch.object(runtime.pipeline, "process") as mock_process:
+            mock_process.return_value = Envelope.success({"result": "ok"})
+            await runtime.dispatch(envelope)
+            middleware = runtime.pipeline.get_port_middleware("test_port")
+            await runtime.dispatch(envelope)
+
+        assert [type(m).__name__ for m in middleware] == ["BackpressureMiddleware", "TimeoutMiddleware"]
+        assert runtime.pipeline.get_port_middleware("test_port") is middleware
+        assert len(runtime.pipeline.middleware_stack) == 3
+
 
 class TestRuntimePortPolicies:
     """Test Runtime._load_port_policies()."""
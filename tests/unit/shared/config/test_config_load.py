@@ -1,7 +1,6 @@
 """Unit tests for config loading functions."""
 
 from pathlib import Path
-import tempfile
 
 import pytest
 import tomli_w
@@ -12,50 +11,40 @@ from hexswitch.shared.config.config import ConfigError, load_config
 class TestLoadConfig:
     """Test load_config function."""
 
-    def test_load_config_from_file(self) -> None:
+    def test_load_config_from_file(self, tmp_path: Path) -> None:
         """Test loading config from file."""
         config_data = {
-            "service": {"name": "test-service"},
+            "service": {"name": "test-service", "runtime": "python"},
+            "inbound": {"http": {"enabled": True}},
         }
 
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-            f.write(tomli_w.dumps(config_data).encode("utf-8"))
-            config_path = f.name
+        config_path = tmp_path / "hex-config.toml"
+        config_path.write_bytes(tomli_w.dumps(config_data).encode("utf-8"))
 
-        try:
-            config = load_config(config_path)
-            assert config["service"]["name"] == "test-service"
-        finally:
-            Path(config_path).unlink()
+        config = load_config(config_path)
+        assert config["service"]["name"] == "test-service"
+        assert config["inbound"]["http"]["enabled"] is True
 
     def test_load_config_file_not_found(self) -> None:
         """Test loading config from non-existent file."""
-        with pytest.raises(ConfigError, match="not found"):
+        with pytest.raises(ConfigError, match="Configuration file not found"):
             load_config("/nonexistent/path/config.toml")
 
-    def test_load_config_invalid_toml(self) -> None:
-        """Test loading config with invalid TOML."""
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-            f.write(b"invalid toml content [")
-            config_path = f.name
-
-        try:
-            with pytest.raises(ConfigError, match="Invalid TOML"):
-                load_config(config_path)
-        finally:
-            Path(config_path).unlink()
-
-    def test_load_config_empty_file(self) -> None:
-        """Test loading empty config file."""
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".toml", delete=False) as f:
-            f.write(b"")
-            config_path = f.name
-
-        try:
-            with pytest.raises(ConfigError, match="empty"):
-                load_config(config_path)
-        finally:
-            Path(config_path).unlink()
+    @pytest.mark.parametrize(
+        ("content", "match"),
+        [
+            (b"invalid toml content [", "Invalid TOML"),
+            (b"", "Configuration file is empty"),
+        ],
+        ids=["invalid_toml", "empty_file"],
+    )
+    def test_load_config_invalid_content(self, tmp_path: Path, content: bytes, match: str) -> None:
+        """Test loading config with invalid TOML or an empty file."""
+        config_path = tmp_path / "hex-config.toml"
+        config_path.write_bytes(content)
+
+        with pytest.raises(ConfigError, match=match):
+            load_config(config_path)
 
     def test_load_config_not_dict(self) -> None:
         """Test loading config that is not a dictionary."""
@@ -64,10 +53,9 @@ class TestLoadConfig:
         # Empty file is already tested above
         pass
 
-    def test_load_config_file_read_error(self) -> None:
+    def test_load_config_file_read_error(self, tmp_path: Path) -> None:
         """Test loading config with file read error."""
-        # Create a path that exists but is a directory (will cause read error)
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(ConfigError, match="Error reading"):
-                load_config(tmpdir)
+        # A path that exists but is a directory causes a read error
+        with pytest.raises(ConfigError, match="Error reading"):
+            load_config(tmp_path)
 
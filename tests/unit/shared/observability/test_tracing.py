@@ -56,6 +56,20 @@ class TestTracing:
         # May be None if not in context
         span.finish()
 
+    def test_start_span_is_current_until_finished(self) -> None:
+        """Test that start_span() makes the span current and finish() restores the previous one."""
+        before = get_current_span()
+        outer = start_span("outer_span")
+        inner = start_span("inner_span", parent=outer)
+
+        assert get_current_span().span_id == inner.span_id
+        inner.finish()
+        assert get_current_span().span_id == outer.span_id
+        outer.finish()
+
+        after = get_current_span()
+        assert (after.span_id if after else None) == (before.span_id if before else None)
+
     def test_span_context_manager(self) -> None:
         """Test span as context manager."""
         span = start_span("test_span")
@@ -138,6 +138,7 @@ class TestEnvelope:
         envelope.start_span("test_span")
         span = envelope.get_span()
         assert span is not None
+        span.finish()
 
     def test_envelope_default_values(self) -> None:
         """Test envelope default values."""
@@ -1,5 +1,6 @@
 """Tests for Envelope class."""
 
+import pytest
 
 from hexswitch.shared.envelope import Envelope
 
@@ -106,3 +107,10 @@ class TestEnvelope:
         assert envelope.metadata["cookies"] == {"session": "abc"}
         assert envelope.metadata["trace_id"] == "trace_123"
 
+    def test_envelope_uses_slots(self) -> None:
+        """Test that Envelope instances carry no per-instance __dict__."""
+        envelope = Envelope(path="/test")
+
+        assert not hasattr(envelope, "__dict__")
+        with pytest.raises(AttributeError):
+            envelope.unknown_field = "value"
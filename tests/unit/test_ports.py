@@ -33,6 +33,42 @@ class TestPort:
         with pytest.raises(NoHandlersError):
             p.route(Envelope(path="/test"))
 
+    def test_port_route_uses_handler_snapshot(self):
+        """Test routing passes the immutable handler snapshot to the strategy."""
+        def handler(e): return Envelope.success({"handler": 1})
+
+        p = Port(name="test", handlers=[handler])
+        received = []
+        p.routing_strategy.route = lambda envelope, handlers: received.append(handlers) or []
+
+        p.route(Envelope(path="/test"))
+
+        assert received == [(handler,)]
+
+    def test_port_handlers_are_read_only(self):
+        """Test handlers are exposed as a tuple that only the port's methods change."""
+        def handler(e): return e
+
+        p = Port(name="test", handlers=[handler])
+
+        assert p.handlers == (handler,)
+        with pytest.raises(AttributeError):
+            p.handlers = []  # type: ignore[misc]
+        p.set_handlers([handler, handler])
+        assert p.handlers == (handler, handler)
+
+    def test_port_clear_handlers(self):
+        """Test clearing handlers also clears the routing snapshot."""
+        def handler(e): return e
+
+        p = Port(name="test")
+        p.add_handler(handler)
+        p.clear_handlers()
+
+        assert len(p.handlers) == 0
+        with pytest.raises(NoHandlersError):
+            p.route(Envelope(path="/test"))
+
 
 class TestFirstStrategy:
     """Test FirstStrategy routing."""